@@ -0,0 +1,16 @@
+"""Progress events emitted by agent nodes for streaming clients."""
+
+from typing import Any
+
+from langchain_core.callbacks import adispatch_custom_event
+
+
+async def emit(name: str, data: Any) -> None:
+    """Dispatch a custom event to ``astream_events`` listeners.
+
+    A no-op when the node runs outside a LangGraph run (e.g. called directly).
+    """
+    try:
+        await adispatch_custom_event(name, data)
+    except RuntimeError:
+        pass
@@ -0,0 +1,253 @@
+"""Shared gateway for every LLM call the agents make.
+
+One chat model is built per process and reused, so its HTTP connections
+are too. Calls wait on a global semaphore and a per-action one (scoring
+batches can't starve cover-letter generation), overload and rate-limit
+errors are retried with jittered exponential backoff, and latency and
+token usage are recorded per action.
+
+``LLM_FAKE=true`` (or ``llm_gateway.use(model)``) swaps in a local model,
+for benchmarks and for running workflows offline.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import statistics
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import anthropic
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+logger = logging.getLogger(__name__)
+
+LLM_MODEL = os.getenv("LLM_MODEL", "claude-sonnet-4-20250514")
+LLM_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS", "2000"))
+LLM_FAKE = os.getenv("LLM_FAKE", "false").lower() == "true"
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_RETRY_BACKOFF = float(os.getenv("LLM_RETRY_BACKOFF", "1.0"))
+LLM_RETRY_MAX_S = float(os.getenv("LLM_RETRY_MAX_S", "30"))
+
+# Max concurrent calls per action; unlisted actions share the global limit only
+ACTION_LIMITS = {
+    "scoring": int(os.getenv("LLM_CONCURRENCY_SCORING", "6")),
+    "tailor": int(os.getenv("LLM_CONCURRENCY_TAILOR", "2")),
+}
+
+# 408 timeout, 429 rate limit, 5xx server errors, 529 overloaded
+_RETRY_STATUSES = {408, 429, 500, 502, 503, 504, 529}
+_LATENCY_WINDOW = 500
+
+
+class LLMOverloadedError(Exception):
+    """Raised by the fake model to stand in for an API overload."""
+
+
+def _retryable(error: BaseException) -> bool:
+    if isinstance(error, (LLMOverloadedError, anthropic.APIConnectionError)):
+        return True
+    return isinstance(error, anthropic.APIStatusError) and error.status_code in _RETRY_STATUSES
+
+
+class FakeChatModel(BaseChatModel):
+    """A local chat model that answers scoring and tailoring prompts.
+
+    Sleeps for ``latency``, fails a ``failure_rate`` share of calls with
+    ``LLMOverloadedError``, and reports token usage, so concurrency, retry
+    and metrics behaviour can be checked without an API key.
+    """
+
+    latency: float = 0.5
+    failure_rate: float = 0.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _respond(self, messages: list[BaseMessage]) -> ChatResult:
+        if random.random() < self.failure_rate:
+            raise LLMOverloadedError("overloaded")
+        prompt = messages[-1].content
+        ids = re.findall(r"^\[([^\]]+)\]", prompt, re.MULTILINE)
+        if ids:
+            # Answer in reverse order to prove results are merged by id, not position
+            matches = [{"job_id": i, "score": round(random.random(), 2), "reasons": ["fake"]} for i in reversed(ids)]
+            text = json.dumps({"matches": matches})
+        else:
+            text = ("Dear Hiring Manager,\n\nThis letter was written by the fake model.\n\n"
+                    "RESUME SUGGESTIONS:\n1. Lead with the most relevant project.")
+        usage = {"input_tokens": len(prompt) // 4, "output_tokens": len(text) // 4,
+                 "total_tokens": (len(prompt) + len(text)) // 4}
+        message = AIMessage(content=text, usage_metadata=usage)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls += 1
+        time.sleep(self.latency)
+        return self._respond(messages)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return self._respond(messages)
+
+
+class LLMClient:
+    """The gateway bound to one action; a drop-in for a chat model's ``ainvoke``."""
+
+    def __init__(self, gateway: "LLMGateway", action: str):
+        self.gateway = gateway
+        self.action = action
+
+    async def ainvoke(self, messages: list[BaseMessage]) -> BaseMessage:
+        return await self.gateway.ainvoke(messages, self.action)
+
+
+class LLMGateway:
+    """Process-wide entry point for chat model calls."""
+
+    def __init__(
+        self,
+        model: BaseChatModel | None = None,
+        concurrency: int = LLM_CONCURRENCY,
+        limits: dict[str, int] | None = None,
+        max_retries: int = LLM_MAX_RETRIES,
+    ):
+        self._model = model
+        self.concurrency = concurrency
+        self.limits = ACTION_LIMITS if limits is None else limits
+        self.max_retries = max_retries
+        self._global: asyncio.Semaphore | None = None
+        self._actions: dict[str, asyncio.Semaphore] = {}
+        self._stats: dict[str, dict] = {}
+
+    # ── Model ──
+
+    def model(self) -> BaseChatModel:
+        """The shared chat model, built on first use."""
+        if self._model is None:
+            if LLM_FAKE:
+                self._model = FakeChatModel()
+            else:
+                from langchain_anthropic import ChatAnthropic
+
+                # Retries happen here, under the semaphores, not inside the client
+                self._model = ChatAnthropic(model=LLM_MODEL, max_tokens=LLM_MAX_TOKENS, max_retries=0)
+        return self._model
+
+    def use(self, model: BaseChatModel | None) -> None:
+        """Route calls to ``model``; ``None`` goes back to the configured default."""
+        self._model = model
+
+    def available(self) -> bool:
+        """Whether calls can be made: a model is plugged in or an API key is set."""
+        return self._model is not None or LLM_FAKE or bool(os.getenv("ANTHROPIC_API_KEY"))
+
+    def client(self, action: str) -> LLMClient:
+        return LLMClient(self, action)
+
+    # ── Calls ──
+
+    @asynccontextmanager
+    async def _slot(self, action: str) -> AsyncIterator[None]:
+        if self._global is None:
+            self._global = asyncio.Semaphore(self.concurrency)
+        limit = self.limits.get(action)
+        if limit is None:
+            async with self._global:
+                yield
+            return
+        if action not in self._actions:
+            self._actions[action] = asyncio.Semaphore(limit)
+        # The action's slot first, so a saturated action never holds a global one
+        async with self._actions[action], self._global:
+            yield
+
+    async def ainvoke(self, messages: list[BaseMessage], action: str) -> BaseMessage:
+        """Call the model for ``action``, retrying overloads with jittered backoff."""
+        stats = self._action_stats(action)
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                stats["retries"] += 1
+                # Full jitter, so callers that failed together don't retry together.
+                # The wait happens outside the slot, leaving it to other calls.
+                await asyncio.sleep(random.uniform(0, min(LLM_RETRY_MAX_S, LLM_RETRY_BACKOFF * 2 ** (attempt - 1))))
+            try:
+                async with self._slot(action):
+                    stats["calls"] += 1
+                    stats["in_flight"] += 1
+                    start = time.perf_counter()
+                    try:
+                        response = await self.model().ainvoke(messages)
+                    finally:
+                        stats["in_flight"] -= 1
+                        stats["latencies"].append(time.perf_counter() - start)
+            except Exception as e:
+                if attempt < self.max_retries and _retryable(e):
+                    logger.info("LLM call for %s failed (%s), retrying", action, type(e).__name__)
+                    continue
+                stats["errors"] += 1
+                raise
+            self._record_usage(stats, response)
+            return response
+        raise AssertionError("unreachable")
+
+    # ── Stats ──
+
+    def _action_stats(self, action: str) -> dict:
+        return self._stats.setdefault(action, {
+            "calls": 0, "errors": 0, "retries": 0, "in_flight": 0,
+            "input_tokens": 0, "output_tokens": 0, "latencies": deque(maxlen=_LATENCY_WINDOW),
+        })
+
+    @staticmethod
+    def _record_usage(stats: dict, response: BaseMessage) -> None:
+        usage = getattr(response, "usage_metadata", None) or {}
+        stats["input_tokens"] += usage.get("input_tokens", 0)
+        stats["output_tokens"] += usage.get("output_tokens", 0)
+
+    def stats(self) -> dict:
+        actions = {}
+        for action, counts in self._stats.items():
+            latencies = sorted(counts["latencies"])
+            actions[action] = {
+                **{k: v for k, v in counts.items() if k != "latencies"},
+                "p50_ms": round(statistics.median(latencies) * 1000, 1) if latencies else 0.0,
+                "p95_ms": round(latencies[int(len(latencies) * 0.95)] * 1000, 1) if latencies else 0.0,
+                "limit": self.limits.get(action),
+            }
+        return {"model": getattr(self.model(), "_llm_type", None) if self.available() else None,
+                "concurrency": self.concurrency, "actions": actions}
+
+    def reset_stats(self) -> None:
+        self._stats.clear()
+
+
+llm_gateway = LLMGateway()
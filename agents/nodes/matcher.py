@@ -1,34 +1,34 @@
 """Matcher agent — finds jobs and calculates match scores using LLM."""
 
-import json
-import os
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage
+from agents.events import emit
+from agents.llm import llm_gateway
+from agents.ranking import PRERANK_TOP_K, prerank, top_k
+from agents.scoring import score_jobs_cached
 from agents.state import AgentState
-from mcp_server.tools.job_boards import search_arbetsformedlingen, search_adzuna, search_remoteok
-from mcp_server.tools.database import save_job, save_match, get_or_create_default_user
-
-MATCHER_SYSTEM = """You are a job matching specialist. Given a user's resume/skills and a list of job postings,
-score each job from 0.0 to 1.0 based on:
-1. Skill overlap (weight: 40%)
-2. Experience level fit (weight: 25%)
-3. Location/remote compatibility (weight: 20%)
-4. Role title relevance (weight: 15%)
-
-For each job, respond with JSON:
-{
-  "matches": [
-    {
-      "job_index": 0,
-      "score": 0.85,
-      "reasons": ["Strong Python match", "Remote compatible"],
-      "skills_matched": ["Python", "FastAPI"],
-      "skills_missing": ["Kubernetes"]
-    }
-  ]
-}
+from mcp_server.tools.search import search_all_sources, store_results
+from mcp_server.tools.async_database import run, save_match
+
+
+def _one_per_position(jobs: list[dict]) -> list[dict]:
+    """First job of each canonical position; cross-posted duplicates are dropped."""
+    seen = set()
+    unique = []
+    for job in jobs:
+        position = job.get("canonical_id") or job["id"]
+        if position not in seen:
+            seen.add(position)
+            unique.append(job)
+    return unique
 
-Be strict: only score >0.7 if genuine strong match. Be honest about gaps."""
+
+def _match_entry(job: dict, match: dict) -> dict:
+    return {
+        "job_id": job["id"],
+        "job_title": job["title"],
+        "company": job["company"],
+        "lexical_score": job.get("lexical_score"),
+        **match,
+    }
 
 
 async def matcher_node(state: AgentState) -> dict:
@@ -38,77 +38,73 @@ async def matcher_node(state: AgentState) -> dict:
     location = params.get("location", "")
     remote_only = params.get("remote_only", False)
 
-    # Fetch jobs from APIs
-    all_jobs = []
-    try:
-        # Arbetsförmedlingen (Swedish jobs) - FREE, primary source
-        if not remote_only:
-            af_jobs = await search_arbetsformedlingen(keywords=keywords)
-            all_jobs.extend(af_jobs)
-        # RemoteOK (remote/tech jobs)
-        remoteok_jobs = await search_remoteok(tags=keywords.split()[0].lower())
-        all_jobs.extend(remoteok_jobs)
-    except Exception as e:
-        return {"error": f"Job search failed: {e}", "jobs_found": [], "match_scores": []}
+    # Fetch jobs from all boards concurrently; slow or failing boards are skipped
+    result = await search_all_sources(
+        keywords=keywords,
+        location=location,
+        remote_only=remote_only,
+        limit=20,
+    )
+    all_jobs = result["jobs"]
 
     if not all_jobs:
+        errors = "; ".join(
+            f"{name}: {meta['error']}" for name, meta in result["sources"].items()
+            if meta["error"] and not meta["skipped"]
+        )
+        if errors:
+            return {"error": f"Job search failed: {errors}", "jobs_found": [], "match_scores": []}
         return {"jobs_found": [], "match_scores": [], "error": "No jobs found"}
 
     # Save jobs to DB
-    saved_jobs = []
-    for job in all_jobs[:20]:
-        saved = save_job(job)
-        saved_jobs.append(saved)
+    saved_jobs = await run(store_results, result)
+    await emit("jobs_saved", {"jobs": saved_jobs, "sources": result["sources"]})
 
     # Score with LLM if resume available
-    resume_text = state.get("resume_text", "")
+    context = state["context"]
+    resume_text = context.resume_text
     match_scores = []
+    scoring_stats = {}
 
-    if resume_text and os.getenv("ANTHROPIC_API_KEY"):
-        llm = ChatAnthropic(model="claude-sonnet-4-20250514", max_tokens=2000)
+    # The same position posted on several boards is only scored once
+    positions = _one_per_position(saved_jobs)
 
-        jobs_summary = "\n".join([
-            f"[{i}] {j['title']} at {j['company']} — {j.get('location', 'Unknown')} — {j.get('description', '')[:200]}"
-            for i, j in enumerate(saved_jobs[:10])
-        ])
+    # Cheap lexical pass first: only the top-K most relevant jobs reach the LLM
+    if resume_text:
+        for job, lexical in zip(positions, prerank(resume_text, positions)):
+            job["lexical_score"] = lexical
 
-        messages = [
-            SystemMessage(content=MATCHER_SYSTEM),
-            HumanMessage(content=f"Resume:\n{resume_text[:3000]}\n\nJobs:\n{jobs_summary}"),
-        ]
+    if resume_text and llm_gateway.available():
+        llm = llm_gateway.client("scoring")
 
-        try:
-            response = await llm.ainvoke(messages)
-            text = response.content
-            # Extract JSON from response
-            start = text.find("{")
-            end = text.rfind("}") + 1
-            if start >= 0 and end > start:
-                data = json.loads(text[start:end])
-                user = get_or_create_default_user()
-                for m in data.get("matches", []):
-                    idx = m.get("job_index", 0)
-                    if idx < len(saved_jobs):
-                        save_match(
-                            user_id=user["id"],
-                            job_id=saved_jobs[idx]["id"],
-                            score=m["score"],
-                            reasons=m.get("reasons", []),
-                            matched=m.get("skills_matched", []),
-                            missing=m.get("skills_missing", []),
-                        )
-                        match_scores.append({
-                            "job_id": saved_jobs[idx]["id"],
-                            "job_title": saved_jobs[idx]["title"],
-                            "company": saved_jobs[idx]["company"],
-                            **m,
-                        })
-        except Exception:
-            # LLM scoring failed, return jobs without scores
-            pass
+        async def record(job: dict, m: dict) -> None:
+            await save_match(
+                user_id=context.user_id,
+                job_id=job["id"],
+                score=m["score"],
+                reasons=m.get("reasons", []),
+                matched=m.get("skills_matched", []),
+                missing=m.get("skills_missing", []),
+                lexical_score=job["lexical_score"],
+            )
+            await emit("match_score", _match_entry(job, m))
+
+        # Batches that still fail after retries just leave their jobs unscored
+        candidates = top_k(positions, [job["lexical_score"] for job in positions], PRERANK_TOP_K)
+        scored = await score_jobs_cached(llm, resume_text, candidates, context.user_id, on_match=record)
+        scoring_stats = scored["stats"]
+        match_scores = [
+            _match_entry(job, scored["matches"][job["id"]])
+            for job in candidates if job["id"] in scored["matches"]
+        ]
 
     return {
         "jobs_found": saved_jobs,
         "match_scores": match_scores,
+        "stats": {
+            "sources": result["sources"],
+            "duplicates": len(saved_jobs) - len(positions),
+            "scoring": scoring_stats,
+        },
         "error": "",
     }
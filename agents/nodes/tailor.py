@@ -1,13 +1,11 @@
 """Tailor agent — generates cover letters and resume suggestions using LLM."""
 
-import os
-from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
+from agents.llm import llm_gateway
 from agents.state import AgentState
-from mcp_server.tools.database import (
+from mcp_server.tools.async_database import (
+    find_position_document,
     get_application,
-    get_or_create_default_user,
-    get_primary_resume,
     save_document,
 )
 
@@ -33,6 +31,23 @@ Resume suggestions guidelines:
 Respond with the cover letter first, then a section "RESUME SUGGESTIONS:" with numbered suggestions."""
 
 
+async def _reuse_position_documents(application_id: str, since: str) -> dict | None:
+    """Copy documents generated for a duplicate posting of the same position."""
+    letter = await find_position_document(application_id, "cover_letter", since=since)
+    if not letter:
+        return None
+    suggestions = await find_position_document(application_id, "resume_suggestions", since=since)
+
+    await save_document(application_id, "cover_letter", letter["content"])
+    if suggestions:
+        await save_document(application_id, "resume_suggestions", suggestions["content"])
+    return {
+        "cover_letter": letter["content"],
+        "resume_suggestions": suggestions["content"].split("\n") if suggestions else [],
+        "error": "",
+    }
+
+
 async def tailor_node(state: AgentState) -> dict:
     """Generate a tailored cover letter and resume suggestions."""
     params = state.get("params", {})
@@ -41,23 +56,27 @@ async def tailor_node(state: AgentState) -> dict:
     if not application_id:
         return {"error": "application_id required", "cover_letter": "", "resume_suggestions": []}
 
-    app = get_application(application_id)
+    app = await get_application(application_id)
     if not app:
         return {"error": "Application not found", "cover_letter": "", "resume_suggestions": []}
 
-    # Get resume
-    user = get_or_create_default_user()
-    resume = get_primary_resume(user["id"])
-    resume_text = resume.get("raw_text", "") if resume else state.get("resume_text", "")
+    resume = state["context"].resume
+    resume_text = state["context"].resume_text
 
     if not resume_text:
         return {"error": "No resume found", "cover_letter": "", "resume_suggestions": []}
 
+    # Same position already tailored via another board's posting: reuse it
+    if resume:
+        reused = await _reuse_position_documents(application_id, since=resume["created_at"])
+        if reused:
+            return reused
+
     job_desc = app.get("job_description", "No description available")
     job_title = app.get("job_title", "Unknown")
     company = app.get("company", "Unknown")
 
-    if not os.getenv("ANTHROPIC_API_KEY"):
+    if not llm_gateway.available():
         # Return a template if no API key
         cover_letter = f"""Dear Hiring Manager,
 
@@ -74,14 +93,13 @@ Best regards"""
             "error": "",
         }
 
-    llm = ChatAnthropic(model="claude-sonnet-4-20250514", max_tokens=2000)
     messages = [
         SystemMessage(content=TAILOR_SYSTEM),
         HumanMessage(content=f"RESUME:\n{resume_text[:4000]}\n\nJOB: {job_title} at {company}\n\nJOB DESCRIPTION:\n{job_desc[:3000]}"),
     ]
 
     try:
-        response = await llm.ainvoke(messages)
+        response = await llm_gateway.ainvoke(messages, "tailor")
         text = response.content
 
         # Split cover letter and suggestions
@@ -95,7 +113,9 @@ Best regards"""
             suggestions = []
 
         # Save cover letter to DB
-        save_document(application_id, "cover_letter", cover_letter)
+        await save_document(application_id, "cover_letter", cover_letter)
+        if suggestions:
+            await save_document(application_id, "resume_suggestions", "\n".join(suggestions))
 
         return {
             "cover_letter": cover_letter,
@@ -1,10 +1,10 @@
 """Tracker agent — manages application status and generates summaries."""
 
 from agents.state import AgentState
-from mcp_server.tools.database import (
-    get_or_create_default_user,
+from mcp_server.tools.async_database import (
     update_application_status,
     get_applications,
+    get_application_status_counts,
     get_application,
     get_application_events,
 )
@@ -23,30 +23,28 @@ async def tracker_node(state: AgentState) -> dict:
         if not application_id or not new_status:
             return {"error": "application_id and status required", "application_update": {}}
 
-        app = update_application_status(application_id, new_status, notes or None)
+        app = await update_application_status(application_id, new_status, notes or None)
         return {"application_update": app, "error": ""}
 
     elif sub_action == "summary":
-        user = get_or_create_default_user()
-        all_apps = get_applications(user["id"])
+        user_id = state["context"].user_id
+        by_status = await get_application_status_counts(user_id)
+        recent, next_cursor = await get_applications(user_id)
 
         summary = {
-            "total": len(all_apps),
-            "by_status": {},
-            "applications": all_apps,
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "applications": recent,
+            "next_cursor": next_cursor,
         }
-        for app in all_apps:
-            status = app.get("status", "unknown")
-            summary["by_status"][status] = summary["by_status"].get(status, 0) + 1
-
         return {"application_update": summary, "error": ""}
 
     elif sub_action == "detail":
         application_id = params.get("application_id", "")
-        app = get_application(application_id)
+        app = await get_application(application_id)
         if not app:
             return {"error": "Application not found", "application_update": {}}
-        events = get_application_events(application_id)
+        events = await get_application_events(application_id)
         app["events"] = events
         return {"application_update": app, "error": ""}
 
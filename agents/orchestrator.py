@@ -1,18 +1,22 @@
 """LangGraph orchestrator — connects supervisor + specialist agents."""
 
 import sys
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from langgraph.graph import StateGraph, END
+from langgraph.graph import END, StateGraph
 
-from agents.state import AgentState
-from agents.nodes.supervisor import supervisor_node, route_to_agent
 from agents.nodes.matcher import matcher_node
+from agents.nodes.supervisor import route_to_agent, supervisor_node
 from agents.nodes.tailor import tailor_node
 from agents.nodes.tracker import tracker_node
-from mcp_server.tools.database import get_or_create_default_user, get_primary_resume
+from agents.state import AgentState, RunContext
+from mcp_server.tools.async_database import (
+    get_or_create_default_user,
+    get_primary_resume,
+)
 
 
 def build_graph() -> StateGraph:
@@ -48,15 +52,16 @@ def build_graph() -> StateGraph:
     return graph
 
 
+AGENT_NODES = ("supervisor", "matcher", "tailor", "tracker")
+
 # Compile once
 workflow = build_graph().compile()
 
 
-async def run_workflow(action: str, params: dict) -> dict:
-    """Execute a workflow and return results."""
+async def _initial_state(action: str, params: dict) -> AgentState:
     # Load user context
-    user = get_or_create_default_user()
-    resume = get_primary_resume(user["id"])
+    user = await get_or_create_default_user()
+    resume = await get_primary_resume(user["id"])
 
     initial_state: AgentState = {
         "messages": [],
@@ -68,13 +73,14 @@ async def run_workflow(action: str, params: dict) -> dict:
         "cover_letter": "",
         "resume_suggestions": [],
         "application_update": {},
-        "user_id": user["id"],
-        "resume_text": resume.get("raw_text", "") if resume else "",
+        "stats": {},
+        "context": RunContext(user=user, resume=resume),
         "error": "",
     }
+    return initial_state
 
-    result = await workflow.ainvoke(initial_state)
 
+def _result(action: str, result: dict) -> dict:
     return {
         "action": action,
         "jobs_found": result.get("jobs_found", []),
@@ -82,5 +88,44 @@ async def run_workflow(action: str, params: dict) -> dict:
         "cover_letter": result.get("cover_letter", ""),
         "resume_suggestions": result.get("resume_suggestions", []),
         "application_update": result.get("application_update", {}),
+        "stats": result.get("stats", {}),
         "error": result.get("error", ""),
     }
+
+
+def _chunk_text(content) -> str:
+    # Anthropic chunks carry either a string or a list of content blocks
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+
+async def run_workflow(action: str, params: dict) -> dict:
+    """Execute a workflow and return results."""
+    result = await workflow.ainvoke(await _initial_state(action, params))
+    return _result(action, result)
+
+
+async def stream_workflow(action: str, params: dict) -> AsyncIterator[dict]:
+    """Execute a workflow, yielding progress events as they happen.
+
+    Event types: ``node_start``/``node_end`` per agent node, ``jobs_saved``
+    and ``match_score`` from the matcher, ``token`` for cover-letter text
+    as the tailor generates it, and a final ``result`` with the same
+    shape ``run_workflow`` returns.
+    """
+    async for event in workflow.astream_events(await _initial_state(action, params), version="v2"):
+        kind = event["event"]
+        name = event["name"]
+        node = event.get("metadata", {}).get("langgraph_node")
+
+        if kind in ("on_chain_start", "on_chain_end") and name in AGENT_NODES and node == name:
+            yield {"type": "node_start" if kind == "on_chain_start" else "node_end", "node": name}
+        elif kind == "on_custom_event":
+            yield {"type": name, **event["data"]}
+        elif kind == "on_chat_model_stream" and node == "tailor":
+            text = _chunk_text(event["data"]["chunk"].content)
+            if text:
+                yield {"type": "token", "node": node, "text": text}
+        elif kind == "on_chain_end" and not event.get("parent_ids"):
+            yield {"type": "result", "result": _result(action, event["data"]["output"])}
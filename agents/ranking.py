@@ -0,0 +1,87 @@
+"""Deterministic BM25 pre-ranker for jobs against a resume.
+
+Runs on CPU with a sparse term-frequency matrix, so ranking a few hundred
+jobs costs milliseconds and decides which ones are worth an LLM call.
+"""
+
+import os
+import re
+
+import numpy as np
+from scipy import sparse
+
+PRERANK_TOP_K = int(os.getenv("PRERANK_TOP_K", "20"))
+
+# Keeps tokens like "c++", "c#", "node.js" and "ci/cd" intact
+_TOKEN = re.compile(r"[^\W_][\w+#./-]*[\w+#]|[^\W_]")
+
+_STOPWORDS = frozenset([
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "is", "it", "its",
+    "of", "on", "or", "our", "that", "the", "this", "to", "we", "will", "with", "you", "your",
+    "och", "att", "en", "ett", "för", "med", "som", "till", "av", "det", "den", "på", "är", "vi", "har",
+])
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _job_text(job: dict) -> str:
+    # Title terms count double: they are the strongest signal in a short ad
+    title = job.get("title") or ""
+    return f"{title} {title} {job.get('description') or ''}"
+
+
+def bm25_scores(query: str, documents: list[str], k1: float = 1.5, b: float = 0.75) -> np.ndarray:
+    """BM25 score of every document against the query, in document order."""
+    if not documents:
+        return np.zeros(0)
+
+    vocab: dict[str, int] = {}
+    indptr = [0]
+    indices: list[int] = []
+    for doc in documents:
+        for token in tokenize(doc):
+            indices.append(vocab.setdefault(token, len(vocab)))
+        indptr.append(len(indices))
+
+    # docs × terms counts; duplicate (row, col) entries are summed on conversion
+    tf = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.float64), np.array(indices, dtype=np.int64), np.array(indptr)),
+        shape=(len(documents), max(len(vocab), 1)),
+    )
+    tf.sum_duplicates()
+
+    doc_len = np.diff(indptr).astype(np.float64)
+    avg_len = doc_len.mean() or 1.0
+    df = np.bincount(tf.indices, minlength=tf.shape[1])
+    idf = np.log1p((len(documents) - df + 0.5) / (df + 0.5))
+
+    # Saturate term frequencies in place on the sparse data
+    row_len = np.repeat(doc_len, np.diff(tf.indptr))
+    tf.data = tf.data * (k1 + 1) / (tf.data + k1 * (1 - b + b * row_len / avg_len))
+
+    # A resume is a long query: damp repeated terms with log(1 + qtf)
+    weights = np.zeros(tf.shape[1])
+    for token in tokenize(query):
+        col = vocab.get(token)
+        if col is not None:
+            weights[col] += 1
+    weights = np.log1p(weights) * idf
+
+    return tf @ weights
+
+
+def prerank(resume_text: str, jobs: list[dict]) -> list[float]:
+    """Lexical relevance of each job to the resume, scaled to 0..1, in job order."""
+    scores = bm25_scores(resume_text, [_job_text(job) for job in jobs])
+    top = scores.max() if len(scores) else 0.0
+    if top > 0:
+        scores = scores / top
+    return [round(float(s), 4) for s in scores]
+
+
+def top_k(jobs: list[dict], scores: list[float], k: int = PRERANK_TOP_K) -> list[dict]:
+    """The k highest-scoring jobs, best first (ties keep input order)."""
+    order = np.argsort(-np.asarray(scores), kind="stable")[:k]
+    return [jobs[i] for i in order]
@@ -0,0 +1,191 @@
+"""Batched, concurrent LLM scoring of jobs against a resume."""
+
+import asyncio
+import hashlib
+import json
+import os
+from collections.abc import Awaitable, Callable
+
+import anthropic
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from agents.llm import LLMClient, LLMOverloadedError
+from mcp_server.tools.async_database import get_cached_matches, put_cached_matches
+from mcp_server.tools.database import content_hash
+
+SCORING_BATCH_SIZE = int(os.getenv("SCORING_BATCH_SIZE", "8"))
+# Re-asks for a batch whose response was unusable; overloads and other API
+# errors are retried by the LLM gateway, not here
+SCORING_MAX_RETRIES = int(os.getenv("SCORING_MAX_RETRIES", "2"))
+
+MATCHER_SYSTEM = """You are a job matching specialist. Given a user's resume/skills and a list of job postings,
+score each job from 0.0 to 1.0 based on:
+1. Skill overlap (weight: 40%)
+2. Experience level fit (weight: 25%)
+3. Location/remote compatibility (weight: 20%)
+4. Role title relevance (weight: 15%)
+
+Each job is listed as [job_id] followed by its details. For each job, respond with JSON,
+copying the job_id exactly:
+{
+  "matches": [
+    {
+      "job_id": "3f2b8c1e-...",
+      "score": 0.85,
+      "reasons": ["Strong Python match", "Remote compatible"],
+      "skills_matched": ["Python", "FastAPI"],
+      "skills_missing": ["Kubernetes"]
+    }
+  ]
+}
+
+Be strict: only score >0.7 if genuine strong match. Be honest about gaps."""
+
+# Cached scores are only reused for the exact prompt they were produced with
+PROMPT_VERSION = hashlib.sha256(MATCHER_SYSTEM.encode("utf-8")).hexdigest()[:12]
+
+OnMatch = Callable[[dict, dict], Awaitable[None]]
+
+
+class ScoringError(Exception):
+    """A batch's response could not be used."""
+
+
+def _batches(jobs: list[dict], size: int) -> list[list[dict]]:
+    return [jobs[i:i + size] for i in range(0, len(jobs), size)]
+
+
+def _parse_matches(text: str, batch: list[dict]) -> dict[str, dict]:
+    start = text.find("{")
+    end = text.rfind("}") + 1
+    if start < 0 or end <= start:
+        raise ScoringError("no JSON object in response")
+    try:
+        data = json.loads(text[start:end])
+    except json.JSONDecodeError as e:
+        raise ScoringError(f"invalid JSON: {e}") from e
+
+    # Only accept ids that were in this batch, so a hallucinated id can't land on another job
+    wanted = {job["id"] for job in batch}
+    matches = {}
+    for m in data.get("matches", []):
+        job_id = str(m.get("job_id", ""))
+        if job_id in wanted and "score" in m:
+            matches[job_id] = m
+    if not matches:
+        raise ScoringError("response scored none of the batch's jobs")
+    return matches
+
+
+async def _score_batch(llm: BaseChatModel | LLMClient, resume_text: str, batch: list[dict]) -> dict[str, dict]:
+    jobs_summary = "\n".join(
+        f"[{j['id']}] {j['title']} at {j['company']} — {j.get('location') or 'Unknown'} — {(j.get('description') or '')[:200]}"
+        for j in batch
+    )
+    messages = [
+        SystemMessage(content=MATCHER_SYSTEM),
+        HumanMessage(content=f"Resume:\n{resume_text[:3000]}\n\nJobs:\n{jobs_summary}"),
+    ]
+    response = await llm.ainvoke(messages)
+    text = response.content if isinstance(response.content, str) else str(response.content)
+    return _parse_matches(text, batch)
+
+
+async def score_jobs(
+    llm: BaseChatModel | LLMClient,
+    resume_text: str,
+    jobs: list[dict],
+    batch_size: int = SCORING_BATCH_SIZE,
+    max_retries: int = SCORING_MAX_RETRIES,
+    on_match: OnMatch | None = None,
+) -> dict:
+    """Score every job in concurrent batches, merging results by job id.
+
+    All batches are started at once; pass ``llm_gateway.client("scoring")``
+    so the gateway bounds how many are in flight and retries overloads. A
+    batch whose response is unusable (``ScoringError``) is re-asked, alone,
+    up to ``max_retries`` times; any other error fails the batch. Successful
+    batches are never re-sent. ``on_match(job, match)`` is awaited for each
+    result as soon as its batch completes.
+
+    Returns:
+        {"matches": {job_id: match}, "stats": {"batches", "retries", "failed_batches", "errors"}}
+    """
+    by_id = {job["id"]: job for job in jobs}
+    matches: dict[str, dict] = {}
+    stats = {"batches": 0, "retries": 0, "failed_batches": 0, "errors": []}
+
+    async def run(batch: list[dict]) -> None:
+        for attempt in range(max_retries + 1):
+            if attempt:
+                stats["retries"] += 1
+            try:
+                result = await _score_batch(llm, resume_text, batch)
+            except ScoringError as e:
+                error = f"ScoringError: {e}"
+                continue
+            except (anthropic.APIError, LLMOverloadedError) as e:
+                # The gateway already retried what was worth retrying
+                error = f"{type(e).__name__}: {e}"
+                break
+            for job_id, match in result.items():
+                matches[job_id] = match
+                if on_match:
+                    await on_match(by_id[job_id], match)
+            return
+        stats["failed_batches"] += 1
+        stats["errors"].append(error)
+
+    batches = _batches(list(by_id.values()), batch_size)
+    stats["batches"] = len(batches)
+    await asyncio.gather(*[run(batch) for batch in batches])
+    return {"matches": matches, "stats": stats}
+
+
+def job_hash(job: dict) -> str:
+    """Hash of the job content the LLM sees, ignoring ids and volatile fields."""
+    parts = [job.get(field) or "" for field in ("title", "company", "location", "description")]
+    return content_hash("\x1f".join(" ".join(str(p).lower().split()) for p in parts))
+
+
+async def score_jobs_cached(
+    llm: BaseChatModel | LLMClient,
+    resume_text: str,
+    jobs: list[dict],
+    user_id: str,
+    on_match: OnMatch | None = None,
+    **kwargs,
+) -> dict:
+    """``score_jobs`` memoized on (resume hash, job content hash, prompt version).
+
+    Pairs scored before are answered from ``match_cache`` without an LLM
+    call; only the misses are batched. Stats gain cache hit/miss counts.
+    """
+    resume_key = content_hash(resume_text)
+    hashes = {job["id"]: job_hash(job) for job in jobs}
+    cached = await get_cached_matches(resume_key, list(set(hashes.values())), PROMPT_VERSION)
+
+    matches: dict[str, dict] = {}
+    misses = []
+    for job in jobs:
+        hit = cached.get(hashes[job["id"]])
+        if hit is None:
+            misses.append(job)
+            continue
+        matches[job["id"]] = {**hit, "job_id": job["id"]}
+        if on_match:
+            await on_match(job, matches[job["id"]])
+
+    result = await score_jobs(llm, resume_text, misses, on_match=on_match, **kwargs)
+    await put_cached_matches(
+        user_id, resume_key, PROMPT_VERSION,
+        {hashes[job_id]: match for job_id, match in result["matches"].items()},
+    )
+    matches.update(result["matches"])
+
+    stats = result["stats"]
+    stats["cache_hits"] = len(jobs) - len(misses)
+    stats["cache_misses"] = len(misses)
+    stats["cache_hit_rate"] = round(stats["cache_hits"] / len(jobs), 3) if jobs else 0.0
+    return {"matches": matches, "stats": stats}
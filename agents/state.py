@@ -1,9 +1,29 @@
 """Shared state schema for the LangGraph agent workflow."""
 
+from dataclasses import dataclass
 from typing import Literal, TypedDict
 from langchain_core.messages import BaseMessage
 
 
+@dataclass(frozen=True)
+class RunContext:
+    """Who the workflow runs for, loaded once when the run starts.
+
+    Nodes read the user and primary resume from here instead of querying
+    for them again.
+    """
+    user: dict
+    resume: dict | None
+
+    @property
+    def user_id(self) -> str:
+        return self.user["id"]
+
+    @property
+    def resume_text(self) -> str:
+        return self.resume.get("raw_text", "") if self.resume else ""
+
+
 class AgentState(TypedDict):
     """State passed between all agents in the graph."""
     messages: list[BaseMessage]
@@ -17,7 +37,7 @@ class AgentState(TypedDict):
     cover_letter: str
     resume_suggestions: list[str]
     application_update: dict
+    stats: dict  # timing / cache counters for the run
     # User context
-    user_id: str
-    resume_text: str
+    context: RunContext
     error: str
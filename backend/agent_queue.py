@@ -0,0 +1,165 @@
+"""Worker pool that executes queued agent runs outside the HTTP request.
+
+Runs are persisted in the ``agent_runs`` table, so they survive client
+disconnects and restarts. Workers claim the oldest queued run whose action
+still has capacity, heartbeat while it executes, and store the result.
+Runs whose heartbeat stops (the process died) are requeued by whichever
+process notices first.
+"""
+
+import asyncio
+import logging
+import os
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from mcp_server.tools.async_database import (
+    claim_agent_run,
+    enqueue_agent_run,
+    finish_agent_run,
+    heartbeat_agent_run,
+    recover_stale_agent_runs,
+    requeue_agent_run,
+)
+
+logger = logging.getLogger(__name__)
+
+AGENT_WORKERS = int(os.getenv("AGENT_WORKERS", "4"))
+AGENT_QUEUE_POLL_S = float(os.getenv("AGENT_QUEUE_POLL_S", "2"))
+AGENT_HEARTBEAT_S = float(os.getenv("AGENT_HEARTBEAT_S", "15"))
+AGENT_RUN_STALE_S = float(os.getenv("AGENT_RUN_STALE_S", "120"))
+AGENT_RUN_MAX_ATTEMPTS = int(os.getenv("AGENT_RUN_MAX_ATTEMPTS", "3"))
+
+# Max concurrent runs per action in this process; unlisted actions are only
+# bounded by the pool size
+ACTION_LIMITS = {
+    "search_jobs": int(os.getenv("AGENT_CONCURRENCY_SEARCH_JOBS", "2")),
+    "tailor_application": int(os.getenv("AGENT_CONCURRENCY_TAILOR_APPLICATION", "2")),
+    "update_status": int(os.getenv("AGENT_CONCURRENCY_UPDATE_STATUS", "4")),
+}
+
+
+def _stale_before() -> str:
+    return (datetime.now(UTC) - timedelta(seconds=AGENT_RUN_STALE_S)).isoformat()
+
+
+class AgentRunQueue:
+    """A fixed pool of asyncio workers draining the ``agent_runs`` table."""
+
+    def __init__(self, workers: int = AGENT_WORKERS, limits: dict[str, int] | None = None):
+        self.workers = workers
+        self.limits = ACTION_LIMITS if limits is None else limits
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._in_flight: dict[str, int] = {}
+        # Held from the saturation check until the claimed run is counted, so
+        # two workers can't both take an action's last slot
+        self._claim_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        recovered = await recover_stale_agent_runs(_stale_before(), AGENT_RUN_MAX_ATTEMPTS)
+        if recovered:
+            logger.info("Recovered %d stale agent runs", recovered)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._reaper()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, action: str, params: dict) -> dict:
+        """Persist a run and wake an idle worker; returns the queued run."""
+        run = await enqueue_agent_run(action, params)
+        self._wakeup.set()
+        return run
+
+    def _saturated(self) -> list[str]:
+        return [action for action, limit in self.limits.items() if self._in_flight.get(action, 0) >= limit]
+
+    async def _claim(self) -> dict | None:
+        """Claim a run whose action has a free slot, and take that slot."""
+        async with self._claim_lock:
+            run = await claim_agent_run(self.worker_id, exclude_actions=self._saturated())
+            if run is not None:
+                self._in_flight[run["action"]] = self._in_flight.get(run["action"], 0) + 1
+            return run
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                run = await self._claim()
+            except Exception:
+                logger.exception("Claiming an agent run failed")
+                run = None
+            if run is None:
+                # Woken by submit() in this process, or poll for runs queued by others
+                self._wakeup.clear()
+                # Not wait_for: on 3.11 it can swallow a cancel that lands as the
+                # event is set, leaving stop() waiting on this worker forever
+                try:
+                    async with asyncio.timeout(AGENT_QUEUE_POLL_S):
+                        await self._wakeup.wait()
+                except TimeoutError:
+                    pass
+                continue
+            await self._execute(run)
+
+    async def _execute(self, run: dict) -> None:
+        from agents.orchestrator import run_workflow
+
+        action = run["action"]
+        heartbeat = asyncio.create_task(self._heartbeat(run["id"]))
+        try:
+            result = await run_workflow(action, run["params"])
+        except asyncio.CancelledError:
+            # Shutting down: hand the run straight back instead of waiting to go stale
+            await self._record(requeue_agent_run, run["id"])
+            raise
+        except Exception as e:
+            logger.exception("Agent run %s failed", run["id"])
+            await self._record(finish_agent_run, run["id"], error=f"{type(e).__name__}: {e}")
+        else:
+            await self._record(finish_agent_run, run["id"], result=result)
+        finally:
+            heartbeat.cancel()
+            self._in_flight[action] -= 1
+            # A slot for this action freed up; let a waiting worker look again
+            self._wakeup.set()
+
+    @staticmethod
+    async def _record(update, run_id: str, **kwargs) -> None:
+        """Store a run's outcome without letting a database error kill the worker.
+
+        A run whose outcome couldn't be stored stops heartbeating, so the
+        reaper requeues it once it goes stale.
+        """
+        try:
+            await update(run_id, **kwargs)
+        except Exception:
+            logger.exception("Recording the outcome of agent run %s failed", run_id)
+
+    async def _heartbeat(self, run_id: str) -> None:
+        while True:
+            await asyncio.sleep(AGENT_HEARTBEAT_S)
+            try:
+                await heartbeat_agent_run(run_id)
+            except Exception:
+                # Keep beating; one missed write must not let the run go stale
+                logger.exception("Heartbeat for agent run %s failed", run_id)
+
+    async def _reaper(self) -> None:
+        while True:
+            await asyncio.sleep(AGENT_RUN_STALE_S / 2)
+            try:
+                if await recover_stale_agent_runs(_stale_before(), AGENT_RUN_MAX_ATTEMPTS):
+                    self._wakeup.set()
+            except Exception:
+                logger.exception("Recovering stale agent runs failed")
+
+
+agent_queue = AgentRunQueue()
@@ -1,28 +0,0 @@
-"""SQLAlchemy async database setup."""
-
-import os
-from pathlib import Path
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
-
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./data/jobs.db")
-
-engine = create_async_engine(DATABASE_URL, echo=False)
-async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-
-class Base(DeclarativeBase):
-    pass
-
-
-async def init_db():
-    """Create tables and data directory."""
-    Path("data").mkdir(exist_ok=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-
-async def get_db():
-    """Dependency for FastAPI routes."""
-    async with async_session() as session:
-        yield session
@@ -11,14 +11,29 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from mcp_server.tools.database import init_db_sync
-from backend.routers import jobs, applications, resumes, agent
+from mcp_server.tools.database import init_db_sync, close_pool
+from mcp_server.tools.async_database import shutdown_executor
+from mcp_server.tools.http_client import aclose_clients
+from mcp_server.tools.resume_parser import shutdown_parse_pool
+from mcp_server.tools.search_cache import search_cache
+from backend.routers import jobs, applications, resumes, agent, saved_searches
+from backend.scheduler import ingest_scheduler
+from backend.agent_queue import agent_queue
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db_sync()
+    search_cache.prune()
+    ingest_scheduler.start()
+    await agent_queue.start()
     yield
+    await agent_queue.stop()
+    await ingest_scheduler.stop()
+    await aclose_clients()
+    shutdown_parse_pool()
+    shutdown_executor()
+    close_pool()
 
 
 app = FastAPI(
@@ -40,6 +55,7 @@ app.include_router(jobs.router)
 app.include_router(applications.router)
 app.include_router(resumes.router)
 app.include_router(agent.router)
+app.include_router(saved_searches.router)
 
 
 @app.get("/api/health")
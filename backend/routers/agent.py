@@ -1,22 +1,74 @@
 """Agent execution routes — triggers LangGraph workflows from the API."""
 
-from fastapi import APIRouter
-from backend.schemas import AgentRunRequest, AgentRunResponse
+import json
+import logging
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from backend.agent_queue import agent_queue
+from agents.llm import llm_gateway
+from backend.schemas import AgentRunOut, AgentRunQueued, AgentRunRequest
+from mcp_server.tools.async_database import get_agent_run
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/agent", tags=["agent"])
 
 
-@router.post("/run", response_model=AgentRunResponse)
+@router.post("/run", response_model=AgentRunQueued, status_code=202)
 async def run_agent(body: AgentRunRequest):
-    """Trigger an agent workflow.
+    """Queue an agent workflow and return its run id immediately.
+
+    Poll ``GET /api/agent/runs/{run_id}`` for status and result.
 
     Actions:
     - search_jobs: Find and score matching jobs
     - tailor_application: Generate cover letter + resume suggestions
     - update_status: Track application status changes
     """
-    # Import here to avoid circular imports
-    from agents.orchestrator import run_workflow
+    run = await agent_queue.submit(body.action, body.params)
+    return AgentRunQueued(run_id=run["id"], status=run["status"])
+
+
+@router.get("/runs/{run_id}", response_model=AgentRunOut)
+async def get_run(run_id: str):
+    run = await get_agent_run(run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return run
+
+
+@router.get("/llm/stats")
+async def llm_stats():
+    """LLM calls, retries, errors, latency and token usage per action."""
+    return llm_gateway.stats()
+
+
+@router.post("/run/stream")
+async def run_agent_stream(body: AgentRunRequest):
+    """Trigger an agent workflow and stream its progress as server-sent events.
+
+    Events: run_start, node_start, node_end, jobs_saved, match_score,
+    token (cover-letter text as it is generated), result, and error.
+    """
+    from agents.orchestrator import stream_workflow
+
+    async def sse():
+        yield _sse("run_start", {"action": body.action})
+        try:
+            async for event in stream_workflow(body.action, body.params):
+                yield _sse(event["type"], event)
+        except Exception as e:
+            # Headers are already sent, so the client learns of it as an event
+            logger.exception("Streaming agent run %s failed", body.action)
+            yield _sse("error", {"type": "error", "error": str(e)})
+
+    return StreamingResponse(
+        sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
-    result = await run_workflow(body.action, body.params)
-    return AgentRunResponse(status="completed", result=result)
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
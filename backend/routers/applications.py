@@ -1,12 +1,13 @@
 """Application management routes."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query
 from backend.schemas import ApplicationCreate, ApplicationUpdate
-from mcp_server.tools.database import (
+from mcp_server.tools.async_database import (
     get_or_create_default_user,
     create_application,
     update_application_status,
     get_applications,
+    get_application_status_counts,
     get_application,
     get_application_events,
     get_primary_resume,
@@ -16,17 +17,30 @@ router = APIRouter(prefix="/api/applications", tags=["applications"])
 
 
 @router.get("")
-async def list_applications(status: str | None = None):
-    user = get_or_create_default_user()
-    apps = get_applications(user["id"], status=status)
-    return {"count": len(apps), "applications": apps}
+async def list_applications(status: str | None = None, limit: int = Query(50, ge=1, le=500),
+                            cursor: str | None = None):
+    """Most recently updated first; pass ``next_cursor`` back as ``cursor`` for the next page."""
+    user = await get_or_create_default_user()
+    try:
+        apps, next_cursor = await get_applications(user["id"], status=status, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"count": len(apps), "applications": apps, "next_cursor": next_cursor}
+
+
+@router.get("/summary")
+async def summary():
+    """Application counts per status across the whole pipeline."""
+    user = await get_or_create_default_user()
+    by_status = await get_application_status_counts(user["id"])
+    return {"total": sum(by_status.values()), "by_status": by_status}
 
 
 @router.post("")
 async def create(body: ApplicationCreate):
-    user = get_or_create_default_user()
-    resume = get_primary_resume(user["id"])
-    app = create_application(
+    user = await get_or_create_default_user()
+    resume = await get_primary_resume(user["id"])
+    app = await create_application(
         user_id=user["id"],
         job_id=body.job_id,
         resume_id=body.resume_id or (resume["id"] if resume else None),
@@ -36,10 +50,10 @@ async def create(body: ApplicationCreate):
 
 @router.get("/{application_id}")
 async def get_detail(application_id: str):
-    app = get_application(application_id)
+    app = await get_application(application_id)
     if not app:
         return {"error": "Not found"}, 404
-    events = get_application_events(application_id)
+    events = await get_application_events(application_id)
     app["events"] = events
     return app
 
@@ -47,6 +61,6 @@ async def get_detail(application_id: str):
 @router.patch("/{application_id}")
 async def update(application_id: str, body: ApplicationUpdate):
     if body.status:
-        app = update_application_status(application_id, body.status, body.notes)
+        app = await update_application_status(application_id, body.status, body.notes)
         return app
     return {"error": "Nothing to update"}
@@ -1,16 +1,65 @@
 """Job listing routes."""
 
-from fastapi import APIRouter
-from mcp_server.tools.job_boards import search_arbetsformedlingen, search_adzuna, search_remoteok
-from mcp_server.tools.database import save_job, get_jobs, get_job
+import json
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from mcp_server.tools.search import search_all_sources, store_results, stream_all_sources
+from mcp_server.tools.search_cache import search_cache
+from mcp_server.tools.quota import scheduler
+from mcp_server.tools.async_database import (
+    run,
+    get_jobs,
+    get_job,
+    get_or_create_default_user,
+    get_primary_resume,
+    get_resume_skills,
+    save_jobs_bulk,
+    search_saved_jobs,
+)
+from mcp_server.tools.skill_index import SKILL_MATCH_MIN_SCORE, find_jobs_by_skills
+from mcp_server.tools.skills import normalize_skills, skill_names
 
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
 
 @router.get("")
-async def list_jobs(limit: int = 50):
-    jobs = get_jobs(limit=limit)
-    return {"count": len(jobs), "jobs": jobs}
+async def list_jobs(limit: int = Query(50, ge=1, le=500), q: str | None = None, cursor: str | None = None):
+    """List saved jobs, newest first, or ranked full-text matches for ``q``.
+
+    Newest-first listings are paged: pass ``next_cursor`` back as ``cursor``
+    for the following page. Ranked ``q`` results are a single page, so
+    ``cursor`` is rejected there.
+    """
+    if q:
+        if cursor:
+            raise HTTPException(status_code=400, detail="cursor cannot be combined with q")
+        jobs, next_cursor = await search_saved_jobs(q, limit=limit), None
+    else:
+        try:
+            jobs, next_cursor = await get_jobs(limit=limit, cursor=cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    return {"count": len(jobs), "jobs": jobs, "next_cursor": next_cursor}
+
+
+@router.get("/by-skills")
+async def jobs_by_skills(
+    skills: str = "", limit: int = Query(50, ge=1, le=500), min_score: float = SKILL_MATCH_MIN_SCORE,
+):
+    """Stored jobs ranked by weighted skill overlap, without any LLM call.
+
+    ``skills`` is a comma-separated list of skill names or aliases; when
+    empty, the skills extracted from the primary resume are used.
+    """
+    if skills:
+        skill_ids = normalize_skills(skills.split(","))
+    else:
+        user = await get_or_create_default_user()
+        resume = await get_primary_resume(user["id"])
+        skill_ids = await get_resume_skills(resume["id"]) if resume else []
+    jobs = await run(find_jobs_by_skills, skill_ids, limit=limit, min_score=min_score)
+    return {"skills": skill_names(skill_ids), "count": len(jobs), "jobs": jobs}
 
 
 @router.get("/search")
@@ -20,25 +69,63 @@ async def search(
     remote_only: bool = False,
     limit: int = 10,
 ):
-    results = []
+    result = await search_all_sources(
+        keywords=keywords,
+        location=location,
+        remote_only=remote_only,
+        limit=limit,
+    )
+
+    saved = await run(store_results, result)
+    return {"count": len(saved), "jobs": saved, "sources": result["sources"]}
+
+
+@router.get("/search/stream")
+async def search_stream(
+    keywords: str = "python",
+    location: str = "",
+    remote_only: bool = False,
+    limit: int = 100,
+):
+    """Stream search results as NDJSON while later pages are still downloading.
+
+    Emits one ``{"type": "job"}`` line per saved job, a ``source_done`` line
+    per board with timing/error metadata, and a final ``done`` line.
+    """
+    async def ndjson():
+        count = 0
+        async for event in stream_all_sources(
+            keywords=keywords,
+            location=location,
+            remote_only=remote_only,
+            max_results=limit,
+        ):
+            if event["type"] == "page":
+                for job in await save_jobs_bulk(event["jobs"]):
+                    count += 1
+                    yield json.dumps({"type": "job", "source": event["source"], "job": job}, default=str) + "\n"
+            else:
+                yield json.dumps(event, default=str) + "\n"
+        yield json.dumps({"type": "done", "count": count}) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
 
-    # Arbetsförmedlingen (Swedish jobs) - FREE, primary source
-    if not remote_only:
-        af_jobs = await search_arbetsformedlingen(keywords=keywords, limit=limit)
-        results.extend(af_jobs)
+@router.get("/cache/stats")
+async def cache_stats():
+    """Hit-rate counters for the job board response cache."""
+    return search_cache.stats()
 
-    # RemoteOK (remote/tech jobs)
-    tag = keywords.split()[0].lower() if keywords else "python"
-    remoteok = await search_remoteok(tags=tag, limit=limit)
-    results.extend(remoteok)
 
-    saved = [save_job(j) for j in results]
-    return {"count": len(saved), "jobs": saved}
+@router.get("/quotas")
+async def quotas():
+    """Token-bucket state and remaining monthly budget per job board."""
+    return await scheduler.stats()
 
 
 @router.get("/{job_id}")
 async def get_job_detail(job_id: str):
-    job = get_job(job_id)
+    job = await get_job(job_id)
     if not job:
         return {"error": "Not found"}, 404
     return job
@@ -1,51 +1,110 @@
 """Resume upload and management routes."""
 
-import shutil
+import hashlib
+import json
+import os
+import tempfile
 from pathlib import Path
-from fastapi import APIRouter, UploadFile, File
+from fastapi import APIRouter, HTTPException, UploadFile, File
 
-from mcp_server.tools.database import (
+from mcp_server.tools.async_database import (
     get_or_create_default_user,
+    find_resume_by_hash,
     save_resume,
+    set_primary_resume,
     get_resumes,
     get_primary_resume,
 )
-from mcp_server.tools.resume_parser import parse_resume
+from mcp_server.tools.resume_parser import HASH_CHUNK, ResumeParseError, parse_resume_async
+from mcp_server.tools.skills import extract_skills
 
 router = APIRouter(prefix="/api/resumes", tags=["resumes"])
 
 UPLOAD_DIR = Path("data/uploads")
 
 
+async def _store_upload(file: UploadFile) -> tuple[str, Path]:
+    """Stream an upload to disk, hashing as it goes; stored once per distinct content.
+
+    Returns (sha256, path), where path is ``UPLOAD_DIR/<sha256><ext>``.
+    """
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    fd, tmp = tempfile.mkstemp(dir=UPLOAD_DIR, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while chunk := await file.read(HASH_CHUNK):
+                digest.update(chunk)
+                f.write(chunk)
+        # Keep the extension: the parser picks PDF/DOCX/text by suffix
+        path = UPLOAD_DIR / f"{digest.hexdigest()}{Path(file.filename or '').suffix.lower()}"
+        if path.exists():
+            os.remove(tmp)
+        else:
+            os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return digest.hexdigest(), path
+
+
+def _upload_response(resume: dict, duplicate: bool) -> dict:
+    sections = json.loads(resume["parsed_data"]) if resume["parsed_data"] else {}
+    return {
+        "resume_id": resume["id"],
+        "filename": resume["filename"],
+        "sections": list(sections.keys()),
+        "duplicate": duplicate,
+    }
+
+
 @router.get("")
 async def list_resumes():
-    user = get_or_create_default_user()
-    resumes = get_resumes(user["id"])
+    user = await get_or_create_default_user()
+    resumes = await get_resumes(user["id"])
     return {"count": len(resumes), "resumes": resumes}
 
 
 @router.post("/upload")
 async def upload_resume(file: UploadFile = File(...)):
-    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-    file_path = UPLOAD_DIR / file.filename
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+    """Store, parse and save a resume; re-uploading the same file returns the existing one."""
+    file_hash, file_path = await _store_upload(file)
+    user = await get_or_create_default_user()
+
+    existing = await find_resume_by_hash(file_hash, user_id=user["id"])
+    if existing:
+        return _upload_response(await set_primary_resume(user["id"], existing["id"]), duplicate=True)
+
+    # Same file uploaded by someone else: its parse result is reusable as-is
+    cached = await find_resume_by_hash(file_hash)
+    if cached:
+        parsed = {
+            "sections": json.loads(cached["parsed_data"] or "{}"),
+            "raw_text": cached["raw_text"],
+            "skills": extract_skills(cached["raw_text"]),
+        }
+    else:
+        try:
+            parsed = await parse_resume_async(str(file_path))
+        except ResumeParseError as e:
+            raise HTTPException(status_code=422, detail=f"Could not parse resume: {e}")
 
-    parsed = parse_resume(str(file_path))
-    user = get_or_create_default_user()
-    saved = save_resume(
+    saved = await save_resume(
         user_id=user["id"],
         filename=file.filename,
         parsed_data=parsed["sections"],
         raw_text=parsed["raw_text"],
+        file_hash=file_hash,
+        skills=parsed["skills"],
     )
-    return {"resume_id": saved["id"], "filename": file.filename, "sections": list(parsed["sections"].keys())}
+    return _upload_response(saved, duplicate=False)
 
 
 @router.get("/primary")
 async def get_primary():
-    user = get_or_create_default_user()
-    resume = get_primary_resume(user["id"])
+    user = await get_or_create_default_user()
+    resume = await get_primary_resume(user["id"])
     if not resume:
         return {"error": "No resume uploaded yet"}
     return resume
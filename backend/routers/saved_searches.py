@@ -0,0 +1,55 @@
+"""Saved search routes — searches the background scheduler keeps refreshed."""
+
+from fastapi import APIRouter, HTTPException
+
+from backend.scheduler import ingest_scheduler
+from backend.schemas import SavedSearchCreate
+from mcp_server.tools.async_database import (
+    create_saved_search,
+    delete_saved_search,
+    get_or_create_default_user,
+    get_saved_search,
+    get_saved_searches,
+)
+
+router = APIRouter(prefix="/api/saved-searches", tags=["saved-searches"])
+
+
+@router.get("")
+async def list_saved_searches():
+    user = await get_or_create_default_user()
+    searches = await get_saved_searches(user["id"])
+    return {"count": len(searches), "saved_searches": searches}
+
+
+@router.post("")
+async def create(body: SavedSearchCreate):
+    """Save a search; it is due immediately and then every ``interval_s`` seconds."""
+    user = await get_or_create_default_user()
+    return await create_saved_search(
+        user_id=user["id"],
+        keywords=body.keywords,
+        location=body.location,
+        source=body.source,
+        remote_only=body.remote_only,
+        interval_s=body.interval_s,
+    )
+
+
+@router.post("/{search_id}/refresh")
+async def refresh(search_id: str):
+    """Fetch new postings for a saved search now instead of waiting for its next run."""
+    search = await get_saved_search(search_id)
+    if not search:
+        raise HTTPException(status_code=404, detail="Saved search not found")
+    if ingest_scheduler.is_running(search_id):
+        # Its postings are already being fetched; a second ingest would race the watermarks
+        raise HTTPException(status_code=409, detail="Saved search is already refreshing")
+    return await ingest_scheduler.refresh(search)
+
+
+@router.delete("/{search_id}")
+async def delete(search_id: str):
+    if not await delete_saved_search(search_id):
+        raise HTTPException(status_code=404, detail="Saved search not found")
+    return {"deleted": True}
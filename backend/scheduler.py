@@ -0,0 +1,96 @@
+"""Background refresh of saved searches.
+
+Runs inside the FastAPI lifespan. Every tick it picks up the saved searches
+that are due and fetches only postings newer than each board's watermark,
+so interactive requests can read fresh jobs from the local store instead of
+waiting on the remote boards.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import UTC, datetime, timedelta
+
+from mcp_server.tools.async_database import (
+    get_due_saved_searches,
+    get_search_watermarks,
+    record_saved_search_run,
+    run,
+    save_jobs_bulk,
+)
+from mcp_server.tools.search import ingest_new_jobs
+from mcp_server.tools.skill_index import skill_index
+
+logger = logging.getLogger(__name__)
+
+INGEST_SCHEDULER_ENABLED = os.getenv("INGEST_SCHEDULER_ENABLED", "true").lower() in ("1", "true", "yes")
+INGEST_TICK_S = float(os.getenv("INGEST_TICK_S", "60"))
+INGEST_CONCURRENCY = int(os.getenv("INGEST_CONCURRENCY", "2"))
+INGEST_MAX_RESULTS = int(os.getenv("INGEST_MAX_RESULTS", "200"))
+
+
+class IngestScheduler:
+    """Periodically refreshes due saved searches, a few at a time."""
+
+    def __init__(self, tick: float = INGEST_TICK_S, concurrency: int = INGEST_CONCURRENCY):
+        self.tick = tick
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._running: set[str] = set()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None and INGEST_SCHEDULER_ENABLED:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_due()
+            except Exception:
+                logger.exception("Saved search refresh failed")
+            await asyncio.sleep(self.tick)
+
+    def is_running(self, search_id: str) -> bool:
+        return search_id in self._running
+
+    async def run_due(self) -> int:
+        """Refresh every due saved search that isn't already running; returns how many ran."""
+        now = datetime.now(UTC).isoformat()
+        due = [s for s in await get_due_saved_searches(now) if s["id"] not in self._running]
+        await asyncio.gather(*[self.refresh(search) for search in due])
+        return len(due)
+
+    async def refresh(self, search: dict) -> dict:
+        """Fetch and store new postings for one saved search, then advance its watermarks."""
+        self._running.add(search["id"])
+        try:
+            async with self._semaphore:
+                result = await ingest_new_jobs(
+                    keywords=search["keywords"],
+                    location=search["location"],
+                    source=search["source"],
+                    remote_only=bool(search["remote_only"]),
+                    watermarks=await get_search_watermarks(search["id"]),
+                    max_results=INGEST_MAX_RESULTS,
+                )
+                saved = await save_jobs_bulk(result["jobs"])
+                next_run = datetime.now(UTC) + timedelta(seconds=search["interval_s"])
+                await record_saved_search_run(search["id"], result["sources"], next_run.isoformat())
+                # Reload the skill index here rather than in the next user request
+                await run(skill_index.refresh)
+        finally:
+            self._running.discard(search["id"])
+        return {"count": len(saved), "sources": result["sources"]}
+
+
+ingest_scheduler = IngestScheduler()
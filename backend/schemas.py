@@ -1,7 +1,9 @@
 """Pydantic schemas for API request/response."""
 
 from datetime import datetime
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 
 
 # ── Jobs ──
@@ -36,6 +38,15 @@ class JobMatchOut(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class SavedSearchCreate(BaseModel):
+    keywords: str
+    location: str = ""
+    source: Literal["all", "arbetsformedlingen", "remoteok", "adzuna"] = "all"
+    remote_only: bool = False
+    # Floor keeps one saved search from hammering the boards' rate limits
+    interval_s: int = Field(3600, ge=60)
+
+
 # ── Applications ──
 
 class ApplicationCreate(BaseModel):
@@ -116,6 +127,19 @@ class AgentRunRequest(BaseModel):
     params: dict = {}
 
 
-class AgentRunResponse(BaseModel):
+class AgentRunQueued(BaseModel):
+    run_id: str
     status: str
-    result: dict
+
+
+class AgentRunOut(BaseModel):
+    id: str
+    action: str
+    params: dict
+    status: str  # "queued", "running", "completed", "failed"
+    result: dict | None = None
+    error: str | None = None
+    attempts: int
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
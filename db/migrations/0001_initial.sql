@@ -0,0 +1,268 @@
+-- Baseline schema. Databases created before versioned migrations are
+-- brought up to this point too: every statement is idempotent, and the
+-- runner adds columns those older databases lack before this file runs.
+
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    email TEXT UNIQUE NOT NULL,
+    name TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS resumes (
+    id TEXT PRIMARY KEY,
+    user_id TEXT REFERENCES users(id),
+    filename TEXT NOT NULL,
+    parsed_data JSON,
+    raw_text TEXT,
+    is_primary BOOLEAN DEFAULT FALSE,
+    content_hash TEXT,  -- sha256 of the uploaded file; stored as data/uploads/<hash><ext>
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS preferences (
+    id TEXT PRIMARY KEY,
+    user_id TEXT REFERENCES users(id),
+    target_roles JSON,
+    target_locations JSON,
+    salary_min INTEGER,
+    salary_max INTEGER,
+    remote_preference TEXT DEFAULT 'any',
+    industries JSON,
+    excluded_companies JSON,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    source_id TEXT,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    company_url TEXT,
+    location TEXT,
+    is_remote BOOLEAN,
+    salary_min INTEGER,
+    salary_max INTEGER,
+    description TEXT,
+    requirements JSON,
+    posted_at TIMESTAMP,
+    raw_data JSON,
+    canonical_id TEXT,  -- id of the first-seen job for the same real position
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(source, source_id)
+);
+
+-- MinHash signature per job, and its LSH band buckets ("band:hash") for
+-- finding near-duplicate postings across sources
+CREATE TABLE IF NOT EXISTS job_signatures (
+    job_id TEXT PRIMARY KEY REFERENCES jobs(id),
+    signature BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS job_lsh_buckets (
+    bucket TEXT NOT NULL,
+    job_id TEXT NOT NULL REFERENCES jobs(id),
+    PRIMARY KEY (bucket, job_id)
+) WITHOUT ROWID;
+
+-- Full-text index over jobs. External content: rows live in jobs, keyed by
+-- jobs.rowid, and the triggers below keep the index in sync. An explicit
+-- VACUUM can renumber jobs.rowid; run rebuild_job_index() after one.
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, location, description,
+    content='jobs', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, company, location, description)
+    VALUES (new.rowid, new.title, new.company, new.location, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+    VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, location, description ON jobs
+WHEN old.title IS NOT new.title OR old.company IS NOT new.company
+  OR old.location IS NOT new.location OR old.description IS NOT new.description
+BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+    VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description);
+    INSERT INTO jobs_fts(rowid, title, company, location, description)
+    VALUES (new.rowid, new.title, new.company, new.location, new.description);
+END;
+
+-- Searches refreshed in the background; each run only fetches postings
+-- newer than the per-board watermark
+CREATE TABLE IF NOT EXISTS saved_searches (
+    id TEXT PRIMARY KEY,
+    user_id TEXT REFERENCES users(id),
+    keywords TEXT NOT NULL,
+    location TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT 'all',
+    remote_only BOOLEAN DEFAULT FALSE,
+    interval_s INTEGER NOT NULL DEFAULT 3600,
+    enabled BOOLEAN DEFAULT TRUE,
+    last_run_at TIMESTAMP,
+    next_run_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS saved_search_watermarks (
+    search_id TEXT NOT NULL REFERENCES saved_searches(id),
+    source TEXT NOT NULL,
+    watermark TEXT,  -- newest posted_at seen on this board
+    last_count INTEGER DEFAULT 0,
+    last_error TEXT,
+    updated_at TIMESTAMP,
+    PRIMARY KEY (search_id, source)
+);
+
+-- Skill dictionary (synced from mcp_server/data/skills.json on startup) and
+-- the normalized skills extracted from each job and resume
+CREATE TABLE IF NOT EXISTS skills (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    category TEXT,
+    version TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS job_skills (
+    job_id TEXT NOT NULL REFERENCES jobs(id),
+    skill_id TEXT NOT NULL REFERENCES skills(id),
+    PRIMARY KEY (job_id, skill_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills(skill_id);
+
+-- Bumped in the same transaction as writes to the table it names, so each
+-- process can tell when its in-memory copy (e.g. the skill index) is stale
+CREATE TABLE IF NOT EXISTS index_versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS resume_skills (
+    resume_id TEXT NOT NULL REFERENCES resumes(id),
+    skill_id TEXT NOT NULL REFERENCES skills(id),
+    PRIMARY KEY (resume_id, skill_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS job_matches (
+    id TEXT PRIMARY KEY,
+    user_id TEXT REFERENCES users(id),
+    job_id TEXT REFERENCES jobs(id),
+    match_score REAL,
+    lexical_score REAL,
+    match_reasons JSON,
+    skills_matched JSON,
+    skills_missing JSON,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, job_id)
+);
+
+-- LLM match results memoized by content: (resume text, job content, prompt version)
+CREATE TABLE IF NOT EXISTS match_cache (
+    resume_hash TEXT NOT NULL,
+    job_hash TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    user_id TEXT REFERENCES users(id),
+    result JSON NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (resume_hash, job_hash, prompt_version)
+);
+
+CREATE TABLE IF NOT EXISTS applications (
+    id TEXT PRIMARY KEY,
+    user_id TEXT REFERENCES users(id),
+    job_id TEXT REFERENCES jobs(id),
+    resume_id TEXT REFERENCES resumes(id),
+    status TEXT NOT NULL DEFAULT 'saved',
+    cover_letter TEXT,
+    tailored_resume JSON,
+    applied_at TIMESTAMP,
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Durable queue of agent workflow runs. Workers claim queued runs and
+-- heartbeat while running; a run whose heartbeat stops is requeued.
+CREATE TABLE IF NOT EXISTS agent_runs (
+    id TEXT PRIMARY KEY,
+    action TEXT NOT NULL,
+    params JSON,
+    status TEXT NOT NULL DEFAULT 'queued',  -- queued, running, completed, failed
+    result JSON,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    heartbeat_at TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS application_events (
+    id TEXT PRIMARY KEY,
+    application_id TEXT REFERENCES applications(id),
+    event_type TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT,
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS reminders (
+    id TEXT PRIMARY KEY,
+    application_id TEXT REFERENCES applications(id),
+    reminder_date TIMESTAMP NOT NULL,
+    message TEXT,
+    is_completed BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS documents (
+    id TEXT PRIMARY KEY,
+    application_id TEXT REFERENCES applications(id),
+    doc_type TEXT NOT NULL,
+    content TEXT,
+    version INTEGER DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS search_cache (
+    cache_key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    jobs JSON NOT NULL,
+    stored_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS source_quota_usage (
+    source TEXT NOT NULL,
+    period TEXT NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (source, period)
+);
+
+CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
+-- Keyset pagination: listings seek on (created_at, id) / (updated_at, id)
+DROP INDEX IF EXISTS idx_applications_user;
+CREATE INDEX IF NOT EXISTS idx_applications_user_updated ON applications(user_id, updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_applications_user_status_updated ON applications(user_id, status, updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+CREATE INDEX IF NOT EXISTS idx_job_lsh_buckets_job ON job_lsh_buckets(job_id);
+CREATE INDEX IF NOT EXISTS idx_saved_searches_due ON saved_searches(next_run_at) WHERE enabled = TRUE;
+CREATE INDEX IF NOT EXISTS idx_agent_runs_status ON agent_runs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_match_cache_user ON match_cache(user_id, resume_hash);
+CREATE INDEX IF NOT EXISTS idx_search_cache_stored ON search_cache(stored_at);
+CREATE INDEX IF NOT EXISTS idx_reminders_date ON reminders(reminder_date) WHERE is_completed = FALSE;
+CREATE INDEX IF NOT EXISTS idx_jobs_canonical ON jobs(canonical_id);
+CREATE INDEX IF NOT EXISTS idx_resumes_hash ON resumes(content_hash);
+
+-- Index any jobs saved before the full-text table existed
+INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild');
@@ -0,0 +1,5 @@
+-- Indexes for hot lookups that were scanning or sorting
+CREATE INDEX IF NOT EXISTS idx_application_events_app ON application_events(application_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_documents_app ON documents(application_id, doc_type, version);
+CREATE INDEX IF NOT EXISTS idx_resumes_user_primary ON resumes(user_id, is_primary, created_at);
+CREATE INDEX IF NOT EXISTS idx_saved_searches_user ON saved_searches(user_id, created_at);
@@ -0,0 +1,32 @@
+-- Per-user count of applications in each status, kept in step with
+-- applications by triggers so pipeline summaries never count rows
+CREATE TABLE IF NOT EXISTS application_status_counts (
+    user_id TEXT NOT NULL DEFAULT '',  -- '' for applications without a user
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, status)
+) WITHOUT ROWID;
+
+INSERT INTO application_status_counts (user_id, status, count)
+SELECT COALESCE(user_id, ''), status, COUNT(*) FROM applications GROUP BY 1, 2;
+
+CREATE TRIGGER IF NOT EXISTS applications_counts_ai AFTER INSERT ON applications BEGIN
+    INSERT INTO application_status_counts (user_id, status, count)
+    VALUES (COALESCE(new.user_id, ''), new.status, 1)
+    ON CONFLICT (user_id, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS applications_counts_ad AFTER DELETE ON applications BEGIN
+    UPDATE application_status_counts SET count = count - 1
+    WHERE user_id = COALESCE(old.user_id, '') AND status = old.status;
+END;
+
+CREATE TRIGGER IF NOT EXISTS applications_counts_au AFTER UPDATE OF user_id, status ON applications
+WHEN old.user_id IS NOT new.user_id OR old.status IS NOT new.status
+BEGIN
+    UPDATE application_status_counts SET count = count - 1
+    WHERE user_id = COALESCE(old.user_id, '') AND status = old.status;
+    INSERT INTO application_status_counts (user_id, status, count)
+    VALUES (COALESCE(new.user_id, ''), new.status, 1)
+    ON CONFLICT (user_id, status) DO UPDATE SET count = count + 1;
+END;
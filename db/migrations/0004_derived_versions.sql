@@ -0,0 +1,7 @@
+-- Format version of data derived in Python from stored rows (e.g. MinHash
+-- signatures). On startup a stored version that differs from the code's
+-- triggers a rebuild; a missing row counts as out of date.
+CREATE TABLE IF NOT EXISTS derived_versions (
+    name TEXT PRIMARY KEY,
+    version TEXT NOT NULL
+);
@@ -3,7 +3,7 @@
 import { useQuery } from "@tanstack/react-query";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
-import { getApplications, getJobs } from "@/lib/api";
+import { getApplicationSummary, getApplications, getJobs } from "@/lib/api";
 import { Briefcase, FileText, Clock, Trophy } from "lucide-react";
 import Link from "next/link";
 
@@ -13,18 +13,22 @@ export default function Dashboard() {
     queryFn: () => getApplications(),
   });
 
+  const { data: summary } = useQuery({
+    queryKey: ["applications", "summary"],
+    queryFn: () => getApplicationSummary(),
+  });
+
   const { data: jobs } = useQuery({
     queryKey: ["jobs"],
     queryFn: () => getJobs(),
   });
 
+  const byStatus = summary?.by_status ?? {};
   const counts = {
-    saved: apps?.applications.filter((a) => a.status === "saved").length || 0,
-    applied: apps?.applications.filter((a) => a.status === "applied").length || 0,
-    interview: apps?.applications.filter((a) =>
-      ["phone_screen", "interview"].includes(a.status)
-    ).length || 0,
-    offer: apps?.applications.filter((a) => a.status === "offer").length || 0,
+    saved: byStatus.saved || 0,
+    applied: byStatus.applied || 0,
+    interview: (byStatus.phone_screen || 0) + (byStatus.interview || 0),
+    offer: byStatus.offer || 0,
   };
 
   return (
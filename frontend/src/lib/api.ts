@@ -18,15 +18,56 @@ export const searchJobs = (params: { keywords: string; location?: string; remote
     `/api/jobs/search?keywords=${encodeURIComponent(params.keywords)}&location=${params.location || ""}&remote_only=${params.remote_only || false}`
   );
 
-export const getJobs = () => fetcher<{ count: number; jobs: Job[] }>("/api/jobs");
+// Streams NDJSON from /api/jobs/search/stream, calling onJob as each saved job arrives
+export const streamSearchJobs = async (
+  params: { keywords: string; location?: string; remote_only?: boolean; limit?: number },
+  onJob: (job: Job) => void
+): Promise<number> => {
+  const query = `keywords=${encodeURIComponent(params.keywords)}&location=${params.location || ""}&remote_only=${params.remote_only || false}&limit=${params.limit || 100}`;
+  const res = await fetch(`${API_BASE}/api/jobs/search/stream?${query}`);
+  if (!res.ok || !res.body) throw new Error(`API error: ${res.status}`);
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let count = 0;
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split("\n");
+    buffer = lines.pop() || "";
+    for (const line of lines) {
+      if (!line.trim()) continue;
+      const event = JSON.parse(line);
+      if (event.type === "job") onJob(event.job as Job);
+      if (event.type === "done") count = event.count;
+    }
+  }
+  return count;
+};
+
+// Pass next_cursor from the previous response to fetch the following page
+export const getJobs = (cursor?: string) =>
+  fetcher<{ count: number; jobs: Job[]; next_cursor: string | null }>(
+    `/api/jobs${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ""}`
+  );
 
 export const getJob = (id: string) => fetcher<Job>(`/api/jobs/${id}`);
 
 // Applications
-export const getApplications = (status?: string) =>
-  fetcher<{ count: number; applications: Application[] }>(
-    `/api/applications${status ? `?status=${status}` : ""}`
+export const getApplications = (status?: string, cursor?: string) => {
+  const query = new URLSearchParams();
+  if (status) query.set("status", status);
+  if (cursor) query.set("cursor", cursor);
+  const qs = query.toString();
+  return fetcher<{ count: number; applications: Application[]; next_cursor: string | null }>(
+    `/api/applications${qs ? `?${qs}` : ""}`
   );
+};
+
+export const getApplicationSummary = () =>
+  fetcher<{ total: number; by_status: Record<string, number> }>("/api/applications/summary");
 
 export const createApplication = (jobId: string) =>
   fetcher<Application>("/api/applications", {
@@ -57,11 +98,58 @@ export const uploadResume = async (file: File) => {
 export const getResumes = () => fetcher<{ count: number; resumes: Resume[] }>("/api/resumes");
 
 // Agent
-export const runAgent = (action: string, params: Record<string, unknown>) =>
-  fetcher<AgentResult>("/api/agent/run", {
+export const getAgentRun = (id: string) => fetcher<AgentRun>(`/api/agent/runs/${id}`);
+
+// Queues a run, then polls until it completes or fails
+export const runAgent = async (
+  action: string,
+  params: Record<string, unknown>,
+  pollMs = 1000,
+  timeoutMs = 10 * 60 * 1000
+): Promise<AgentResult> => {
+  const { run_id } = await fetcher<{ run_id: string; status: string }>("/api/agent/run", {
     method: "POST",
     body: JSON.stringify({ action, params }),
   });
+  const deadline = Date.now() + timeoutMs;
+  while (Date.now() < deadline) {
+    const run = await getAgentRun(run_id);
+    if (run.status === "completed" && run.result) return { status: run.status, result: run.result };
+    if (run.status === "failed") throw new Error(run.error || "Agent run failed");
+    await new Promise((resolve) => setTimeout(resolve, pollMs));
+  }
+  throw new Error(`Agent run ${run_id} did not finish within ${Math.round(timeoutMs / 1000)}s`);
+};
+
+// Streams server-sent events from /api/agent/run/stream, calling onEvent for each one
+export const streamAgent = async (
+  action: string,
+  params: Record<string, unknown>,
+  onEvent: (type: string, data: Record<string, unknown>) => void
+) => {
+  const res = await fetch(`${API_BASE}/api/agent/run/stream`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ action, params }),
+  });
+  if (!res.ok || !res.body) throw new Error(`API error: ${res.status}`);
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const messages = buffer.split("\n\n");
+    buffer = messages.pop() || "";
+    for (const message of messages) {
+      const type = message.match(/^event: (.*)$/m)?.[1];
+      const data = message.match(/^data: (.*)$/m)?.[1];
+      if (type && data) onEvent(type, JSON.parse(data));
+    }
+  }
+};
 
 // Types
 export interface Job {
@@ -125,6 +213,19 @@ export interface AgentResult {
   };
 }
 
+export interface AgentRun {
+  id: string;
+  action: string;
+  params: Record<string, unknown>;
+  status: "queued" | "running" | "completed" | "failed";
+  result: AgentResult["result"] | null;
+  error: string | null;
+  attempts: number;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+}
+
 export interface MatchScore {
   job_id: string;
   job_title: string;
@@ -7,20 +7,24 @@ and application tracking via the Model Context Protocol.
 import json
 import sys
 import os
+from contextlib import asynccontextmanager
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from mcp.server.fastmcp import FastMCP
 
-from tools.job_boards import search_arbetsformedlingen, search_adzuna, search_remoteok
-from tools.resume_parser import parse_resume as _parse_resume
-from tools.database import (
-    init_db_sync,
+from tools.search import search_all_sources, store_results
+from tools.http_client import aclose_clients
+from tools.resume_parser import ResumeParseError, hash_file, parse_resume_async, shutdown_parse_pool
+from tools.database import init_db_sync
+from tools.async_database import (
+    run,
+    shutdown_executor,
     get_or_create_default_user,
-    save_job,
     get_jobs,
     get_job,
+    search_saved_jobs,
     create_application,
     update_application_status,
     get_applications,
@@ -28,12 +32,25 @@ from tools.database import (
     get_application_events,
     save_document,
     save_resume,
+    set_primary_resume,
+    find_resume_by_hash,
     get_primary_resume,
-    get_resumes,
+    get_resume_skills,
     save_match,
 )
+from tools.skill_index import find_jobs_by_skills
+from tools.skills import normalize_skills, skill_names
 
-mcp = FastMCP("job-assistant", instructions="Job application assistant MCP server")
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    yield
+    await aclose_clients()
+    shutdown_parse_pool()
+    shutdown_executor()
+
+
+mcp = FastMCP("job-assistant", instructions="Job application assistant MCP server", lifespan=lifespan)
 
 # Init DB on startup
 init_db_sync()
@@ -60,33 +77,21 @@ async def search_jobs(
         source: "arbetsformedlingen", "remoteok", "adzuna", or "all"
         limit: Max results per source
     """
-    results = []
-
-    # Arbetsförmedlingen (Swedish jobs) - FREE, primary source
-    if source in ("all", "arbetsformedlingen") and not remote_only:
-        af_jobs = await search_arbetsformedlingen(keywords=keywords, limit=limit)
-        results.extend(af_jobs)
-
-    # RemoteOK (remote jobs only)
-    if source in ("all", "remoteok") or remote_only:
-        tag = keywords.split()[0].lower() if keywords else "python"
-        remoteok_jobs = await search_remoteok(tags=tag, limit=limit)
-        results.extend(remoteok_jobs)
-
-    # Adzuna (requires API key)
-    if not remote_only and source in ("all", "adzuna"):
-        adzuna_jobs = await search_adzuna(keywords=keywords, location=location, results_per_page=limit)
-        results.extend(adzuna_jobs)
-
-    # Save to database
-    saved = []
-    for job in results:
-        saved_job = save_job(job)
-        saved.append(saved_job)
+    result = await search_all_sources(
+        keywords=keywords,
+        location=location,
+        remote_only=remote_only,
+        source=source,
+        limit=limit,
+    )
+
+    # Save to database in one transaction
+    saved = await run(store_results, result)
 
     return json.dumps({
         "count": len(saved),
         "jobs": saved[:limit * 2],
+        "sources": result["sources"],
     }, default=str)
 
 
@@ -97,23 +102,59 @@ async def get_job_details(job_id: str) -> str:
     Args:
         job_id: The database ID of the job
     """
-    job = get_job(job_id)
+    job = await get_job(job_id)
     if not job:
         return json.dumps({"error": "Job not found"})
     return json.dumps(job, default=str)
 
 
 @mcp.tool()
-async def list_saved_jobs(limit: int = 50) -> str:
-    """List all saved jobs.
+async def list_saved_jobs(limit: int = 50, cursor: str = "") -> str:
+    """List saved jobs, newest first, one page at a time.
+
+    Args:
+        limit: Max number of jobs to return
+        cursor: next_cursor from the previous page (empty for the first page)
+    """
+    try:
+        jobs, next_cursor = await get_jobs(limit=max(limit, 1), cursor=cursor or None)
+    except ValueError as e:
+        return json.dumps({"error": str(e)})
+    return json.dumps({"count": len(jobs), "jobs": jobs, "next_cursor": next_cursor}, default=str)
+
+
+@mcp.tool()
+async def search_local_jobs(query: str, limit: int = 20) -> str:
+    """Full-text search over jobs already saved locally, best matches first.
+
+    Much faster than search_jobs and uses no job board quota.
 
     Args:
+        query: Words to match in title, company, location or description
         limit: Max number of jobs to return
     """
-    jobs = get_jobs(limit=limit)
+    jobs = await search_saved_jobs(query, limit=limit)
     return json.dumps({"count": len(jobs), "jobs": jobs}, default=str)
 
 
+@mcp.tool()
+async def find_jobs_matching_skills(skills: list[str] | None = None, limit: int = 20) -> str:
+    """Rank saved jobs by overlap with a skill set, instantly and without an LLM.
+
+    Args:
+        skills: Skill names or aliases (e.g. ["Python", "Postgres", "k8s"]); defaults to the primary resume's skills
+        limit: Max number of jobs to return
+    """
+    if skills:
+        skill_ids = normalize_skills(skills)
+    else:
+        user = await get_or_create_default_user()
+        resume = await get_primary_resume(user["id"])
+        skill_ids = await get_resume_skills(resume["id"]) if resume else []
+    jobs = await run(find_jobs_by_skills, skill_ids, limit=limit)
+    return json.dumps({"skills": skill_names(skill_ids), "count": len(jobs), "jobs": jobs}, default=str)
+
+
 # ════════════════════════════════════════
 # Resume Tools
 # ════════════════════════════════════════
@@ -125,13 +166,25 @@ async def parse_and_save_resume(file_path: str) -> str:
     Args:
         file_path: Path to the resume file
     """
-    parsed = _parse_resume(file_path)
-    user = get_or_create_default_user()
-    saved = save_resume(
+    user = await get_or_create_default_user()
+    file_hash = await run(hash_file, file_path)
+    existing = await find_resume_by_hash(file_hash, user_id=user["id"])
+    if existing:
+        await set_primary_resume(user["id"], existing["id"])
+        sections = json.loads(existing["parsed_data"] or "{}")
+        return json.dumps({"resume_id": existing["id"], "sections": list(sections.keys()), "duplicate": True})
+
+    try:
+        parsed = await parse_resume_async(file_path)
+    except ResumeParseError as e:
+        return json.dumps({"error": f"Could not parse resume: {e}"})
+    saved = await save_resume(
         user_id=user["id"],
         filename=parsed["filename"],
         parsed_data=parsed["sections"],
         raw_text=parsed["raw_text"],
+        file_hash=file_hash,
+        skills=parsed["skills"],
     )
     return json.dumps({"resume_id": saved["id"], "sections": list(parsed["sections"].keys())}, default=str)
 
@@ -139,8 +192,8 @@ async def parse_and_save_resume(file_path: str) -> str:
 @mcp.tool()
 async def get_user_resume() -> str:
     """Get the current user's primary resume."""
-    user = get_or_create_default_user()
-    resume = get_primary_resume(user["id"])
+    user = await get_or_create_default_user()
+    resume = await get_primary_resume(user["id"])
     if not resume:
         return json.dumps({"error": "No resume found. Upload one first."})
     return json.dumps(resume, default=str)
@@ -157,9 +210,9 @@ async def create_job_application(job_id: str) -> str:
     Args:
         job_id: ID of the job to apply to
     """
-    user = get_or_create_default_user()
-    resume = get_primary_resume(user["id"])
-    app = create_application(
+    user = await get_or_create_default_user()
+    resume = await get_primary_resume(user["id"])
+    app = await create_application(
         user_id=user["id"],
         job_id=job_id,
         resume_id=resume["id"] if resume else None,
@@ -176,20 +229,27 @@ async def update_application(application_id: str, status: str, notes: str = "")
         status: New status (saved, applied, phone_screen, interview, offer, rejected, withdrawn)
         notes: Optional notes about the update
     """
-    app = update_application_status(application_id, status, notes or None)
+    app = await update_application_status(application_id, status, notes or None)
     return json.dumps(app, default=str)
 
 
 @mcp.tool()
-async def list_applications(status: str = "") -> str:
-    """List all job applications, optionally filtered by status.
+async def list_applications(status: str = "", limit: int = 50, cursor: str = "") -> str:
+    """List job applications, most recently updated first, optionally filtered by status.
 
     Args:
         status: Filter by status (empty for all)
+        limit: Max number of applications to return
+        cursor: next_cursor from the previous page (empty for the first page)
     """
-    user = get_or_create_default_user()
-    apps = get_applications(user["id"], status=status or None)
-    return json.dumps({"count": len(apps), "applications": apps}, default=str)
+    user = await get_or_create_default_user()
+    try:
+        apps, next_cursor = await get_applications(
+            user["id"], status=status or None, limit=max(limit, 1), cursor=cursor or None,
+        )
+    except ValueError as e:
+        return json.dumps({"error": str(e)})
+    return json.dumps({"count": len(apps), "applications": apps, "next_cursor": next_cursor}, default=str)
 
 
 @mcp.tool()
@@ -199,10 +259,10 @@ async def get_application_detail(application_id: str) -> str:
     Args:
         application_id: The application ID
     """
-    app = get_application(application_id)
+    app = await get_application(application_id)
     if not app:
         return json.dumps({"error": "Application not found"})
-    events = get_application_events(application_id)
+    events = await get_application_events(application_id)
     app["events"] = events
     return json.dumps(app, default=str)
 
@@ -219,7 +279,7 @@ async def save_cover_letter(application_id: str, content: str) -> str:
         application_id: The application ID
         content: The cover letter text
     """
-    doc = save_document(application_id, "cover_letter", content)
+    doc = await save_document(application_id, "cover_letter", content)
     return json.dumps(doc, default=str)
 
 
@@ -240,8 +300,8 @@ async def save_match_score(
         skills_matched: Skills that match
         skills_missing: Skills that are missing
     """
-    user = get_or_create_default_user()
-    result = save_match(user["id"], job_id, score, reasons, skills_matched, skills_missing)
+    user = await get_or_create_default_user()
+    result = await save_match(user["id"], job_id, score, reasons, skills_matched, skills_missing)
     return json.dumps(result, default=str)
 
 
@@ -252,8 +312,8 @@ async def save_match_score(
 @mcp.resource("user://profile")
 async def get_user_profile() -> str:
     """Current user's profile info."""
-    user = get_or_create_default_user()
-    resume = get_primary_resume(user["id"])
+    user = await get_or_create_default_user()
+    resume = await get_primary_resume(user["id"])
     return json.dumps({
         "user": user,
         "has_resume": resume is not None,
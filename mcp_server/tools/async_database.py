@@ -0,0 +1,118 @@
+"""Awaitable versions of the SQLite helpers in ``database``.
+
+The helpers in ``database`` block while SQLite works. Calling them straight
+from an ``async def`` handler stalls the event loop, and every other
+request with it, for the duration of each query. Here each helper runs on
+a dedicated thread pool instead. The pool is sized to the connection pool,
+so every thread can hold a pooled connection and queries never queue
+behind an unrelated blocking call on the default executor.
+
+Routers, agent nodes and MCP tools import from this module; synchronous
+code (worker processes, scripts, other helpers) keeps using ``database``.
+"""
+
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from . import database
+from .database import DB_POOL_SIZE
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=DB_POOL_SIZE, thread_name_prefix="db")
+    return _executor
+
+
+async def run(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking database-bound call on the database threads."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(fn, *args, **kwargs))
+
+
+def shutdown_executor() -> None:
+    """Wait for in-flight queries, then stop the database threads."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+def _offload(fn: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        return await run(fn, *args, **kwargs)
+    return wrapper
+
+
+# Users, resumes
+
+async def get_or_create_default_user() -> dict:
+    # Cache hits are answered inline; only a miss needs a database thread
+    user = database.profile_cache.user()
+    return user if user else await run(database.get_or_create_default_user)
+
+
+async def get_primary_resume(user_id: str) -> dict | None:
+    hit, resume = database.profile_cache.primary_resume(user_id)
+    return resume if hit else await run(database.get_primary_resume, user_id)
+
+
+save_resume = _offload(database.save_resume)
+set_primary_resume = _offload(database.set_primary_resume)
+find_resume_by_hash = _offload(database.find_resume_by_hash)
+get_resumes = _offload(database.get_resumes)
+get_resume_skills = _offload(database.get_resume_skills)
+
+# Jobs
+save_jobs_bulk = _offload(database.save_jobs_bulk)
+get_jobs = _offload(database.get_jobs)
+get_job = _offload(database.get_job)
+search_saved_jobs = _offload(database.search_saved_jobs)
+
+# Saved searches
+create_saved_search = _offload(database.create_saved_search)
+get_saved_searches = _offload(database.get_saved_searches)
+get_saved_search = _offload(database.get_saved_search)
+delete_saved_search = _offload(database.delete_saved_search)
+get_due_saved_searches = _offload(database.get_due_saved_searches)
+get_search_watermarks = _offload(database.get_search_watermarks)
+record_saved_search_run = _offload(database.record_saved_search_run)
+
+# Applications and documents
+create_application = _offload(database.create_application)
+update_application_status = _offload(database.update_application_status)
+get_applications = _offload(database.get_applications)
+get_application_status_counts = _offload(database.get_application_status_counts)
+get_application = _offload(database.get_application)
+get_application_events = _offload(database.get_application_events)
+save_document = _offload(database.save_document)
+find_position_document = _offload(database.find_position_document)
+
+# Agent runs
+enqueue_agent_run = _offload(database.enqueue_agent_run)
+get_agent_run = _offload(database.get_agent_run)
+claim_agent_run = _offload(database.claim_agent_run)
+heartbeat_agent_run = _offload(database.heartbeat_agent_run)
+finish_agent_run = _offload(database.finish_agent_run)
+requeue_agent_run = _offload(database.requeue_agent_run)
+recover_stale_agent_runs = _offload(database.recover_stale_agent_runs)
+
+# Matches
+save_match = _offload(database.save_match)
+get_cached_matches = _offload(database.get_cached_matches)
+put_cached_matches = _offload(database.put_cached_matches)
+
+# Search cache and board quotas
+get_cached_search = _offload(database.get_cached_search)
+put_cached_search = _offload(database.put_cached_search)
+get_quota_usage = _offload(database.get_quota_usage)
+increment_quota_usage = _offload(database.increment_quota_usage)
@@ -1,29 +1,249 @@
 """Database CRUD operations as MCP tool helpers."""
 
+import base64
 import uuid
+import hashlib
+import queue
 import sqlite3
 import json
+import logging
 import os
-from datetime import datetime, timezone
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
 from pathlib import Path
 
+from . import dedup
+from .skills import extract_skills, job_skills, load_dictionary, skill_names
+
+logger = logging.getLogger(__name__)
+
 DB_PATH = os.getenv("DB_FILE_PATH", "data/jobs.db")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))
+DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))
+PROFILE_CACHE_TTL_S = float(os.getenv("PROFILE_CACHE_TTL_S", "60"))
+
+# Applied once per connection when it is opened, not per query
+_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",  # 256 MB
+    "PRAGMA cache_size = -65536",  # 64 MB
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+class ConnectionPool:
+    """Thread-safe pool of tuned SQLite connections.
+
+    Connections are opened lazily and kept in a LIFO queue so the most
+    recently used (warmest) connection is handed out first. When every
+    pooled connection is checked out an extra one is opened, and it is
+    closed again on release if the pool is already full.
+    """
+
+    def __init__(self, path: str, size: int = DB_POOL_SIZE):
+        self.path = path
+        self.size = size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=size)
+        self._closed = False
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection; uncommitted work is rolled back on release."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._release(conn)
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        if self._closed:
+            conn.close()
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections. Borrowed ones close when released."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(DB_PATH)
+    return _pool
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+    # A new pool may point at a different database
+    profile_cache.invalidate()
+
 
+def _conn():
+    return get_pool().connection()
 
-def _get_conn() -> sqlite3.Connection:
-    Path(DB_PATH).parent.mkdir(exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+
+MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "db" / "migrations"
+
+# Columns that databases created before versioned migrations may lack:
+# CREATE TABLE IF NOT EXISTS in the baseline leaves their tables alone
+_LEGACY_COLUMNS = {
+    "job_matches": {"lexical_score": "REAL"},
+    "jobs": {"canonical_id": "TEXT"},
+    "resumes": {"content_hash": "TEXT"},
+}
+
+
+def _migrations() -> list[tuple[int, Path]]:
+    """(version, path) for every ``NNNN_name.sql`` file, in version order."""
+    return sorted((int(path.name.split("_", 1)[0]), path) for path in MIGRATIONS_DIR.glob("[0-9]*.sql"))
+
+
+def _statements(script: str) -> Iterator[str]:
+    # executescript() would commit the migration's transaction first, so run
+    # the statements one by one; complete_statement() keeps trigger bodies whole
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            yield buffer.strip()
+            buffer = ""
+    rest = "\n".join(line for line in buffer.splitlines() if not line.strip().startswith("--")).strip()
+    if rest:
+        raise ValueError(f"Incomplete SQL statement: {rest[:80]}")
+
+
+def _add_legacy_columns(conn: sqlite3.Connection) -> None:
+    for table, columns in _LEGACY_COLUMNS.items():
+        existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if not existing:
+            continue  # the baseline creates the table with these columns
+        for name, decl in columns.items():
+            if name not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+
+
+def migrate(conn: sqlite3.Connection) -> list[int]:
+    """Apply pending migrations in order, each in its own transaction.
+
+    The schema version lives in ``PRAGMA user_version``. Each step re-reads
+    it under a write lock, so processes starting at the same time apply a
+    step once. Returns the versions this call applied.
+    """
+    migrations = _migrations()
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= migrations[-1][0]:
+        return []
+
+    applied = []
+    for version, path in migrations:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            current = conn.execute("PRAGMA user_version").fetchone()[0]
+            if current >= version:
+                conn.rollback()
+                continue
+            if current == 0:
+                _add_legacy_columns(conn)
+            for statement in _statements(path.read_text()):
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        applied.append(version)
+    return applied
+
+
+def schema_version() -> int:
+    with _conn() as conn:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
 
 
 def init_db_sync():
-    """Initialize database from schema file."""
-    schema_path = Path(__file__).parent.parent.parent / "db" / "schema.sql"
-    conn = _get_conn()
-    conn.executescript(schema_path.read_text())
-    conn.commit()
-    conn.close()
+    """Bring the schema up to date, load the skill dictionary and rebuild outdated derived data."""
+    with _conn() as conn:
+        migrate(conn)
+        # Skills extracted with another dictionary version are stale, not just the dictionary
+        _rebuild_if_outdated(conn, "skills", load_dictionary()["version"], _reindex_skills)
+        _rebuild_if_outdated(conn, "job_signatures", str(dedup.SIGNATURE_VERSION), _relink_all_duplicates)
+
+
+def _rebuild_if_outdated(conn: sqlite3.Connection, name: str, version: str,
+                         rebuild: Callable[[sqlite3.Connection], object]) -> None:
+    """Run ``rebuild`` once if ``name`` was derived with another version.
+
+    The check is repeated under a write lock, so processes starting together
+    rebuild once; the rebuild commits with the new version or not at all.
+    """
+    query = "SELECT version FROM derived_versions WHERE name = ?"
+    row = conn.execute(query, (name,)).fetchone()
+    if row is not None and row[0] == version:
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(query, (name,)).fetchone()
+        if row is None or row[0] != version:
+            logger.info("Rebuilding %s for version %s", name, version)
+            rebuild(conn)
+            conn.execute(
+                "INSERT INTO derived_versions (name, version) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET version = excluded.version",
+                (name, version),
+            )
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def _sync_skill_dictionary(conn: sqlite3.Connection) -> None:
+    dictionary = load_dictionary()
+    version = dictionary["version"]
+    conn.executemany(
+        """INSERT INTO skills (id, name, category, version) VALUES (?, ?, ?, ?)
+           ON CONFLICT(id) DO UPDATE SET name = excluded.name, category = excluded.category, version = excluded.version""",
+        [(sid, skill["name"], skill.get("category"), version) for sid, skill in dictionary["skills"].items()],
+    )
+    conn.execute("DELETE FROM skills WHERE version != ?", (version,))
 
 
 def _uid() -> str:
@@ -31,250 +251,974 @@ def _uid() -> str:
 
 
 def _now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    return datetime.now(UTC).isoformat()
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
 # ── Users ──
 
+class ProfileCache:
+    """The default user and each user's primary resume, shared process-wide.
+
+    Nearly every handler and agent node starts by loading both, and they
+    rarely change. ``save_resume`` and ``set_primary_resume`` invalidate a
+    user's resume here; the TTL bounds how long a change made by another
+    process (e.g. the MCP server) takes to show up in this one. Callers get
+    copies, so mutating a result never touches the cache.
+    """
+
+    def __init__(self, ttl_s: float = PROFILE_CACHE_TTL_S):
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._user: dict | None = None
+        self._resumes: dict[str, tuple[float, dict | None]] = {}
+        # Bumped on invalidation so a lookup that raced a resume change isn't stored
+        self._generation = 0
+
+    def user(self) -> dict | None:
+        with self._lock:
+            return dict(self._user) if self._user else None
+
+    def set_user(self, user: dict) -> None:
+        with self._lock:
+            self._user = dict(user)
+
+    def primary_resume(self, user_id: str) -> tuple[bool, dict | None]:
+        """(hit, resume); a hit may be ``None`` when the user has no resume."""
+        with self._lock:
+            entry = self._resumes.get(user_id)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl_s:
+                return False, None
+            return True, dict(entry[1]) if entry[1] else None
+
+    def generation(self) -> int:
+        return self._generation
+
+    def set_primary_resume(self, user_id: str, resume: dict | None, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation:
+                self._resumes[user_id] = (time.monotonic(), dict(resume) if resume else None)
+
+    def invalidate(self, user_id: str | None = None) -> None:
+        """Forget one user's primary resume, or everything when ``user_id`` is None."""
+        with self._lock:
+            self._generation += 1
+            if user_id is None:
+                self._user = None
+                self._resumes.clear()
+            else:
+                self._resumes.pop(user_id, None)
+
+
+profile_cache = ProfileCache()
+
+
 def get_or_create_default_user() -> dict:
-    conn = _get_conn()
-    row = conn.execute("SELECT * FROM users LIMIT 1").fetchone()
-    if row:
-        result = dict(row)
-        conn.close()
-        return result
-
-    uid = _uid()
-    conn.execute(
-        "INSERT INTO users (id, email, name) VALUES (?, ?, ?)",
-        (uid, "default@example.com", "Default User"),
-    )
-    conn.commit()
-    row = conn.execute("SELECT * FROM users WHERE id = ?", (uid,)).fetchone()
-    result = dict(row)
-    conn.close()
-    return result
+    user = profile_cache.user()
+    if user:
+        return user
+    with _conn() as conn:
+        row = conn.execute("SELECT * FROM users LIMIT 1").fetchone()
+        if not row:
+            uid = _uid()
+            conn.execute(
+                "INSERT INTO users (id, email, name) VALUES (?, ?, ?)",
+                (uid, "default@example.com", "Default User"),
+            )
+            conn.commit()
+            row = conn.execute("SELECT * FROM users WHERE id = ?", (uid,)).fetchone()
+    profile_cache.set_user(dict(row))
+    return dict(row)
 
 
 # ── Jobs ──
 
-def save_job(job: dict) -> dict:
-    conn = _get_conn()
-    existing = conn.execute(
-        "SELECT * FROM jobs WHERE source = ? AND source_id = ?",
-        (job["source"], job.get("source_id", "")),
-    ).fetchone()
-    if existing:
-        result = dict(existing)
-        conn.close()
-        return result
-
-    jid = _uid()
+_JOB_UPSERT = """INSERT INTO jobs (id, source, source_id, title, company, company_url,
+   location, is_remote, salary_min, salary_max, description, requirements,
+   posted_at, raw_data, created_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(source, source_id) DO UPDATE SET
+     title = excluded.title,
+     company = excluded.company,
+     company_url = excluded.company_url,
+     location = excluded.location,
+     is_remote = excluded.is_remote,
+     salary_min = excluded.salary_min,
+     salary_max = excluded.salary_max,
+     description = excluded.description,
+     requirements = excluded.requirements,
+     posted_at = excluded.posted_at,
+     raw_data = excluded.raw_data"""
+
+# Stay well below SQLite's bound-parameter limit when selecting rows back
+_IN_CHUNK = 500
+
+
+def _job_params(job: dict, now: str, skills: list[str]) -> tuple:
+    return (
+        _uid(), job["source"], job.get("source_id") or "",
+        job["title"], job["company"], job.get("company_url"),
+        job.get("location"), job.get("is_remote"),
+        job.get("salary_min"), job.get("salary_max"),
+        job.get("description"), json.dumps(job.get("requirements") or skill_names(skills)),
+        job.get("posted_at"), json.dumps(job),
+        now,
+    )
+
+
+def save_jobs_bulk(jobs: list[dict]) -> list[dict]:
+    """Upsert a batch of normalized jobs in a single transaction.
+
+    Existing rows keep their id and created_at; listing fields are
+    refreshed. Returns the stored rows in input order.
+    """
+    if not jobs:
+        return []
+
+    now = _now()
+    keys = [(job["source"], job.get("source_id") or "") for job in jobs]
+    skills = {key: job_skills(job) for key, job in zip(keys, jobs)}
+
+    with _conn() as conn:
+        conn.executemany(_JOB_UPSERT, [_job_params(job, now, skills[key]) for key, job in zip(keys, jobs)])
+        stored = _select_jobs_by_keys(conn, keys)
+        rows = [stored[key] for key in dict.fromkeys(keys)]
+        _replace_skills(conn, "job_skills", "job_id", {row["id"]: skills[key] for key, row in zip(dict.fromkeys(keys), rows)})
+        _link_duplicates(conn, rows)
+        conn.commit()
+
+    return [stored[key] for key in keys]
+
+
+def _replace_skills(conn: sqlite3.Connection, table: str, owner: str, skills: dict[str, list[str]]) -> None:
+    """Overwrite the extracted skills of each job/resume id in ``skills``.
+
+    Only rows that differ are written, and the index version is bumped only
+    if any were, so re-saving unchanged jobs keeps loaded skill indexes valid.
+    """
+    ids = list(skills)
+    current: dict[str, set[str]] = {}
+    for i in range(0, len(ids), _IN_CHUNK):
+        chunk = ids[i:i + _IN_CHUNK]
+        rows = conn.execute(
+            f"SELECT {owner}, skill_id FROM {table} WHERE {owner} IN ({','.join('?' * len(chunk))})", chunk,
+        )
+        for owner_id, skill_id in rows:
+            current.setdefault(owner_id, set()).add(skill_id)
+
+    changes = conn.total_changes
+    conn.executemany(
+        f"DELETE FROM {table} WHERE {owner} = ? AND skill_id = ?",
+        [(owner_id, skill) for owner_id in ids for skill in current.get(owner_id, set()) - set(skills[owner_id])],
+    )
+    conn.executemany(
+        f"INSERT OR IGNORE INTO {table} ({owner}, skill_id) VALUES (?, ?)",
+        [(owner_id, skill) for owner_id, ids_ in skills.items() for skill in ids_
+         if skill not in current.get(owner_id, ())],
+    )
+    if conn.total_changes != changes:
+        _bump_index_version(conn, table)
+
+
+def _bump_index_version(conn: sqlite3.Connection, name: str) -> None:
     conn.execute(
-        """INSERT INTO jobs (id, source, source_id, title, company, company_url,
-           location, is_remote, salary_min, salary_max, description, requirements,
-           posted_at, raw_data, created_at)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            jid, job["source"], job.get("source_id", ""),
-            job["title"], job["company"], job.get("company_url"),
-            job.get("location"), job.get("is_remote"),
-            job.get("salary_min"), job.get("salary_max"),
-            job.get("description"), json.dumps(job.get("requirements")),
-            job.get("posted_at"), json.dumps(job),
-            _now(),
-        ),
+        "INSERT INTO index_versions (name, version) VALUES (?, 1) ON CONFLICT(name) DO UPDATE SET version = version + 1",
+        (name,),
     )
-    conn.commit()
-    row = conn.execute("SELECT * FROM jobs WHERE id = ?", (jid,)).fetchone()
-    result = dict(row)
-    conn.close()
-    return result
-
-
-def get_jobs(limit: int = 50) -> list[dict]:
-    conn = _get_conn()
-    rows = conn.execute(
-        "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+
+
+def get_index_version(name: str) -> int:
+    with _conn() as conn:
+        row = conn.execute("SELECT version FROM index_versions WHERE name = ?", (name,)).fetchone()
+    return row[0] if row else 0
+
+
+_DEDUP_BUCKET_DEPTH = 50
+_DEDUP_MAX_CANDIDATES = 20
+
+
+def _link_duplicates(conn: sqlite3.Connection, rows: list[dict]) -> None:
+    """Index each row's MinHash signature and point it at its canonical job.
+
+    A row whose signature is unchanged since it was last indexed is left
+    alone. Otherwise its LSH buckets are replaced, and it joins the cluster
+    of the most similar already-indexed job (if similar enough) or becomes
+    its own canonical job. Rows are linked one at a time, so duplicates
+    within the same batch find each other. Updates ``rows`` in place.
+    """
+    old = {}
+    ids = [row["id"] for row in rows]
+    for i in range(0, len(ids), _IN_CHUNK):
+        chunk = ids[i:i + _IN_CHUNK]
+        old.update(conn.execute(
+            f"SELECT job_id, signature FROM job_signatures WHERE job_id IN ({','.join('?' * len(chunk))})",
+            chunk,
+        ).fetchall())
+
+    for row in rows:
+        sig = dedup.signature(row)
+        blob = dedup.to_blob(sig)
+        if old.get(row["id"]) == blob and row["canonical_id"]:
+            continue
+
+        keys = dedup.band_keys(sig)
+        # Each bucket is read up to a fixed depth so boilerplate-heavy buckets
+        # can't make ingest cost grow with the table; jobs sharing the most
+        # bands (the most similar) are compared first
+        per_bucket = " UNION ALL ".join(
+            ["SELECT * FROM (SELECT job_id FROM job_lsh_buckets WHERE bucket = ? LIMIT ?)"] * len(keys)
+        )
+        params = [p for key in keys for p in (key, _DEDUP_BUCKET_DEPTH)]
+        candidates = conn.execute(
+            f"""SELECT j.id, j.canonical_id, j.title, s.signature
+                FROM (
+                    SELECT job_id, COUNT(*) AS shared FROM ({per_bucket})
+                    WHERE job_id != ?
+                    GROUP BY job_id ORDER BY shared DESC LIMIT ?
+                ) AS c
+                JOIN job_signatures s ON s.job_id = c.job_id
+                JOIN jobs j ON j.id = c.job_id""",
+            (*params, row["id"], _DEDUP_MAX_CANDIDATES),
+        ).fetchall()
+        canonical_id = row["id"]
+        if candidates:
+            scores = dedup.similarities(sig, [cand["signature"] for cand in candidates])
+            # Most similar first; a different role at the same company doesn't count
+            for i in scores.argsort()[::-1]:
+                if scores[i] < dedup.DEDUP_THRESHOLD:
+                    break
+                if dedup.same_role(row["title"] or "", candidates[i]["title"] or ""):
+                    canonical_id = candidates[i]["canonical_id"] or candidates[i]["id"]
+                    break
+
+        conn.execute(
+            "INSERT INTO job_signatures (job_id, signature) VALUES (?, ?) "
+            "ON CONFLICT(job_id) DO UPDATE SET signature = excluded.signature",
+            (row["id"], blob),
+        )
+        conn.execute("DELETE FROM job_lsh_buckets WHERE job_id = ?", (row["id"],))
+        conn.executemany(
+            "INSERT OR IGNORE INTO job_lsh_buckets (bucket, job_id) VALUES (?, ?)",
+            [(key, row["id"]) for key in keys],
+        )
+        conn.execute("UPDATE jobs SET canonical_id = ? WHERE id = ?", (canonical_id, row["id"]))
+        row["canonical_id"] = canonical_id
+
+
+def _relink_all_duplicates(conn: sqlite3.Connection, batch: int = 1000) -> None:
+    """Recompute every job's signature and canonical job, oldest jobs first."""
+    conn.execute("DELETE FROM job_lsh_buckets")
+    conn.execute("DELETE FROM job_signatures")
+    conn.execute("UPDATE jobs SET canonical_id = NULL")
+    last = 0
+    while rows := conn.execute(
+        "SELECT rowid, * FROM jobs WHERE rowid > ? ORDER BY rowid LIMIT ?", (last, batch),
+    ).fetchall():
+        _link_duplicates(conn, [dict(row) for row in rows])
+        last = rows[-1]["rowid"]
+
+
+def _select_jobs_by_keys(conn: sqlite3.Connection, keys: list[tuple[str, str]]) -> dict[tuple[str, str], dict]:
+    by_source: dict[str, set[str]] = {}
+    for source, source_id in keys:
+        by_source.setdefault(source, set()).add(source_id)
+
+    stored: dict[tuple[str, str], dict] = {}
+    for source, source_ids in by_source.items():
+        ids = list(source_ids)
+        for i in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[i:i + _IN_CHUNK]
+            rows = conn.execute(
+                f"SELECT * FROM jobs WHERE source = ? AND source_id IN ({','.join('?' * len(chunk))})",
+                (source, *chunk),
+            ).fetchall()
+            for row in rows:
+                stored[(row["source"], row["source_id"])] = dict(row)
+    return stored
+
+
+def find_jobs(jobs: list[dict]) -> list[dict | None]:
+    """Look up already-stored rows for normalized jobs, in input order, without writing."""
+    keys = [(job["source"], job.get("source_id") or "") for job in jobs]
+    with _conn() as conn:
+        stored = _select_jobs_by_keys(conn, keys)
+    return [stored.get(key) for key in keys]
+
+
+def save_job(job: dict) -> dict:
+    return save_jobs_bulk([job])[0]
+
+
+def encode_cursor(*values) -> str:
+    """Opaque page cursor for the sort key of the last row on a page."""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    """Inverse of ``encode_cursor``; raises ValueError for anything it did not produce."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    # (sort key, id), both text; anything else would only fail later, binding the query
+    if not isinstance(values, list) or len(values) != 2 or not all(isinstance(v, str) for v in values):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _page(rows: list[sqlite3.Row], limit: int, sort_key: str) -> tuple[list[dict], str | None]:
+    # Queries fetch limit + 1 rows; the extra one only says whether a next page exists
+    items = [dict(r) for r in rows[:limit]]
+    if len(rows) <= limit:
+        return items, None
+    return items, encode_cursor(items[-1][sort_key], items[-1]["id"])
+
+
+def get_jobs(limit: int = 50, cursor: str | None = None) -> tuple[list[dict], str | None]:
+    """Newest jobs first, one page at a time; returns (jobs, next page cursor or None)."""
+    query = "SELECT * FROM jobs"
+    params: list = []
+    if cursor:
+        query += " WHERE (created_at, id) < (?, ?)"
+        params += decode_cursor(cursor)
+    query += " ORDER BY created_at DESC, id DESC LIMIT ?"
+    with _conn() as conn:
+        rows = conn.execute(query, (*params, limit + 1)).fetchall()
+    return _page(rows, limit, "created_at")
 
 
 def get_job(job_id: str) -> dict | None:
-    conn = _get_conn()
-    row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
-    conn.close()
+    with _conn() as conn:
+        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    return dict(row) if row else None
+
+
+def get_jobs_by_ids(job_ids: list[str]) -> list[dict]:
+    """Jobs for ``job_ids``, in the given order; ids that no longer exist are skipped."""
+    found: dict[str, dict] = {}
+    with _conn() as conn:
+        for i in range(0, len(job_ids), _IN_CHUNK):
+            chunk = job_ids[i:i + _IN_CHUNK]
+            rows = conn.execute(f"SELECT * FROM jobs WHERE id IN ({','.join('?' * len(chunk))})", chunk).fetchall()
+            found.update((row["id"], dict(row)) for row in rows)
+    return [found[job_id] for job_id in job_ids if job_id in found]
+
+
+def get_job_skill_sets() -> tuple[int, list[str], list[tuple[str, str]]]:
+    """(index version, skill ids, (job_id, comma-separated skill ids) per job), in one snapshot."""
+    with _conn() as conn:
+        # Read transaction, ended by the pool's rollback on release
+        conn.execute("BEGIN")
+        row = conn.execute("SELECT version FROM index_versions WHERE name = 'job_skills'").fetchone()
+        skills = [r[0] for r in conn.execute("SELECT id FROM skills ORDER BY id")]
+        jobs = conn.execute("SELECT job_id, group_concat(skill_id) FROM job_skills GROUP BY job_id").fetchall()
+    return (row[0] if row else 0), skills, [tuple(r) for r in jobs]
+
+
+def get_resume_skills(resume_id: str) -> list[str]:
+    with _conn() as conn:
+        rows = conn.execute("SELECT skill_id FROM resume_skills WHERE resume_id = ?", (resume_id,)).fetchall()
+    return [r[0] for r in rows]
+
+
+# title, company, location, description
+_FTS_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+
+def _fts_query(text: str) -> str:
+    """Turn free text into a safe FTS5 query: every word must match, as a prefix."""
+    terms = re.findall(r"\w+", text)
+    return " ".join(f'"{t}"*' for t in terms)
+
+
+def search_saved_jobs(query: str, limit: int = 50) -> list[dict]:
+    """Ranked full-text search over stored jobs (title, company, location, description)."""
+    match = _fts_query(query)
+    if not match:
+        return []
+    with _conn() as conn:
+        rows = conn.execute(
+            # Rank and limit inside the FTS table first, so only the top rows are joined
+            f"""SELECT j.*, hits.rank FROM (
+                    SELECT rowid, bm25(jobs_fts, {', '.join(map(str, _FTS_WEIGHTS))}) AS rank
+                    FROM jobs_fts WHERE jobs_fts MATCH ?
+                    ORDER BY rank LIMIT ?
+                ) AS hits JOIN jobs j ON j.rowid = hits.rowid
+                ORDER BY hits.rank""",
+            (match, limit),
+        ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def rebuild_job_index() -> None:
+    with _conn() as conn:
+        conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+        conn.commit()
+
+
+def reindex_skills(batch: int = 1000) -> dict:
+    """Re-extract job and resume skills, e.g. after editing the dictionary in place.
+
+    Startup does this by itself when the dictionary's version changes.
+    """
+    with _conn() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            counts = _reindex_skills(conn, batch)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    return counts
+
+
+def _reindex_skills(conn: sqlite3.Connection, batch: int = 1000) -> dict:
+    """Sync the dictionary and re-extract every job's and resume's skills; the caller commits."""
+    counts = {"jobs": 0, "resumes": 0}
+    _sync_skill_dictionary(conn)
+    last = 0
+    while rows := conn.execute(
+        "SELECT rowid, id, title, description, raw_data FROM jobs WHERE rowid > ? ORDER BY rowid LIMIT ?",
+        (last, batch),
+    ).fetchall():
+        skills = {}
+        for row in rows:
+            job = json.loads(row["raw_data"]) if row["raw_data"] else dict(row)
+            skills[row["id"]] = job_skills(job)
+        _replace_skills(conn, "job_skills", "job_id", skills)
+        counts["jobs"] += len(rows)
+        last = rows[-1]["rowid"]
+
+    rows = conn.execute("SELECT id, raw_text FROM resumes").fetchall()
+    _replace_skills(conn, "resume_skills", "resume_id", {r["id"]: extract_skills(r["raw_text"]) for r in rows})
+    counts["resumes"] = len(rows)
+    return counts
+
+
+# ── Saved searches ──
+
+def create_saved_search(
+    user_id: str, keywords: str, location: str = "", source: str = "all",
+    remote_only: bool = False, interval_s: int = 3600,
+) -> dict:
+    with _conn() as conn:
+        sid = _uid()
+        now = _now()
+        conn.execute(
+            """INSERT INTO saved_searches (id, user_id, keywords, location, source, remote_only,
+               interval_s, enabled, next_run_at, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, TRUE, ?, ?)""",
+            (sid, user_id, keywords, location, source, remote_only, interval_s, now, now),
+        )
+        conn.commit()
+        row = conn.execute("SELECT * FROM saved_searches WHERE id = ?", (sid,)).fetchone()
+        return dict(row)
+
+
+def get_saved_searches(user_id: str) -> list[dict]:
+    """A user's saved searches, each with its per-board watermarks."""
+    with _conn() as conn:
+        rows = conn.execute(
+            "SELECT * FROM saved_searches WHERE user_id = ? ORDER BY created_at DESC", (user_id,)
+        ).fetchall()
+        searches = [dict(r) for r in rows]
+        for search in searches:
+            marks = conn.execute(
+                "SELECT source, watermark, last_count, last_error, updated_at FROM saved_search_watermarks WHERE search_id = ?",
+                (search["id"],),
+            ).fetchall()
+            search["sources"] = {m["source"]: dict(m) for m in marks}
+    return searches
+
+
+def get_saved_search(search_id: str) -> dict | None:
+    with _conn() as conn:
+        row = conn.execute("SELECT * FROM saved_searches WHERE id = ?", (search_id,)).fetchone()
     return dict(row) if row else None
 
 
+def delete_saved_search(search_id: str) -> bool:
+    with _conn() as conn:
+        conn.execute("DELETE FROM saved_search_watermarks WHERE search_id = ?", (search_id,))
+        deleted = conn.execute("DELETE FROM saved_searches WHERE id = ?", (search_id,)).rowcount
+        conn.commit()
+    return deleted > 0
+
+
+def get_due_saved_searches(now: str, limit: int = 20) -> list[dict]:
+    """Enabled saved searches whose next run is at or before ``now``, most overdue first."""
+    with _conn() as conn:
+        rows = conn.execute(
+            "SELECT * FROM saved_searches WHERE enabled = TRUE AND next_run_at <= ? ORDER BY next_run_at LIMIT ?",
+            (now, limit),
+        ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def get_search_watermarks(search_id: str) -> dict[str, str | None]:
+    with _conn() as conn:
+        rows = conn.execute(
+            "SELECT source, watermark FROM saved_search_watermarks WHERE search_id = ?", (search_id,)
+        ).fetchall()
+    return {r["source"]: r["watermark"] for r in rows}
+
+
+def record_saved_search_run(search_id: str, sources: dict[str, dict], next_run_at: str) -> None:
+    """Store each board's new watermark and outcome, and schedule the next run."""
+    now = _now()
+    with _conn() as conn:
+        conn.executemany(
+            """INSERT INTO saved_search_watermarks (search_id, source, watermark, last_count, last_error, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT(search_id, source) DO UPDATE SET
+                 watermark = excluded.watermark,
+                 last_count = excluded.last_count,
+                 last_error = excluded.last_error,
+                 updated_at = excluded.updated_at""",
+            [
+                (search_id, name, meta.get("watermark"), meta["count"], meta["error"], now)
+                for name, meta in sources.items()
+            ],
+        )
+        conn.execute(
+            "UPDATE saved_searches SET last_run_at = ?, next_run_at = ? WHERE id = ?",
+            (now, next_run_at, search_id),
+        )
+        conn.commit()
+
+
 # ── Applications ──
 
 def create_application(user_id: str, job_id: str, resume_id: str | None = None) -> dict:
-    conn = _get_conn()
-    aid = _uid()
-    now = _now()
-    conn.execute(
-        """INSERT INTO applications (id, user_id, job_id, resume_id, status, created_at, updated_at)
-           VALUES (?, ?, ?, ?, 'saved', ?, ?)""",
-        (aid, user_id, job_id, resume_id, now, now),
-    )
-    # Log event
-    conn.execute(
-        "INSERT INTO application_events (id, application_id, event_type, new_value, created_at) VALUES (?, ?, ?, ?, ?)",
-        (_uid(), aid, "status_change", "saved", now),
-    )
-    conn.commit()
-    row = conn.execute("SELECT * FROM applications WHERE id = ?", (aid,)).fetchone()
-    result = dict(row)
-    conn.close()
-    return result
+    with _conn() as conn:
+        aid = _uid()
+        now = _now()
+        conn.execute(
+            """INSERT INTO applications (id, user_id, job_id, resume_id, status, created_at, updated_at)
+               VALUES (?, ?, ?, ?, 'saved', ?, ?)""",
+            (aid, user_id, job_id, resume_id, now, now),
+        )
+        # Log event
+        conn.execute(
+            "INSERT INTO application_events (id, application_id, event_type, new_value, created_at) VALUES (?, ?, ?, ?, ?)",
+            (_uid(), aid, "status_change", "saved", now),
+        )
+        conn.commit()
+        row = conn.execute("SELECT * FROM applications WHERE id = ?", (aid,)).fetchone()
+        return dict(row)
 
 
 def update_application_status(application_id: str, status: str, notes: str | None = None) -> dict:
-    conn = _get_conn()
-    old = conn.execute("SELECT status FROM applications WHERE id = ?", (application_id,)).fetchone()
-    old_status = dict(old)["status"] if old else None
-    now = _now()
+    with _conn() as conn:
+        old = conn.execute("SELECT status FROM applications WHERE id = ?", (application_id,)).fetchone()
+        old_status = dict(old)["status"] if old else None
+        now = _now()
 
-    conn.execute(
-        "UPDATE applications SET status = ?, notes = COALESCE(?, notes), updated_at = ? WHERE id = ?",
-        (status, notes, now, application_id),
-    )
-    if status == "applied":
         conn.execute(
-            "UPDATE applications SET applied_at = ? WHERE id = ?",
-            (now, application_id),
+            "UPDATE applications SET status = ?, notes = COALESCE(?, notes), updated_at = ? WHERE id = ?",
+            (status, notes, now, application_id),
         )
+        if status == "applied":
+            conn.execute(
+                "UPDATE applications SET applied_at = ? WHERE id = ?",
+                (now, application_id),
+            )
 
-    conn.execute(
-        "INSERT INTO application_events (id, application_id, event_type, old_value, new_value, notes, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (_uid(), application_id, "status_change", old_status, status, notes, now),
-    )
-    conn.commit()
-    row = conn.execute("SELECT * FROM applications WHERE id = ?", (application_id,)).fetchone()
-    result = dict(row)
-    conn.close()
-    return result
+        conn.execute(
+            "INSERT INTO application_events (id, application_id, event_type, old_value, new_value, notes, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (_uid(), application_id, "status_change", old_status, status, notes, now),
+        )
+        conn.commit()
+        row = conn.execute("SELECT * FROM applications WHERE id = ?", (application_id,)).fetchone()
+        return dict(row)
 
 
-def get_applications(user_id: str, status: str | None = None, limit: int = 50) -> list[dict]:
-    conn = _get_conn()
+def get_applications(user_id: str, status: str | None = None, limit: int = 50,
+                     cursor: str | None = None) -> tuple[list[dict], str | None]:
+    """Most recently updated applications first; returns (applications, next page cursor or None)."""
+    query = "SELECT a.*, j.title as job_title, j.company FROM applications a JOIN jobs j ON a.job_id = j.id WHERE a.user_id = ?"
+    params: list = [user_id]
     if status:
+        query += " AND a.status = ?"
+        params.append(status)
+    if cursor:
+        query += " AND (a.updated_at, a.id) < (?, ?)"
+        params += decode_cursor(cursor)
+    query += " ORDER BY a.updated_at DESC, a.id DESC LIMIT ?"
+    with _conn() as conn:
+        rows = conn.execute(query, (*params, limit + 1)).fetchall()
+    return _page(rows, limit, "updated_at")
+
+
+def get_application_status_counts(user_id: str) -> dict[str, int]:
+    """Number of the user's applications in each status, from the trigger-maintained rollup."""
+    with _conn() as conn:
         rows = conn.execute(
-            "SELECT a.*, j.title as job_title, j.company FROM applications a JOIN jobs j ON a.job_id = j.id WHERE a.user_id = ? AND a.status = ? ORDER BY a.updated_at DESC LIMIT ?",
-            (user_id, status, limit),
-        ).fetchall()
-    else:
-        rows = conn.execute(
-            "SELECT a.*, j.title as job_title, j.company FROM applications a JOIN jobs j ON a.job_id = j.id WHERE a.user_id = ? ORDER BY a.updated_at DESC LIMIT ?",
-            (user_id, limit),
+            "SELECT status, count FROM application_status_counts WHERE user_id = ? AND count > 0",
+            (user_id,),
         ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    return {r["status"]: r["count"] for r in rows}
 
 
 def get_application(application_id: str) -> dict | None:
-    conn = _get_conn()
-    row = conn.execute(
-        "SELECT a.*, j.title as job_title, j.company, j.description as job_description FROM applications a JOIN jobs j ON a.job_id = j.id WHERE a.id = ?",
-        (application_id,),
-    ).fetchone()
-    conn.close()
+    with _conn() as conn:
+        row = conn.execute(
+            "SELECT a.*, j.title as job_title, j.company, j.description as job_description FROM applications a JOIN jobs j ON a.job_id = j.id WHERE a.id = ?",
+            (application_id,),
+        ).fetchone()
     return dict(row) if row else None
 
 
 def get_application_events(application_id: str) -> list[dict]:
-    conn = _get_conn()
-    rows = conn.execute(
-        "SELECT * FROM application_events WHERE application_id = ? ORDER BY created_at DESC",
-        (application_id,),
-    ).fetchall()
-    conn.close()
+    with _conn() as conn:
+        rows = conn.execute(
+            "SELECT * FROM application_events WHERE application_id = ? ORDER BY created_at DESC",
+            (application_id,),
+        ).fetchall()
     return [dict(r) for r in rows]
 
 
+# ── Agent runs ──
+
+def _agent_run(row: sqlite3.Row) -> dict:
+    run = dict(row)
+    run["params"] = json.loads(run["params"]) if run["params"] else {}
+    run["result"] = json.loads(run["result"]) if run["result"] else None
+    return run
+
+
+def enqueue_agent_run(action: str, params: dict) -> dict:
+    with _conn() as conn:
+        rid = _uid()
+        conn.execute(
+            "INSERT INTO agent_runs (id, action, params, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+            (rid, action, json.dumps(params), _now()),
+        )
+        conn.commit()
+        row = conn.execute("SELECT * FROM agent_runs WHERE id = ?", (rid,)).fetchone()
+        return _agent_run(row)
+
+
+def get_agent_run(run_id: str) -> dict | None:
+    with _conn() as conn:
+        row = conn.execute("SELECT * FROM agent_runs WHERE id = ?", (run_id,)).fetchone()
+    return _agent_run(row) if row else None
+
+
+def claim_agent_run(worker_id: str, exclude_actions: list[str] | None = None) -> dict | None:
+    """Atomically move the oldest queued run (of an allowed action) to running.
+
+    Safe across processes: the claim is a conditional UPDATE, so if another
+    worker takes the same run first this one moves on to the next.
+    """
+    exclude = list(exclude_actions or [])
+    query = "SELECT id FROM agent_runs WHERE status = 'queued'"
+    if exclude:
+        query += f" AND action NOT IN ({','.join('?' * len(exclude))})"
+    query += " ORDER BY created_at LIMIT 1"
+
+    with _conn() as conn:
+        while True:
+            row = conn.execute(query, exclude).fetchone()
+            if row is None:
+                return None
+            now = _now()
+            claimed = conn.execute(
+                """UPDATE agent_runs SET status = 'running', attempts = attempts + 1, worker_id = ?,
+                   started_at = ?, heartbeat_at = ? WHERE id = ? AND status = 'queued'""",
+                (worker_id, now, now, row["id"]),
+            ).rowcount
+            conn.commit()
+            if claimed:
+                row = conn.execute("SELECT * FROM agent_runs WHERE id = ?", (row["id"],)).fetchone()
+                return _agent_run(row)
+
+
+def heartbeat_agent_run(run_id: str) -> None:
+    with _conn() as conn:
+        conn.execute(
+            "UPDATE agent_runs SET heartbeat_at = ? WHERE id = ? AND status = 'running'", (_now(), run_id)
+        )
+        conn.commit()
+
+
+def finish_agent_run(run_id: str, result: dict | None = None, error: str | None = None) -> None:
+    """Mark a run completed (with ``result``) or failed (with ``error``)."""
+    with _conn() as conn:
+        conn.execute(
+            "UPDATE agent_runs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+            (
+                "failed" if error else "completed",
+                json.dumps(result, default=str) if result is not None else None,
+                error, _now(), run_id,
+            ),
+        )
+        conn.commit()
+
+
+def requeue_agent_run(run_id: str) -> None:
+    """Put a run interrupted by shutdown back on the queue.
+
+    The attempt it was claimed with is given back: the run didn't fail, so it
+    shouldn't count towards the stale-run retry limit.
+    """
+    with _conn() as conn:
+        conn.execute(
+            """UPDATE agent_runs SET status = 'queued', worker_id = NULL, attempts = MAX(attempts - 1, 0)
+               WHERE id = ? AND status = 'running'""",
+            (run_id,),
+        )
+        conn.commit()
+
+
+def recover_stale_agent_runs(stale_before: str, max_attempts: int) -> int:
+    """Requeue running runs whose heartbeat is older than ``stale_before``.
+
+    Their worker died mid-run. Runs that have already used ``max_attempts``
+    are failed instead, so a run that crashes its worker can't loop forever.
+    Returns how many runs were recovered or failed.
+    """
+    with _conn() as conn:
+        failed = conn.execute(
+            """UPDATE agent_runs SET status = 'failed', error = ?, finished_at = ?
+               WHERE status = 'running' AND heartbeat_at < ? AND attempts >= ?""",
+            (f"abandoned after {max_attempts} attempts", _now(), stale_before, max_attempts),
+        ).rowcount
+        requeued = conn.execute(
+            """UPDATE agent_runs SET status = 'queued', worker_id = NULL
+               WHERE status = 'running' AND heartbeat_at < ?""",
+            (stale_before,),
+        ).rowcount
+        conn.commit()
+    return failed + requeued
+
+
 # ── Documents ──
 
 def save_document(application_id: str, doc_type: str, content: str) -> dict:
-    conn = _get_conn()
-    did = _uid()
-    # Get current max version
-    row = conn.execute(
-        "SELECT MAX(version) as v FROM documents WHERE application_id = ? AND doc_type = ?",
-        (application_id, doc_type),
-    ).fetchone()
-    version = (dict(row)["v"] or 0) + 1
+    with _conn() as conn:
+        did = _uid()
+        # Get current max version
+        row = conn.execute(
+            "SELECT MAX(version) as v FROM documents WHERE application_id = ? AND doc_type = ?",
+            (application_id, doc_type),
+        ).fetchone()
+        version = (dict(row)["v"] or 0) + 1
 
-    conn.execute(
-        "INSERT INTO documents (id, application_id, doc_type, content, version, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-        (did, application_id, doc_type, content, version, _now()),
-    )
-    conn.commit()
-
-    # Also store on application if cover letter
-    if doc_type == "cover_letter":
         conn.execute(
-            "UPDATE applications SET cover_letter = ?, updated_at = ? WHERE id = ?",
-            (content, _now(), application_id),
+            "INSERT INTO documents (id, application_id, doc_type, content, version, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (did, application_id, doc_type, content, version, _now()),
         )
+
+        # Also store on application if cover letter
+        if doc_type == "cover_letter":
+            conn.execute(
+                "UPDATE applications SET cover_letter = ?, updated_at = ? WHERE id = ?",
+                (content, _now(), application_id),
+            )
         conn.commit()
 
-    result = {"id": did, "doc_type": doc_type, "version": version, "content": content}
-    conn.close()
-    return result
+    return {"id": did, "doc_type": doc_type, "version": version, "content": content}
+
+
+def find_position_document(application_id: str, doc_type: str, since: str | None = None) -> dict | None:
+    """Latest document of ``doc_type`` from another of the user's applications
+    to the same real position (same canonical job), created at or after ``since``."""
+    with _conn() as conn:
+        row = conn.execute(
+            """SELECT d.* FROM applications cur
+               JOIN jobs cj ON cj.id = cur.job_id
+               JOIN jobs j ON COALESCE(j.canonical_id, j.id) = COALESCE(cj.canonical_id, cj.id)
+               JOIN applications a ON a.job_id = j.id AND a.user_id = cur.user_id AND a.id != cur.id
+               JOIN documents d ON d.application_id = a.id AND d.doc_type = ?
+               WHERE cur.id = ? AND d.created_at >= ?
+               ORDER BY d.created_at DESC LIMIT 1""",
+            (doc_type, application_id, since or ""),
+        ).fetchone()
+    return dict(row) if row else None
 
 
 # ── Resumes ──
 
-def save_resume(user_id: str, filename: str, parsed_data: dict, raw_text: str) -> dict:
-    conn = _get_conn()
-    rid = _uid()
+def save_resume(user_id: str, filename: str, parsed_data: dict, raw_text: str,
+                file_hash: str | None = None, skills: list[str] | None = None) -> dict:
+    with _conn() as conn:
+        rid = _uid()
+        conn.execute(
+            "INSERT INTO resumes (id, user_id, filename, parsed_data, raw_text, is_primary, content_hash, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (rid, user_id, filename, json.dumps(parsed_data), raw_text, True, file_hash, _now()),
+        )
+        if skills:
+            _replace_skills(conn, "resume_skills", "resume_id", {rid: skills})
+        _make_primary(conn, user_id, rid, raw_text)
+        conn.commit()
+        profile_cache.invalidate(user_id)
+        row = conn.execute("SELECT * FROM resumes WHERE id = ?", (rid,)).fetchone()
+        return dict(row)
+
+
+def _make_primary(conn: sqlite3.Connection, user_id: str, resume_id: str, raw_text: str | None) -> None:
+    conn.execute("UPDATE resumes SET is_primary = (id = ?) WHERE user_id = ?", (resume_id, user_id))
+    # Scores computed against the previous primary resume no longer apply
     conn.execute(
-        "INSERT INTO resumes (id, user_id, filename, parsed_data, raw_text, is_primary, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (rid, user_id, filename, json.dumps(parsed_data), raw_text, True, _now()),
+        "DELETE FROM match_cache WHERE user_id = ? AND resume_hash != ?",
+        (user_id, content_hash(raw_text or "")),
     )
-    # Set all others to non-primary
-    conn.execute("UPDATE resumes SET is_primary = FALSE WHERE user_id = ? AND id != ?", (user_id, rid))
-    conn.commit()
-    row = conn.execute("SELECT * FROM resumes WHERE id = ?", (rid,)).fetchone()
-    result = dict(row)
-    conn.close()
-    return result
 
 
-def get_primary_resume(user_id: str) -> dict | None:
-    conn = _get_conn()
-    row = conn.execute(
-        "SELECT * FROM resumes WHERE user_id = ? AND is_primary = TRUE ORDER BY created_at DESC LIMIT 1",
-        (user_id,),
-    ).fetchone()
-    conn.close()
+def set_primary_resume(user_id: str, resume_id: str) -> dict | None:
+    with _conn() as conn:
+        row = conn.execute(
+            "SELECT raw_text FROM resumes WHERE id = ? AND user_id = ?", (resume_id, user_id)
+        ).fetchone()
+        if not row:
+            return None
+        _make_primary(conn, user_id, resume_id, row["raw_text"])
+        conn.commit()
+        profile_cache.invalidate(user_id)
+        row = conn.execute("SELECT * FROM resumes WHERE id = ?", (resume_id,)).fetchone()
+        return dict(row)
+
+
+def find_resume_by_hash(file_hash: str, user_id: str | None = None) -> dict | None:
+    """A stored resume parsed from a file with this content hash.
+
+    Scoped to ``user_id`` when given; otherwise any user's copy, which is
+    enough to reuse the parse result.
+    """
+    with _conn() as conn:
+        if user_id:
+            row = conn.execute(
+                "SELECT * FROM resumes WHERE content_hash = ? AND user_id = ? ORDER BY created_at DESC LIMIT 1",
+                (file_hash, user_id),
+            ).fetchone()
+        else:
+            row = conn.execute(
+                "SELECT * FROM resumes WHERE content_hash = ? ORDER BY created_at DESC LIMIT 1", (file_hash,)
+            ).fetchone()
     return dict(row) if row else None
 
 
+def get_primary_resume(user_id: str) -> dict | None:
+    hit, resume = profile_cache.primary_resume(user_id)
+    if hit:
+        return resume
+    generation = profile_cache.generation()
+    with _conn() as conn:
+        row = conn.execute(
+            "SELECT * FROM resumes WHERE user_id = ? AND is_primary = TRUE ORDER BY created_at DESC LIMIT 1",
+            (user_id,),
+        ).fetchone()
+    resume = dict(row) if row else None
+    profile_cache.set_primary_resume(user_id, resume, generation)
+    return resume
+
+
 def get_resumes(user_id: str) -> list[dict]:
-    conn = _get_conn()
-    rows = conn.execute(
-        "SELECT * FROM resumes WHERE user_id = ? ORDER BY created_at DESC", (user_id,)
-    ).fetchall()
-    conn.close()
+    with _conn() as conn:
+        rows = conn.execute(
+            "SELECT * FROM resumes WHERE user_id = ? ORDER BY created_at DESC", (user_id,)
+        ).fetchall()
     return [dict(r) for r in rows]
 
 
 # ── Match Scores ──
 
 def save_match(user_id: str, job_id: str, score: float, reasons: list[str],
-               matched: list[str], missing: list[str]) -> dict:
-    conn = _get_conn()
-    mid = _uid()
-    conn.execute(
-        """INSERT OR REPLACE INTO job_matches (id, user_id, job_id, match_score,
-           match_reasons, skills_matched, skills_missing, created_at)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-        (mid, user_id, job_id, score, json.dumps(reasons),
-         json.dumps(matched), json.dumps(missing), _now()),
-    )
-    conn.commit()
-    conn.close()
-    return {"id": mid, "match_score": score, "match_reasons": reasons}
+               matched: list[str], missing: list[str], lexical_score: float | None = None) -> dict:
+    with _conn() as conn:
+        mid = _uid()
+        conn.execute(
+            """INSERT OR REPLACE INTO job_matches (id, user_id, job_id, match_score, lexical_score,
+               match_reasons, skills_matched, skills_missing, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (mid, user_id, job_id, score, lexical_score, json.dumps(reasons),
+             json.dumps(matched), json.dumps(missing), _now()),
+        )
+        conn.commit()
+    return {"id": mid, "match_score": score, "lexical_score": lexical_score, "match_reasons": reasons}
+
+
+def get_cached_matches(resume_hash: str, job_hashes: list[str], prompt_version: str) -> dict[str, dict]:
+    """Memoized LLM results for a resume, keyed by job hash."""
+    found: dict[str, dict] = {}
+    with _conn() as conn:
+        for i in range(0, len(job_hashes), _IN_CHUNK):
+            chunk = job_hashes[i:i + _IN_CHUNK]
+            rows = conn.execute(
+                f"""SELECT job_hash, result FROM match_cache
+                    WHERE resume_hash = ? AND prompt_version = ? AND job_hash IN ({','.join('?' * len(chunk))})""",
+                (resume_hash, prompt_version, *chunk),
+            ).fetchall()
+            for row in rows:
+                found[row["job_hash"]] = json.loads(row["result"])
+    return found
+
+
+def put_cached_matches(user_id: str, resume_hash: str, prompt_version: str, results: dict[str, dict]) -> None:
+    if not results:
+        return
+    now = _now()
+    with _conn() as conn:
+        conn.executemany(
+            """INSERT OR REPLACE INTO match_cache (resume_hash, job_hash, prompt_version, user_id, result, created_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            [(resume_hash, job_hash, prompt_version, user_id, json.dumps(result), now)
+             for job_hash, result in results.items()],
+        )
+        conn.commit()
+
+
+# ── Search Cache ──
+
+def get_cached_search(cache_key: str) -> dict | None:
+    with _conn() as conn:
+        row = conn.execute(
+            "SELECT jobs, stored_at FROM search_cache WHERE cache_key = ?", (cache_key,)
+        ).fetchone()
+    if not row:
+        return None
+    return {"jobs": json.loads(row["jobs"]), "stored_at": row["stored_at"]}
+
+
+def put_cached_search(cache_key: str, source: str, jobs: list[dict], stored_at: float) -> None:
+    with _conn() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO search_cache (cache_key, source, jobs, stored_at) VALUES (?, ?, ?, ?)",
+            (cache_key, source, json.dumps(jobs), stored_at),
+        )
+        conn.commit()
+
+
+def prune_cached_searches(older_than: float) -> int:
+    with _conn() as conn:
+        cur = conn.execute("DELETE FROM search_cache WHERE stored_at < ?", (older_than,))
+        conn.commit()
+    return cur.rowcount
+
+
+# ── Source Quotas ──
+
+def get_quota_usage(source: str, period: str) -> int:
+    with _conn() as conn:
+        row = conn.execute(
+            "SELECT calls FROM source_quota_usage WHERE source = ? AND period = ?", (source, period)
+        ).fetchone()
+    return row["calls"] if row else 0
+
+
+def increment_quota_usage(source: str, period: str) -> int:
+    """Count one call against a source's budget and return the new total."""
+    with _conn() as conn:
+        conn.execute(
+            """INSERT INTO source_quota_usage (source, period, calls) VALUES (?, ?, 1)
+               ON CONFLICT(source, period) DO UPDATE SET calls = calls + 1""",
+            (source, period),
+        )
+        conn.commit()
+        row = conn.execute(
+            "SELECT calls FROM source_quota_usage WHERE source = ? AND period = ?", (source, period)
+        ).fetchone()
+    return row["calls"]
@@ -0,0 +1,113 @@
+"""MinHash signatures and LSH banding for cross-source near-duplicate jobs.
+
+The same position is often posted on several boards with slightly
+different titles, company suffixes and description truncation. Each job is
+reduced to a set of character shingles over title, company and the start of
+its description; a MinHash signature estimates Jaccard similarity between
+those sets, and LSH bands turn "find similar jobs" into exact bucket lookups
+that the database can index.
+
+Everything here is deterministic (fixed seed, stable hashes) because
+signatures and band keys are persisted.
+"""
+
+import hashlib
+import os
+import re
+import unicodedata
+import zlib
+
+import numpy as np
+
+DEDUP_NUM_PERM = 128
+DEDUP_BANDS = 32  # 32 bands × 4 rows: pairs above ~0.45 similarity become candidates
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.6"))
+# Share of title words two postings must have in common to be the same role
+DEDUP_TITLE_THRESHOLD = float(os.getenv("DEDUP_TITLE_THRESHOLD", "0.5"))
+# Bump when signatures change shape or hashing; stored ones are then rebuilt
+SIGNATURE_VERSION = 2
+
+_SHINGLE = 5
+# Boards truncate descriptions differently (JobTech at 500 chars), so only the
+# start of the text is comparable across sources
+_DESCRIPTION_CHARS = 400
+_COMPANY_SUFFIXES = re.compile(r"\b(ab|inc|ltd|llc|gmbh|as|oy|corp|co|plc|group)\b\.?")
+
+# One seed per hash function: h_i(x) = mix64(x ^ seed_i)
+_SEEDS = np.random.default_rng(20240601).integers(
+    0, np.iinfo(np.uint64).max, size=DEDUP_NUM_PERM, dtype=np.uint64, endpoint=True,
+)
+
+
+def _normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w]+", " ", text).split())
+
+
+def _mix64(z: np.ndarray) -> np.ndarray:
+    # splitmix64 finalizer; uint64 arithmetic wraps modulo 2^64, which it relies on
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def title_tokens(title: str) -> set[str]:
+    return set(_normalize(title).split())
+
+
+def same_role(title_a: str, title_b: str) -> bool:
+    """Whether two titles name the same role, whatever their word order or extras.
+
+    Descriptions dominate the MinHash shingles, so two roles at one company
+    sharing boilerplate can look alike; their titles tell them apart.
+    """
+    a, b = title_tokens(title_a), title_tokens(title_b)
+    if not a or not b:
+        return a == b
+    return len(a & b) / len(a | b) >= DEDUP_TITLE_THRESHOLD
+
+
+def shingles(job: dict) -> set[str]:
+    company = _COMPANY_SUFFIXES.sub(" ", _normalize(job.get("company") or ""))
+    text = " | ".join([
+        _normalize(job.get("title") or ""),
+        " ".join(company.split()),
+        _normalize((job.get("description") or "")[:_DESCRIPTION_CHARS]),
+    ])
+    if len(text) <= _SHINGLE:
+        return {text}
+    return {text[i:i + _SHINGLE] for i in range(len(text) - _SHINGLE + 1)}
+
+
+def signature(job: dict) -> np.ndarray:
+    """MinHash signature of a job's shingle set (``DEDUP_NUM_PERM`` uint64 values)."""
+    hashes = np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingles(job)), dtype=np.uint64,
+    )
+    with np.errstate(over="ignore"):
+        return _mix64(hashes[None, :] ^ _SEEDS[:, None]).min(axis=1)
+
+
+def band_keys(sig: np.ndarray) -> list[str]:
+    """One bucket key per band; jobs sharing any key are duplicate candidates."""
+    rows = len(sig) // DEDUP_BANDS
+    return [
+        f"{i}:{hashlib.blake2b(to_blob(sig[i * rows:(i + 1) * rows]), digest_size=8).hexdigest()}"
+        for i in range(DEDUP_BANDS)
+    ]
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    return float(np.mean(a == b))
+
+
+def similarities(sig: np.ndarray, blobs: list[bytes]) -> np.ndarray:
+    """``similarity`` of one signature against many stored ones at once."""
+    others = np.frombuffer(b"".join(blobs), dtype="<u8").reshape(len(blobs), -1)
+    return (others == sig).mean(axis=1)
+
+
+def to_blob(sig: np.ndarray) -> bytes:
+    return sig.astype("<u8").tobytes()
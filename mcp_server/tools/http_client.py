@@ -0,0 +1,80 @@
+"""Process-wide pooled HTTP clients for the job board integrations.
+
+One ``httpx.AsyncClient`` is kept per host, so keep-alive connections
+(and their DNS/TCP/TLS setup) are reused across searches and each board
+gets its own connection limit. Owners of the event loop — the FastAPI
+lifespan and the MCP server lifespan — call ``aclose_clients()`` on
+shutdown.
+"""
+
+import asyncio
+import logging
+import os
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "15"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "10"))
+HTTP_MAX_KEEPALIVE_PER_HOST = int(os.getenv("HTTP_MAX_KEEPALIVE_PER_HOST", "5"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "").lower() in ("1", "true", "yes")
+
+# (scheme, host, port) -> (owning event loop, client)
+_clients: dict[tuple[str, str, int | None], tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _build_client() -> httpx.AsyncClient:
+    http2 = HTTP2_ENABLED and _http2_available()
+    if HTTP2_ENABLED and not http2:
+        logger.warning("HTTP2_ENABLED is set but the 'h2' package is missing; using HTTP/1.1")
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_PER_HOST,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        http2=http2,
+    )
+
+
+def get_client(url: str) -> httpx.AsyncClient:
+    """Return the shared client for the host of ``url``.
+
+    Clients are bound to the event loop they were created on; a caller on
+    a different loop (e.g. a script using ``asyncio.run`` twice) gets a
+    fresh client for that loop.
+    """
+    parsed = httpx.URL(url)
+    key = (parsed.scheme, parsed.host, parsed.port)
+    loop = asyncio.get_running_loop()
+
+    entry = _clients.get(key)
+    if entry is not None:
+        owner, client = entry
+        if owner is loop and not client.is_closed:
+            return client
+
+    client = _build_client()
+    _clients[key] = (loop, client)
+    return client
+
+
+async def aclose_clients() -> None:
+    """Close every client owned by the running event loop."""
+    loop = asyncio.get_running_loop()
+    for key, (owner, client) in list(_clients.items()):
+        if owner is loop:
+            del _clients[key]
+            await client.aclose()
@@ -1,59 +1,100 @@
 """Job board API integrations: Arbetsförmedlingen (free) + RemoteOK (free) + Adzuna."""
 
 import os
-import httpx
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from .http_client import get_client
 
 # Arbetsförmedlingen (Swedish Public Employment Service) - FREE, no auth
-AF_BASE = "https://jobsearch.api.jobtechdev.se"
+AF_BASE = os.getenv("AF_BASE_URL", "https://jobsearch.api.jobtechdev.se")
+AF_MAX_PAGE_SIZE = 100  # JobTech caps limit at 100 and offset at 2000
+
+# RemoteOK - FREE, no auth
+REMOTEOK_BASE = os.getenv("REMOTEOK_BASE_URL", "https://remoteok.com")
 
 # Adzuna - requires free account
 ADZUNA_APP_ID = os.getenv("ADZUNA_APP_ID", "")
 ADZUNA_APP_KEY = os.getenv("ADZUNA_APP_KEY", "")
-ADZUNA_BASE = "https://api.adzuna.com/v1/api/jobs"
+ADZUNA_BASE = os.getenv("ADZUNA_BASE_URL", "https://api.adzuna.com/v1/api/jobs")
+ADZUNA_MAX_PAGE_SIZE = 50
+
+# Awaited before every page request, e.g. to take a rate-limit token
+Throttle = Callable[[], Awaitable[None]]
+
+
+# ── Normalizers ──
+
+def _normalize_af(hit: dict) -> dict:
+    # Salary is only published as free text in salary_description
+    salary_min = None
+    salary_max = None
+
+    # Location
+    workplace = hit.get("workplace_address") or {}
+    location = workplace.get("city") or workplace.get("municipality") or "Sweden"
+
+    return {
+        "source": "arbetsformedlingen",
+        "source_id": hit.get("id", ""),
+        "title": hit.get("headline", ""),
+        "company": (hit.get("employer") or {}).get("name", "Unknown"),
+        "location": location,
+        "is_remote": hit.get("remote_work", False),
+        "description": ((hit.get("description") or {}).get("text") or "")[:500],
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "url": hit.get("webpage_url", ""),
+        "posted_at": hit.get("publication_date", ""),
+    }
+
+
+def _normalize_adzuna(r: dict) -> dict:
+    return {
+        "source": "adzuna",
+        "source_id": str(r.get("id", "")),
+        "title": r.get("title", ""),
+        "company": r.get("company", {}).get("display_name", "Unknown"),
+        "location": r.get("location", {}).get("display_name", ""),
+        "description": r.get("description", ""),
+        "salary_min": int(r["salary_min"]) if r.get("salary_min") else None,
+        "salary_max": int(r["salary_max"]) if r.get("salary_max") else None,
+        "url": r.get("redirect_url", ""),
+        "posted_at": r.get("created", ""),
+    }
 
 
+def _normalize_remoteok(r: dict) -> dict:
+    salary_min = None
+    salary_max = None
+    if r.get("salary_min"):
+        salary_min = int(r["salary_min"])
+    if r.get("salary_max"):
+        salary_max = int(r["salary_max"])
+
+    return {
+        "source": "remoteok",
+        "source_id": str(r.get("id", "")),
+        "title": r.get("position", ""),
+        "company": r.get("company", "Unknown"),
+        "location": "Remote",
+        "is_remote": True,
+        "description": r.get("description", ""),
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "url": r.get("url", ""),
+        "posted_at": r.get("date", ""),
+        "tags": r.get("tags", []),
+    }
+
+
+# ── Single-page search ──
+
 async def search_arbetsformedlingen(
     keywords: str,
     limit: int = 20,
 ) -> list[dict]:
     """Search Arbetsförmedlingen/Platsbanken. FREE, no auth needed."""
-    url = f"{AF_BASE}/search"
-    params = {
-        "q": keywords,
-        "limit": limit,
-    }
-
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(url, params=params)
-        if resp.status_code != 200:
-            return []
-        data = resp.json()
-
-    jobs = []
-    for hit in data.get("hits", []):
-        # Extract salary if available
-        salary = hit.get("salary_description", {})
-        salary_min = None
-        salary_max = None
-
-        # Location
-        workplace = hit.get("workplace_address", {})
-        location = workplace.get("city") or workplace.get("municipality") or "Sweden"
-
-        jobs.append({
-            "source": "arbetsformedlingen",
-            "source_id": hit.get("id", ""),
-            "title": hit.get("headline", ""),
-            "company": hit.get("employer", {}).get("name", "Unknown"),
-            "location": location,
-            "is_remote": hit.get("remote_work", False),
-            "description": hit.get("description", {}).get("text", "")[:500],
-            "salary_min": salary_min,
-            "salary_max": salary_max,
-            "url": hit.get("webpage_url", ""),
-            "posted_at": hit.get("publication_date", ""),
-        })
-    return jobs
+    return await _fetch_af_page(keywords, offset=0, limit=limit)
 
 
 async def search_adzuna(
@@ -63,6 +104,49 @@ async def search_adzuna(
     results_per_page: int = 10,
 ) -> list[dict]:
     """Search Adzuna job board. Free tier: 250 calls/month."""
+    return await _fetch_adzuna_page(keywords, location, country, page=1, results_per_page=results_per_page)
+
+
+async def search_remoteok(tags: str = "python", limit: int = 10) -> list[dict]:
+    """Search RemoteOK API. Completely free, no auth needed."""
+    url = f"{REMOTEOK_BASE}/api?tag={tags}&limit={limit}"
+
+    resp = await get_client(url).get(url, headers={"User-Agent": "job-assistant/1.0"})
+    if resp.status_code != 200:
+        return []
+    data = resp.json()
+
+    # First element is metadata, skip it
+    jobs = [_normalize_remoteok(r) for r in data[1:]]
+    return jobs[:limit]
+
+
+async def _fetch_af_page(
+    keywords: str, offset: int, limit: int,
+    published_after: str | None = None, sort: str | None = None,
+) -> list[dict]:
+    url = f"{AF_BASE}/search"
+    params = {
+        "q": keywords,
+        "offset": offset,
+        "limit": limit,
+    }
+    if published_after:
+        params["published-after"] = published_after  # YYYY-MM-DDTHH:MM:SS
+    if sort:
+        params["sort"] = sort  # e.g. "pubdate-desc"
+
+    resp = await get_client(url).get(url, params=params)
+    if resp.status_code != 200:
+        return []
+    data = resp.json()
+    return [_normalize_af(hit) for hit in data.get("hits", [])]
+
+
+async def _fetch_adzuna_page(
+    keywords: str, location: str, country: str, page: int, results_per_page: int,
+    sort_by: str | None = None, max_days_old: int | None = None,
+) -> list[dict]:
     params = {
         "app_id": ADZUNA_APP_ID,
         "app_key": ADZUNA_APP_KEY,
@@ -72,64 +156,85 @@ async def search_adzuna(
     }
     if location:
         params["where"] = location
+    if sort_by:
+        params["sort_by"] = sort_by  # e.g. "date"
+    if max_days_old is not None:
+        params["max_days_old"] = max_days_old
 
-    url = f"{ADZUNA_BASE}/{country}/search/1"
-
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(url, params=params)
-        if resp.status_code != 200:
-            return []
-        data = resp.json()
-
-    jobs = []
-    for r in data.get("results", []):
-        jobs.append({
-            "source": "adzuna",
-            "source_id": str(r.get("id", "")),
-            "title": r.get("title", ""),
-            "company": r.get("company", {}).get("display_name", "Unknown"),
-            "location": r.get("location", {}).get("display_name", ""),
-            "description": r.get("description", ""),
-            "salary_min": int(r["salary_min"]) if r.get("salary_min") else None,
-            "salary_max": int(r["salary_max"]) if r.get("salary_max") else None,
-            "url": r.get("redirect_url", ""),
-            "posted_at": r.get("created", ""),
-        })
-    return jobs
+    url = f"{ADZUNA_BASE}/{country}/search/{page}"
 
+    resp = await get_client(url).get(url, params=params)
+    if resp.status_code != 200:
+        return []
+    data = resp.json()
+    return [_normalize_adzuna(r) for r in data.get("results", [])]
 
-async def search_remoteok(tags: str = "python", limit: int = 10) -> list[dict]:
-    """Search RemoteOK API. Completely free, no auth needed."""
-    url = f"https://remoteok.com/api?tag={tags}&limit={limit}"
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(url, headers={"User-Agent": "job-assistant/1.0"})
-        if resp.status_code != 200:
-            return []
-        data = resp.json()
+# ── Paginated streaming ──
 
-    # First element is metadata, skip it
-    jobs = []
-    for r in data[1:]:
-        salary_min = None
-        salary_max = None
-        if r.get("salary_min"):
-            salary_min = int(r["salary_min"])
-        if r.get("salary_max"):
-            salary_max = int(r["salary_max"])
-
-        jobs.append({
-            "source": "remoteok",
-            "source_id": str(r.get("id", "")),
-            "title": r.get("position", ""),
-            "company": r.get("company", "Unknown"),
-            "location": "Remote",
-            "is_remote": True,
-            "description": r.get("description", ""),
-            "salary_min": salary_min,
-            "salary_max": salary_max,
-            "url": r.get("url", ""),
-            "posted_at": r.get("date", ""),
-            "tags": r.get("tags", []),
-        })
-    return jobs[:limit]
+async def iter_arbetsformedlingen(
+    keywords: str,
+    max_results: int = 200,
+    page_size: int = 50,
+    throttle: Throttle | None = None,
+    published_after: str | None = None,
+    sort: str | None = None,
+) -> AsyncIterator[list[dict]]:
+    """Page through JobTech results with offset/limit, yielding each page as it arrives."""
+    page_size = min(page_size, AF_MAX_PAGE_SIZE)
+    offset = 0
+    while offset < max_results:
+        if throttle:
+            await throttle()
+        page = await _fetch_af_page(
+            keywords, offset, min(page_size, max_results - offset), published_after=published_after, sort=sort,
+        )
+        if not page:
+            return
+        yield page
+        if len(page) < page_size:
+            return
+        offset += len(page)
+
+
+async def iter_adzuna(
+    keywords: str,
+    location: str = "",
+    country: str = "us",
+    max_results: int = 200,
+    page_size: int = 50,
+    throttle: Throttle | None = None,
+    sort_by: str | None = None,
+    max_days_old: int | None = None,
+) -> AsyncIterator[list[dict]]:
+    """Page through Adzuna results by page number, yielding each page as it arrives."""
+    page_size = min(page_size, ADZUNA_MAX_PAGE_SIZE)
+    page_number = 1
+    fetched = 0
+    while fetched < max_results:
+        if throttle:
+            await throttle()
+        page = await _fetch_adzuna_page(
+            keywords, location, country, page_number, page_size, sort_by=sort_by, max_days_old=max_days_old,
+        )
+        if not page:
+            return
+        page = page[:max_results - fetched]
+        yield page
+        if len(page) < page_size:
+            return
+        fetched += len(page)
+        page_number += 1
+
+
+async def iter_remoteok(
+    tags: str = "python",
+    max_results: int = 100,
+    throttle: Throttle | None = None,
+) -> AsyncIterator[list[dict]]:
+    """RemoteOK returns everything in one response, so this yields a single page."""
+    if throttle:
+        await throttle()
+    jobs = await search_remoteok(tags=tags, limit=max_results)
+    if jobs:
+        yield jobs
@@ -0,0 +1,179 @@
+"""Quota-aware request scheduler for the rate-limited job boards.
+
+Every board call is admitted through ``scheduler.acquire(source, priority)``:
+
+- a token bucket per source smooths bursts (RemoteOK throttles aggressively),
+- waiters are served in priority order, so interactive searches jump ahead
+  of background refreshes,
+- a monthly call budget (Adzuna's free tier is 250 calls/month) is counted
+  in the DB so it survives restarts. Background work may not spend the last
+  ``reserve`` share of it, and once it is spent ``QuotaExhausted`` is raised
+  so callers can fall back to cached results.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from .async_database import get_quota_usage, increment_quota_usage
+
+INTERACTIVE = 0
+BACKGROUND = 1
+
+
+class QuotaExhausted(Exception):
+    """Raised when a source's monthly call budget does not admit a request."""
+
+
+@dataclass
+class SourceLimits:
+    rate: float  # tokens per second
+    burst: int
+    monthly_budget: int | None = None
+    reserve: float = 0.2  # share of the monthly budget kept for interactive calls
+
+
+def _budget(name: str, default: str) -> int | None:
+    value = os.getenv(name, default)
+    return int(value) if value else None
+
+
+SOURCE_LIMITS = {
+    "arbetsformedlingen": SourceLimits(
+        rate=float(os.getenv("RATE_AF_PER_S", "5")), burst=10,
+        monthly_budget=_budget("BUDGET_AF_MONTHLY", ""),
+    ),
+    "remoteok": SourceLimits(
+        rate=float(os.getenv("RATE_REMOTEOK_PER_S", "1")), burst=2,
+        monthly_budget=_budget("BUDGET_REMOTEOK_MONTHLY", ""),
+    ),
+    "adzuna": SourceLimits(
+        rate=float(os.getenv("RATE_ADZUNA_PER_S", "1")), burst=2,
+        monthly_budget=_budget("BUDGET_ADZUNA_MONTHLY", "250"),
+    ),
+}
+
+
+def _period() -> str:
+    return datetime.now(UTC).strftime("%Y-%m")
+
+
+@dataclass
+class _Bucket:
+    limits: SourceLimits
+    tokens: float
+    updated: float = field(default_factory=time.monotonic)
+    waiters: list[tuple[int, int]] = field(default_factory=list)
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.limits.burst, self.tokens + (now - self.updated) * self.limits.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        return max(0.0, (1 - self.tokens) / self.limits.rate)
+
+
+class RequestScheduler:
+    def __init__(self, limits: dict[str, SourceLimits] | None = None):
+        self.limits = {**SOURCE_LIMITS, **(limits or {})}
+        self._buckets: dict[str, _Bucket] = {}
+        self._usage: dict[str, tuple[str, int]] = {}  # source -> (period, calls)
+        self._seq = itertools.count()
+        self._budget_lock = asyncio.Lock()
+
+    def _bucket(self, source: str) -> _Bucket:
+        bucket = self._buckets.get(source)
+        if bucket is None:
+            limits = self.limits[source]
+            bucket = self._buckets[source] = _Bucket(limits, tokens=limits.burst)
+        return bucket
+
+    # ── Monthly budget ──
+
+    async def _calls_this_period(self, source: str) -> int:
+        period = _period()
+        cached = self._usage.get(source)
+        if cached is None or cached[0] != period:
+            cached = self._usage[source] = (period, await get_quota_usage(source, period))
+        return cached[1]
+
+    async def remaining(self, source: str) -> int | None:
+        """Calls left in this month's budget, or None when unbudgeted."""
+        budget = self.limits[source].monthly_budget
+        if budget is None:
+            return None
+        return max(0, budget - await self._calls_this_period(source))
+
+    async def _check_budget(self, source: str, priority: int) -> None:
+        limits = self.limits[source]
+        left = await self.remaining(source)
+        if left is None:
+            return
+        floor = int(limits.monthly_budget * limits.reserve) if priority == BACKGROUND else 0
+        if left <= floor:
+            raise QuotaExhausted(
+                f"{source} monthly budget exhausted ({limits.monthly_budget} calls"
+                + (f", {floor} reserved for interactive use)" if floor else ")")
+            )
+
+    async def _charge(self, source: str) -> None:
+        if self.limits[source].monthly_budget is None:
+            return
+        period = _period()
+        self._usage[source] = (period, await increment_quota_usage(source, period))
+
+    # ── Admission ──
+
+    async def acquire(self, source: str, priority: int = INTERACTIVE) -> None:
+        """Wait for a token for ``source``; higher-priority waiters go first."""
+        if source not in self.limits:
+            return
+        await self._check_budget(source, priority)
+
+        bucket = self._bucket(source)
+        ticket = (priority, next(self._seq))
+        heapq.heappush(bucket.waiters, ticket)
+        try:
+            while True:
+                bucket.refill()
+                if bucket.waiters[0] == ticket and bucket.tokens >= 1:
+                    heapq.heappop(bucket.waiters)
+                    bucket.tokens -= 1
+                    break
+                await asyncio.sleep(max(bucket.wait_time(), 0.005))
+        except BaseException:
+            if ticket in bucket.waiters:
+                bucket.waiters.remove(ticket)
+                heapq.heapify(bucket.waiters)
+            raise
+
+        # The budget may have been spent by requests admitted while we waited.
+        # Checked and charged under the lock, so no other request is admitted
+        # between the two database calls.
+        async with self._budget_lock:
+            try:
+                await self._check_budget(source, priority)
+                await self._charge(source)
+            except BaseException:
+                # No call is made, so the token isn't spent; give it back
+                bucket.tokens = min(bucket.limits.burst, bucket.tokens + 1)
+                raise
+
+    async def stats(self) -> dict:
+        return {
+            source: {
+                "tokens": round(self._bucket(source).tokens, 2),
+                "waiting": len(self._bucket(source).waiters),
+                "monthly_budget": limits.monthly_budget,
+                "remaining": await self.remaining(source),
+            }
+            for source, limits in self.limits.items()
+        }
+
+
+scheduler = RequestScheduler()
@@ -1,16 +1,54 @@
-"""Resume parsing from PDF and DOCX files."""
-
+"""Resume parsing from PDF and DOCX files.
+
+Parsing is CPU-bound, so async callers use ``parse_resume_async``, which
+runs it in a bounded process pool with a per-file timeout instead of on
+the event loop thread.
+"""
+
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
+from .skills import extract_skills
+
+RESUME_PARSE_WORKERS = int(os.getenv("RESUME_PARSE_WORKERS", "2"))
+RESUME_PARSE_TIMEOUT_S = float(os.getenv("RESUME_PARSE_TIMEOUT_S", "20"))
+RESUME_MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", "10"))
+# Extra seconds for the in-worker alarm to fire before the worker is presumed stuck
+_GRACE_S = 5.0
+
+
+HASH_CHUNK = 1 << 20
+
+
+def hash_file(file_path: str) -> str:
+    """sha256 of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-def parse_pdf(file_path: str) -> dict:
-    """Extract text and structure from a PDF resume."""
+
+class ResumeParseError(Exception):
+    """A resume could not be parsed (unreadable, or over the time limit)."""
+
+
+def parse_pdf(file_path: str, max_pages: int | None = None) -> dict:
+    """Extract text and structure from a PDF resume, reading at most ``max_pages`` pages."""
     import pdfplumber
 
     text_pages = []
     with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
+        for page in pdf.pages[:max_pages]:
             text_pages.append(page.extract_text() or "")
+            page.close()
 
     full_text = "\n".join(text_pages)
     return _structure_resume(full_text, Path(file_path).name)
@@ -26,11 +64,11 @@ def parse_docx(file_path: str) -> dict:
     return _structure_resume(full_text, Path(file_path).name)
 
 
-def parse_resume(file_path: str) -> dict:
+def parse_resume(file_path: str, max_pages: int | None = None) -> dict:
     """Auto-detect format and parse resume."""
     ext = Path(file_path).suffix.lower()
     if ext == ".pdf":
-        return parse_pdf(file_path)
+        return parse_pdf(file_path, max_pages=max_pages)
     elif ext in (".docx", ".doc"):
         return parse_docx(file_path)
     else:
@@ -39,12 +77,91 @@ def parse_resume(file_path: str) -> dict:
         return _structure_resume(text, Path(file_path).name)
 
 
+# ── Process pool ──
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: the parent holds threads and open DB connections
+            _pool = ProcessPoolExecutor(
+                max_workers=RESUME_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _recycle_pool(pool: ProcessPoolExecutor) -> None:
+    """Kill a pool whose worker is stuck; the next parse starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    # The executor has no public way to stop a running task
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_parse_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _on_alarm(signum, frame):
+    raise TimeoutError("resume parse timed out")
+
+
+def _parse_in_worker(file_path: str, max_pages: int, timeout: float) -> dict:
+    # Time out inside the worker where possible, so the process stays reusable
+    if hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return parse_resume(file_path, max_pages=max_pages)
+    finally:
+        if hasattr(signal, "SIGALRM"):
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+async def parse_resume_async(
+    file_path: str, timeout: float = RESUME_PARSE_TIMEOUT_S, max_pages: int = RESUME_MAX_PAGES,
+) -> dict:
+    """``parse_resume`` in the process pool, off the event loop.
+
+    Raises:
+        ResumeParseError: the file couldn't be parsed within ``timeout`` seconds.
+    """
+    pool = _get_pool()
+    # Keep the pool's own future: the asyncio wrapper is cancelled on timeout,
+    # but a task already running in a worker can't be, and stays not done
+    future = pool.submit(_parse_in_worker, file_path, max_pages, timeout)
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout + _GRACE_S)
+    except TimeoutError:
+        if not future.done():
+            _recycle_pool(pool)
+        raise ResumeParseError(f"parsing took longer than {timeout:g}s") from None
+    except BrokenProcessPool as e:
+        _recycle_pool(pool)
+        raise ResumeParseError("parser process crashed") from e
+    except Exception as e:
+        raise ResumeParseError(f"{type(e).__name__}: {e}") from e
+
+
 def _structure_resume(text: str, filename: str) -> dict:
     """Basic section extraction from resume text."""
     sections = {
         "raw_text": text,
         "filename": filename,
         "sections": {},
+        "skills": extract_skills(text),
     }
 
     # Common section headers
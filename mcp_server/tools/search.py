@@ -0,0 +1,385 @@
+"""Search coordinator — fans a query out to every job board concurrently."""
+
+import asyncio
+import math
+import os
+import sqlite3
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from datetime import UTC, datetime
+
+import httpx
+
+from .database import find_jobs, save_jobs_bulk
+from .job_boards import (
+    ADZUNA_APP_ID,
+    ADZUNA_MAX_PAGE_SIZE,
+    AF_MAX_PAGE_SIZE,
+    iter_adzuna,
+    iter_arbetsformedlingen,
+    iter_remoteok,
+    search_adzuna,
+    search_arbetsformedlingen,
+    search_remoteok,
+)
+from .quota import BACKGROUND, INTERACTIVE, QuotaExhausted, scheduler
+from .search_cache import search_cache
+
+SOURCES = ("arbetsformedlingen", "remoteok", "adzuna")
+
+# Seconds each board gets before its results are dropped from the response
+SOURCE_DEADLINES = {
+    "arbetsformedlingen": float(os.getenv("SEARCH_DEADLINE_AF", "8")),
+    "remoteok": float(os.getenv("SEARCH_DEADLINE_REMOTEOK", "8")),
+    "adzuna": float(os.getenv("SEARCH_DEADLINE_ADZUNA", "8")),
+}
+
+# What a board call is expected to fail with: the request itself, a payload
+# that isn't the JSON we expect, or the cache. Anything else is a bug.
+BOARD_ERRORS = (httpx.HTTPError, ValueError, KeyError, sqlite3.Error)
+
+
+def _remoteok_tag(keywords: str) -> str:
+    return keywords.split()[0].lower() if keywords else "python"
+
+
+def select_sources(source: str = "all", remote_only: bool = False) -> list[str]:
+    """Resolve a source filter to the boards that should be queried."""
+    if remote_only:
+        return ["remoteok"]
+    if source == "all":
+        return list(SOURCES)
+    return [s for s in SOURCES if s == source]
+
+
+def _query(source: str, keywords: str, location: str, limit: int) -> dict:
+    """The parameters a board actually sees — also the cache key."""
+    if source == "arbetsformedlingen":
+        return {"keywords": keywords, "limit": limit}
+    if source == "remoteok":
+        return {"tags": _remoteok_tag(keywords), "limit": limit}
+    return {"keywords": keywords, "location": location, "results_per_page": limit}
+
+
+async def _fetch(source: str, query: dict, priority: int) -> list[dict]:
+    await scheduler.acquire(source, priority)
+    if source == "arbetsformedlingen":
+        return await search_arbetsformedlingen(**query)
+    if source == "remoteok":
+        return await search_remoteok(**query)
+    return await search_adzuna(**query)
+
+
+def _new_meta() -> dict:
+    return {"count": 0, "elapsed_ms": 0.0, "error": None, "timed_out": False, "skipped": False, "cache": None}
+
+
+def _skip_reason(source: str) -> str | None:
+    if source == "adzuna" and not ADZUNA_APP_ID:
+        return "ADZUNA_APP_ID not configured"
+    return None
+
+
+async def _run_source(
+    source: str, keywords: str, location: str, limit: int, deadline: float, priority: int,
+) -> tuple[list[dict], dict]:
+    meta = _new_meta()
+    if reason := _skip_reason(source):
+        meta["skipped"] = True
+        meta["error"] = reason
+        return [], meta
+
+    start = time.perf_counter()
+    jobs: list[dict] = []
+    try:
+        query = _query(source, keywords, location, limit)
+        jobs, meta["cache"] = await asyncio.wait_for(
+            search_cache.fetch(
+                source, query,
+                loader=lambda: _fetch(source, query, priority),
+                refresh=lambda: _fetch(source, query, BACKGROUND),
+            ),
+            timeout=deadline,
+        )
+    except QuotaExhausted as e:
+        # Out of budget: any cached answer, however old, beats an error
+        meta["error"] = str(e)
+        stale = await search_cache.peek(source, query)
+        if stale is not None:
+            jobs, meta["cache"] = stale, "fallback"
+    except TimeoutError:
+        meta["timed_out"] = True
+        meta["error"] = f"deadline of {deadline:g}s exceeded"
+    except BOARD_ERRORS as e:
+        meta["error"] = f"{type(e).__name__}: {e}"
+    meta["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    meta["count"] = len(jobs)
+    return jobs, meta
+
+
+async def search_all_sources(
+    keywords: str,
+    location: str = "",
+    remote_only: bool = False,
+    source: str = "all",
+    limit: int = 10,
+    deadlines: dict[str, float] | None = None,
+    priority: int = INTERACTIVE,
+) -> dict:
+    """Query the selected boards concurrently, each under its own deadline.
+
+    A slow or failing board never fails the whole search: its jobs are
+    simply missing and its entry in ``sources`` says why. ``priority``
+    orders admission against other callers of rate-limited boards.
+
+    Returns:
+        {"jobs": [...], "sources": {name: {"count", "elapsed_ms", "error", "timed_out", "skipped", "cache"}}}
+    """
+    deadlines = {**SOURCE_DEADLINES, **(deadlines or {})}
+    selected = select_sources(source, remote_only)
+
+    outcomes = await asyncio.gather(*[
+        _run_source(s, keywords, location, limit, deadlines[s], priority) for s in selected
+    ])
+
+    jobs: list[dict] = []
+    sources: dict[str, dict] = {}
+    for name, (source_jobs, meta) in zip(selected, outcomes):
+        jobs.extend(source_jobs)
+        sources[name] = meta
+    return {"jobs": jobs, "sources": sources}
+
+
+# ── Streaming ──
+
+def _pages(source: str, keywords: str, location: str, max_results: int, page_size: int, priority: int):
+    async def throttle():
+        await scheduler.acquire(source, priority)
+
+    if source == "arbetsformedlingen":
+        return iter_arbetsformedlingen(keywords, max_results=max_results, page_size=page_size, throttle=throttle)
+    if source == "remoteok":
+        return iter_remoteok(_remoteok_tag(keywords), max_results=max_results, throttle=throttle)
+    return iter_adzuna(keywords, location, max_results=max_results, page_size=page_size, throttle=throttle)
+
+
+async def _pump(
+    source: str, pages: AsyncIterator[list[dict]], deadline: float, queue: asyncio.Queue, query: dict,
+) -> None:
+    meta = {**_new_meta(), "pages": 0}
+    start = time.perf_counter()
+    jobs: list[dict] = []
+    try:
+        while True:
+            try:
+                page = await asyncio.wait_for(anext(pages), timeout=deadline)
+            except StopAsyncIteration:
+                break
+            meta["pages"] += 1
+            meta["count"] += len(page)
+            jobs.extend(page)
+            await queue.put({"type": "page", "source": source, "jobs": page})
+    except QuotaExhausted as e:
+        # Out of budget: fill in from the cache whatever the board didn't send
+        meta["error"] = str(e)
+        sent = {job.get("source_id") for job in jobs}
+        stale = [job for job in await search_cache.peek(source, query) or [] if job.get("source_id") not in sent]
+        if stale:
+            meta["cache"] = "fallback"
+            meta["count"] += len(stale)
+            await queue.put({"type": "page", "source": source, "jobs": stale})
+    except TimeoutError:
+        meta["timed_out"] = True
+        meta["error"] = f"page deadline of {deadline:g}s exceeded"
+    except BOARD_ERRORS as e:
+        meta["error"] = f"{type(e).__name__}: {e}"
+    else:
+        # Complete results, so a later out-of-budget stream has something to fall back on
+        await search_cache.store(source, query, jobs)
+    meta["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    await queue.put({"type": "source_done", "source": source, **meta})
+
+
+async def stream_all_sources(
+    keywords: str,
+    location: str = "",
+    remote_only: bool = False,
+    source: str = "all",
+    max_results: int = 100,
+    page_size: int = 50,
+    deadlines: dict[str, float] | None = None,
+    priority: int = INTERACTIVE,
+) -> AsyncIterator[dict]:
+    """Page through the selected boards concurrently, yielding pages as they land.
+
+    Yields ``{"type": "page", "source", "jobs"}`` events in arrival order
+    and one ``{"type": "source_done", "source", ...metadata}`` per board.
+    Deadlines apply per page. A board out of monthly budget falls back to
+    cached results. Closing the iterator cancels pending fetches.
+    """
+    deadlines = {**SOURCE_DEADLINES, **(deadlines or {})}
+    queue: asyncio.Queue = asyncio.Queue()
+    tasks = []
+    for name in select_sources(source, remote_only):
+        if reason := _skip_reason(name):
+            await queue.put({"type": "source_done", "source": name, **_new_meta(), "skipped": True, "error": reason})
+            continue
+        pages = _pages(name, keywords, location, max_results, page_size, priority)
+        query = _query(name, keywords, location, max_results)
+        tasks.append(asyncio.create_task(_pump(name, pages, deadlines[name], queue, query)))
+
+    pending = queue.qsize() + len(tasks)
+    try:
+        while pending:
+            event = await queue.get()
+            if event["type"] == "source_done":
+                pending -= 1
+            yield event
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+# ── Incremental ingestion ──
+
+# Generous: background refreshes page through up to max_results per board
+INGEST_DEADLINE = float(os.getenv("INGEST_DEADLINE_S", "120"))
+
+
+def parse_posted_at(value: str | None) -> datetime | None:
+    """Parse a board's publication timestamp as UTC (naive values are taken as UTC)."""
+    if not value:
+        return None
+    try:
+        posted = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    return posted if posted.tzinfo else posted.replace(tzinfo=UTC)
+
+
+def _pages_since(source: str, keywords: str, location: str, since: datetime | None, max_results: int):
+    """Newest-first pages, narrowed server-side to ``since`` where the board supports it."""
+    async def throttle():
+        await scheduler.acquire(source, BACKGROUND)
+
+    if source == "arbetsformedlingen":
+        published_after = since.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S") if since else None
+        return iter_arbetsformedlingen(
+            keywords, max_results=max_results, page_size=AF_MAX_PAGE_SIZE, throttle=throttle,
+            published_after=published_after, sort="pubdate-desc",
+        )
+    if source == "adzuna":
+        max_days_old = None
+        if since:
+            max_days_old = max(1, math.ceil((datetime.now(UTC) - since).total_seconds() / 86400))
+        return iter_adzuna(
+            keywords, location, max_results=max_results, page_size=ADZUNA_MAX_PAGE_SIZE, throttle=throttle,
+            sort_by="date", max_days_old=max_days_old,
+        )
+    # RemoteOK has no filters and returns its newest postings first
+    return iter_remoteok(_remoteok_tag(keywords), max_results=max_results, throttle=throttle)
+
+
+async def fetch_since(
+    source: str, keywords: str, location: str = "", since: str | None = None, max_results: int = 200,
+) -> list[dict]:
+    """Postings from one board published at or after ``since``, at background priority.
+
+    Pages arrive newest first, so paging stops at the first posting older
+    than the watermark. Postings without a parseable date are kept; the
+    upsert makes re-fetching one harmless.
+    """
+    cutoff = parse_posted_at(since)
+    jobs: list[dict] = []
+    async with aclosing(_pages_since(source, keywords, location, cutoff, max_results)) as pages:
+        async for page in pages:
+            fresh = [
+                job for job in page
+                if cutoff is None or (posted := parse_posted_at(job.get("posted_at"))) is None or posted >= cutoff
+            ]
+            jobs.extend(fresh)
+            if len(fresh) < len(page):
+                break
+    return jobs
+
+
+async def _ingest_source(
+    source: str, keywords: str, location: str, since: str | None, max_results: int,
+) -> tuple[list[dict], dict]:
+    meta = {**_new_meta(), "watermark": since}
+    if reason := _skip_reason(source):
+        meta["skipped"] = True
+        meta["error"] = reason
+        return [], meta
+
+    start = time.perf_counter()
+    jobs: list[dict] = []
+    try:
+        jobs = await asyncio.wait_for(fetch_since(source, keywords, location, since, max_results), INGEST_DEADLINE)
+    except TimeoutError:
+        meta["timed_out"] = True
+        meta["error"] = f"deadline of {INGEST_DEADLINE:g}s exceeded"
+    except QuotaExhausted as e:
+        meta["error"] = str(e)
+    except BOARD_ERRORS as e:
+        meta["error"] = f"{type(e).__name__}: {e}"
+    else:
+        newest = max(filter(None, (parse_posted_at(job.get("posted_at")) for job in jobs)), default=None)
+        previous = parse_posted_at(since)
+        if newest and (previous is None or newest > previous):
+            meta["watermark"] = newest.isoformat()
+    meta["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    meta["count"] = len(jobs)
+    return jobs, meta
+
+
+async def ingest_new_jobs(
+    keywords: str,
+    location: str = "",
+    source: str = "all",
+    remote_only: bool = False,
+    watermarks: dict[str, str | None] | None = None,
+    max_results: int = 200,
+) -> dict:
+    """Fetch only postings newer than each board's watermark, boards in parallel.
+
+    Runs at BACKGROUND priority so interactive searches keep their share of
+    rate-limited boards. A board's watermark only advances when its fetch
+    succeeds.
+
+    Returns:
+        {"jobs": [...], "sources": {name: {..., "watermark"}}}
+    """
+    watermarks = watermarks or {}
+    selected = select_sources(source, remote_only)
+    outcomes = await asyncio.gather(*[
+        _ingest_source(s, keywords, location, watermarks.get(s), max_results) for s in selected
+    ])
+
+    jobs: list[dict] = []
+    sources: dict[str, dict] = {}
+    for name, (source_jobs, meta) in zip(selected, outcomes):
+        jobs.extend(source_jobs)
+        sources[name] = meta
+    return {"jobs": jobs, "sources": sources}
+
+
+def store_results(result: dict) -> list[dict]:
+    """Persist a search result and return the stored rows in result order.
+
+    Jobs from fresh cache hits were written when they were first fetched,
+    so they are only looked up; everything else goes through one bulk upsert.
+    """
+    jobs = result["jobs"]
+    cached = {name for name, meta in result["sources"].items() if meta.get("cache") in ("hit", "fallback")}
+    if not cached:
+        return save_jobs_bulk(jobs)
+
+    rows = find_jobs([j for j in jobs if j["source"] in cached])
+    known = iter(rows)
+    stored = [next(known) if j["source"] in cached else None for j in jobs]
+
+    missing = [j for j, row in zip(jobs, stored) if row is None]
+    fresh = iter(save_jobs_bulk(missing))
+    return [row if row is not None else next(fresh) for row in stored]
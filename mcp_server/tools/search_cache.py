@@ -0,0 +1,188 @@
+"""TTL + LRU response cache for job board queries.
+
+Lookups go memory (LRU) → SQLite (optional, survives restarts) → board.
+Entries younger than the source's TTL are served as-is. Entries past the
+TTL but still inside the stale window are served immediately while a
+background task refreshes them (stale-while-revalidate). Anything older
+is a miss. Concurrent misses for the same key share one board request.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from .async_database import get_cached_search, put_cached_search
+from .database import prune_cached_searches
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached result is considered fresh, per source
+CACHE_TTLS = {
+    "arbetsformedlingen": float(os.getenv("SEARCH_CACHE_TTL_AF", "600")),
+    "remoteok": float(os.getenv("SEARCH_CACHE_TTL_REMOTEOK", "900")),
+    "adzuna": float(os.getenv("SEARCH_CACHE_TTL_ADZUNA", "3600")),
+}
+# Extra seconds past the TTL during which stale results are served while refreshing
+CACHE_STALE_WINDOW = float(os.getenv("SEARCH_CACHE_STALE_S", "3600"))
+CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "512"))
+CACHE_SQLITE = os.getenv("SEARCH_CACHE_SQLITE", "true").lower() in ("1", "true", "yes")
+
+Loader = Callable[[], Awaitable[list[dict]]]
+
+
+def cache_key(source: str, params: dict) -> str:
+    """Normalize query params so equivalent searches share an entry."""
+    normalized = {}
+    for name, value in params.items():
+        if isinstance(value, str):
+            value = " ".join(value.lower().split())
+        if value in ("", None):
+            continue
+        normalized[name] = value
+    return f"{source}:{json.dumps(normalized, sort_keys=True)}"
+
+
+class SearchCache:
+    def __init__(
+        self,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        ttls: dict[str, float] | None = None,
+        stale_window: float = CACHE_STALE_WINDOW,
+        persist: bool = CACHE_SQLITE,
+    ):
+        self.max_entries = max_entries
+        self.ttls = {**CACHE_TTLS, **(ttls or {})}
+        self.stale_window = stale_window
+        self.persist = persist
+        self._entries: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._stats: dict[str, dict[str, int]] = {}
+
+    # ── Lookup ──
+
+    async def _get(self, key: str) -> tuple[float, list[dict]] | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        if self.persist:
+            row = await get_cached_search(key)
+            if row is not None:
+                entry = (row["stored_at"], row["jobs"])
+                self._remember(key, entry)
+                return entry
+        return None
+
+    def _remember(self, key: str, entry: tuple[float, list[dict]]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _put(self, source: str, key: str, jobs: list[dict]) -> None:
+        # Empty results are usually a board error (non-200); don't pin them
+        if not jobs:
+            return
+        stored_at = time.time()
+        self._remember(key, (stored_at, jobs))
+        if self.persist:
+            await put_cached_search(key, source, jobs, stored_at)
+
+    # ── Loading ──
+
+    def _load(self, source: str, key: str, loader: Loader) -> asyncio.Task:
+        """Start (or join) the board request for a key.
+
+        The request runs as its own task, so a caller that gives up on its
+        deadline doesn't cancel it — the result still lands in the cache.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_loader(source, key, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        return task
+
+    async def _run_loader(self, source: str, key: str, loader: Loader) -> list[dict]:
+        jobs = await loader()
+        await self._put(source, key, jobs)
+        return jobs
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Search for %s failed: %s", key, task.exception())
+
+    async def peek(self, source: str, params: dict) -> list[dict] | None:
+        """Return whatever is cached for a query, however old, without loading."""
+        entry = await self._get(cache_key(source, params))
+        return entry[1] if entry else None
+
+    async def store(self, source: str, params: dict, jobs: list[dict]) -> None:
+        """Cache results fetched outside ``fetch``, e.g. by a streamed search."""
+        await self._put(source, cache_key(source, params), jobs)
+
+    async def fetch(
+        self, source: str, params: dict, loader: Loader, refresh: Loader | None = None,
+    ) -> tuple[list[dict], str]:
+        """Return (jobs, status) where status is "hit", "stale" or "miss".
+
+        ``refresh`` loads stale entries in the background; it defaults to
+        ``loader`` but lets callers schedule revalidation at lower priority.
+        """
+        key = cache_key(source, params)
+        entry = await self._get(key)
+        if entry is not None:
+            stored_at, jobs = entry
+            age = time.time() - stored_at
+            ttl = self.ttls.get(source, 600)
+            if age < ttl:
+                self._count(source, "hits")
+                return jobs, "hit"
+            if age < ttl + self.stale_window:
+                self._count(source, "stale_hits")
+                if key not in self._inflight:
+                    self._count(source, "refreshes")
+                    self._load(source, key, refresh or loader)
+                return jobs, "stale"
+
+        self._count(source, "misses")
+        return await asyncio.shield(self._load(source, key, loader)), "miss"
+
+    # ── Maintenance & stats ──
+
+    def _count(self, source: str, counter: str) -> None:
+        counts = self._stats.setdefault(source, {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0})
+        counts[counter] += 1
+
+    def stats(self) -> dict:
+        sources = {}
+        for source, counts in self._stats.items():
+            lookups = counts["hits"] + counts["stale_hits"] + counts["misses"]
+            sources[source] = {
+                **counts,
+                "hit_rate": round((counts["hits"] + counts["stale_hits"]) / lookups, 3) if lookups else 0.0,
+                "ttl_s": self.ttls.get(source),
+            }
+        return {"entries": len(self._entries), "max_entries": self.max_entries, "sources": sources}
+
+    def prune(self) -> int:
+        """Drop persisted entries too old to be served even as stale.
+
+        Blocking; called once at startup, before any request is served.
+        """
+        if not self.persist:
+            return 0
+        horizon = max(self.ttls.values()) + self.stale_window
+        return prune_cached_searches(time.time() - horizon)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._stats.clear()
+
+
+search_cache = SearchCache()
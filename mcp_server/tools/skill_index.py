@@ -0,0 +1,150 @@
+"""Inverted skill index: which stored jobs need the skills a user has?
+
+The ``job_skills`` join table (indexed both ways) is the source of truth
+and is maintained on ingest. Each process keeps a sparse jobs × skills
+matrix built from it, reloaded only when the table's entry in
+``index_versions`` changes, so scoring every stored job is one sparse
+matrix-vector product instead of an LLM call per batch.
+
+Scores are weighted Jaccard similarity between the job's and the user's
+skill sets, with each skill weighted by its inverse document frequency
+across stored jobs: sharing "kubernetes" counts for more than sharing
+"git".
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy import sparse
+
+from .database import get_index_version, get_job_skill_sets, get_jobs_by_ids
+from .skills import skill_names
+
+logger = logging.getLogger(__name__)
+
+SKILL_MATCH_MIN_SCORE = float(os.getenv("SKILL_MATCH_MIN_SCORE", "0.05"))
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    version: int | None = None
+    job_ids: list[str] = field(default_factory=list)
+    skill_ids: list[str] = field(default_factory=list)
+    columns: dict[str, int] = field(default_factory=dict)
+    present: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    matrix: sparse.csr_matrix = field(default_factory=lambda: sparse.csr_matrix((0, 0), dtype=np.float32))
+    idf: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    job_weight: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+
+
+def _build(version: int, skill_ids: list[str], jobs: list[tuple[str, str]]) -> _Snapshot:
+    columns = {skill: i for i, skill in enumerate(skill_ids)}
+    indptr = [0]
+    indices: list[int] = []
+    for _, skills in jobs:
+        # Rows left over from an older dictionary may name skills it no longer has
+        indices.extend(columns[s] for s in skills.split(",") if s in columns)
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.float32), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+        shape=(len(jobs), len(skill_ids)),
+    )
+
+    # Smoothed IDF, always positive so every shared skill adds something
+    df = np.bincount(matrix.indices, minlength=len(skill_ids))
+    idf = (np.log((1 + len(jobs)) / (1 + df)) + 1).astype(np.float32)
+
+    job_ids = [job_id for job_id, _ in jobs]
+    return _Snapshot(version, job_ids, skill_ids, columns, df > 0, matrix, idf, matrix @ idf)
+
+
+class SkillIndex:
+    """Process-local sparse copy of ``job_skills`` with IDF weights.
+
+    Each reload builds a new snapshot and swaps it in whole, so searches
+    running concurrently with a reload see either the old or the new index.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = _Snapshot()
+
+    def refresh(self) -> _Snapshot:
+        """Reload from the database if ``job_skills`` changed since the last load."""
+        if get_index_version("job_skills") != self._snapshot.version:
+            with self._lock:
+                version, skill_ids, jobs = get_job_skill_sets()
+                if version != self._snapshot.version:
+                    self._snapshot = _build(version, skill_ids, jobs)
+                    logger.info("Loaded skill index: %d jobs, %d skills",
+                                len(self._snapshot.job_ids), len(self._snapshot.skill_ids))
+        return self._snapshot
+
+    def search(self, skill_ids: list[str], limit: int = 50,
+               min_score: float = SKILL_MATCH_MIN_SCORE) -> list[dict]:
+        """Best-matching job ids for a skill set, highest weighted Jaccard first.
+
+        Each hit is ``{"job_id", "score", "skills_matched", "skills_missing"}``,
+        where missing means required by the job but not in ``skill_ids``.
+        Skills no stored job mentions cannot be shared and are ignored.
+        """
+        snap = self.refresh()
+        cols = [snap.columns[s] for s in dict.fromkeys(skill_ids) if s in snap.columns]
+        cols = [c for c in cols if snap.present[c]]
+        if not cols or limit <= 0:
+            return []
+
+        query = np.zeros(len(snap.skill_ids), dtype=np.float32)
+        query[cols] = snap.idf[cols]
+        shared = snap.matrix @ query
+        union = snap.job_weight + query.sum() - shared
+        scores = shared / union
+
+        hits = np.flatnonzero((shared > 0) & (scores >= min_score))
+        if len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+        hits = hits[np.argsort(-scores[hits], kind="stable")]
+
+        wanted = set(cols)
+        results = []
+        for row in hits:
+            job_cols = snap.matrix.indices[snap.matrix.indptr[row]:snap.matrix.indptr[row + 1]]
+            results.append({
+                "job_id": snap.job_ids[row],
+                "score": round(float(scores[row]), 4),
+                "skills_matched": [snap.skill_ids[c] for c in job_cols if c in wanted],
+                "skills_missing": [snap.skill_ids[c] for c in job_cols if c not in wanted],
+            })
+        return results
+
+
+skill_index = SkillIndex()
+
+
+def find_jobs_by_skills(skill_ids: list[str], limit: int = 50,
+                        min_score: float = SKILL_MATCH_MIN_SCORE) -> list[dict]:
+    """Stored jobs ranked by skill overlap, one per position, with score and skill gaps."""
+    # Over-fetch so collapsing cross-source duplicates still fills the page
+    hits = skill_index.search(skill_ids, limit=limit * 2, min_score=min_score)
+    jobs = {job["id"]: job for job in get_jobs_by_ids([hit["job_id"] for hit in hits])}
+
+    results = []
+    seen: set[str] = set()
+    for hit in hits:
+        job = jobs.get(hit["job_id"])
+        if job is None:
+            continue
+        position = job.get("canonical_id") or job["id"]
+        if position in seen:
+            continue
+        seen.add(position)
+        job["skill_score"] = hit["score"]
+        job["skills_matched"] = skill_names(hit["skills_matched"])
+        job["skills_missing"] = skill_names(hit["skills_missing"])
+        results.append(job)
+        if len(results) == limit:
+            break
+    return results
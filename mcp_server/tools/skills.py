@@ -0,0 +1,127 @@
+"""Dictionary-based skill extraction with an Aho-Corasick automaton.
+
+Every alias in ``data/skills.json`` is compiled into one automaton, so a
+text is scanned once, in time linear in its length plus the number of
+matches, however large the dictionary grows. Matches must sit on word
+boundaries ("java" does not match inside "javascript"), and where aliases
+overlap the longest one wins ("react native" over "react").
+"""
+
+import json
+import re
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+
+DICTIONARY_PATH = Path(__file__).parent.parent / "data" / "skills.json"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over lowercase aliases, each mapped to a skill id."""
+
+    def __init__(self, aliases: dict[str, str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # (alias length, skill id) for every alias ending in this state
+        self._out: list[list[tuple[int, str]]] = [[]]
+
+        for alias, skill in aliases.items():
+            state = 0
+            for ch in alias:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((len(alias), skill))
+
+        # Breadth-first, so a state's failure target is always finished first
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for ch, nxt in self._goto[state].items():
+                pending.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def matches(self, text: str) -> list[tuple[int, int, str]]:
+        """Non-overlapping (start, end, skill id) matches in ``text``, leftmost-longest."""
+        text = _WHITESPACE.sub(" ", text.lower())
+        goto, fail, out = self._goto, self._fail, self._out
+        found = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, skill in out[state]:
+                start = i - length + 1
+                if _bounded(text, start, i + 1):
+                    found.append((start, i + 1, skill))
+
+        found.sort(key=lambda m: (m[0], m[0] - m[1]))
+        chosen = []
+        end = 0
+        for match in found:
+            if match[0] >= end:
+                chosen.append(match)
+                end = match[1]
+        return chosen
+
+    def extract(self, text: str) -> list[str]:
+        """Distinct skill ids found in ``text``, in order of first mention."""
+        return list(dict.fromkeys(skill for _, _, skill in self.matches(text)))
+
+
+def _bounded(text: str, start: int, end: int) -> bool:
+    # An alias must not continue a word on either side; "+" and "#" count as
+    # word characters so "c" can never match inside "c++" or "c#"
+    before = text[start - 1] if start > 0 else " "
+    after = text[end] if end < len(text) else " "
+    return not (before.isalnum() or after.isalnum() or after in "+#")
+
+
+@lru_cache(maxsize=1)
+def load_dictionary() -> dict:
+    return json.loads(DICTIONARY_PATH.read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=1)
+def _matcher() -> SkillMatcher:
+    skills = load_dictionary()["skills"]
+    return SkillMatcher({alias: sid for sid, skill in skills.items() for alias in skill["aliases"]})
+
+
+def extract_skills(text: str) -> list[str]:
+    """Canonical skill ids mentioned in ``text``, in order of first mention."""
+    return _matcher().extract(text or "")
+
+
+def skill_names(skill_ids: list[str]) -> list[str]:
+    """Display names for skill ids, e.g. ``["postgresql"]`` -> ``["PostgreSQL"]``."""
+    skills = load_dictionary()["skills"]
+    return [skills[sid]["name"] for sid in skill_ids if sid in skills]
+
+
+def job_skills(job: dict) -> list[str]:
+    """Skill ids for a normalized job: title, description and any board tags."""
+    tags = job.get("tags") or []
+    text = " . ".join([job.get("title") or "", job.get("description") or "", " , ".join(map(str, tags))])
+    return extract_skills(text)
+
+
+def normalize_skills(values: list[str]) -> list[str]:
+    """Skill ids for user input that may mix ids, names and aliases ("Postgres", "k8s")."""
+    skills = load_dictionary()["skills"]
+    found: list[str] = []
+    for value in values:
+        found.extend([value] if value in skills else extract_skills(value))
+    return list(dict.fromkeys(found))
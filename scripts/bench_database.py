@@ -0,0 +1,102 @@
+"""Benchmark the SQLite helpers with and without the connection pool.
+
+"Before" replaces the pool with a stand-in that opens a fresh, untuned
+connection per call (the old ``_get_conn`` behaviour); "after" uses the
+tuned, pooled connections.
+
+    python scripts/bench_database.py --ops 2000
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mcp_server.tools import database as db
+
+
+class UnpooledConnections:
+    """Open and close a plain connection on every call, like the old _get_conn()."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @contextmanager
+    def connection(self):
+        Path(self.path).parent.mkdir(exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def close(self):
+        pass
+
+
+def _job(i: int) -> dict:
+    return {
+        "source": "bench",
+        "source_id": str(i),
+        "title": f"Python Developer {i}",
+        "company": "Bench AB",
+        "location": "Stockholm",
+        "description": "Build APIs with FastAPI and SQLite. " * 10,
+    }
+
+
+def _rate(fn, n: int) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return n / (time.perf_counter() - start)
+
+
+def run(label: str, pool, ops: int) -> dict[str, float]:
+    db.close_pool()
+    db._pool = pool
+    db.init_db_sync()
+    user = db.get_or_create_default_user()
+
+    results = {}
+    results["save_job"] = _rate(lambda i: db.save_job(_job(i)), ops)
+    job_id = db.get_jobs(limit=1)[0][0]["id"]
+    app_ids = [db.create_application(user["id"], job_id)["id"] for _ in range(50)]
+    results["get_applications"] = _rate(lambda i: db.get_applications(user["id"]), ops)
+    statuses = ("applied", "phone_screen", "interview")
+    results["update_application_status"] = _rate(
+        lambda i: db.update_application_status(app_ids[i % len(app_ids)], statuses[i % 3]), ops
+    )
+    db.close_pool()
+
+    print(f"\n{label}")
+    for name, rate in results.items():
+        print(f"  {name:<28} {rate:>10,.0f} ops/sec")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        before_path = os.path.join(tmp, "before.db")
+        after_path = os.path.join(tmp, "after.db")
+        before = run("before (connection per call)", UnpooledConnections(before_path), args.ops)
+        after = run("after (pooled, tuned pragmas)", db.ConnectionPool(after_path), args.ops)
+
+    print("\nspeedup")
+    for name in before:
+        print(f"  {name:<28} {after[name] / before[name]:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark full-text search over saved jobs.
+
+Fills a temporary database with synthetic jobs through the normal bulk
+ingest path (so the FTS triggers are exercised), then times ranked
+``search_saved_jobs`` queries.
+
+    python scripts/bench_fts.py --jobs 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mcp_server.tools import database as db
+
+TITLES = ["Python Developer", "Backend Engineer", "Data Scientist", "DevOps Engineer",
+          "Frontend Developer", "Systemutvecklare", "ML Engineer", "Site Reliability Engineer"]
+CITIES = ["Stockholm", "Göteborg", "Malmö", "Uppsala", "Remote", "Berlin", "London"]
+SKILLS = ["python", "fastapi", "django", "flask", "react", "vue", "angular", "typescript", "javascript",
+          "kubernetes", "docker", "aws", "gcp", "azure", "postgres", "mysql", "sqlite", "mongodb", "kafka",
+          "spark", "airflow", "terraform", "ansible", "linux", "rust", "golang", "java", "kotlin", "scala",
+          "swift", "graphql", "redis", "elasticsearch", "pytorch", "tensorflow", "pandas", "numpy", "dbt",
+          "snowflake", "tableau", "jenkins", "gitlab", "c++", "c#", ".net", "php", "ruby", "rails", "node.js"]
+FILLER = ["we", "are", "looking", "for", "an", "experienced", "engineer", "to", "join", "our", "team", "and",
+          "build", "products", "that", "customers", "love", "you", "will", "work", "closely", "with",
+          "design", "and", "product"]
+
+QUERIES = ["python", "kubernetes stockholm", "data scien", "göteborg react", "rust golang", "engineer remote"]
+
+
+def _job(i: int, rng: random.Random) -> dict:
+    return {
+        "source": "bench",
+        "source_id": str(i),
+        "title": f"{rng.choice(TITLES)} {i}",
+        "company": f"Company {i % 5000} AB",
+        "location": rng.choice(CITIES),
+        "description": " ".join(rng.sample(SKILLS, 6) + rng.choices(FILLER, k=60)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db.close_pool()
+        db._pool = db.ConnectionPool(os.path.join(tmp, "fts.db"))
+        db.init_db_sync()
+
+        start = time.perf_counter()
+        for offset in range(0, args.jobs, 1000):
+            db.save_jobs_bulk([_job(i, rng) for i in range(offset, min(offset + 1000, args.jobs))])
+        print(f"ingested {args.jobs:,} jobs in {time.perf_counter() - start:.1f}s")
+
+        for query in QUERIES:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                hits = db.search_saved_jobs(query, limit=20)
+            elapsed = (time.perf_counter() - start) / args.repeat * 1000
+            print(f"  {query!r:<24} {len(hits):>3} hits  {elapsed:>8.2f} ms/query")
+        db.close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Latency of job board calls with cold vs. warm pooled connections.
+
+Runs the real board integrations against a local stand-in server that
+serves canned JobTech and RemoteOK payloads. "Cold" drops the shared
+clients before every call, so each search pays connection setup the way
+the old per-call ``httpx.AsyncClient`` did; "warm" reuses the pool.
+
+    python scripts/bench_http_client.py --requests 300 --delay-ms 2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+AF_PAYLOAD = json.dumps({"hits": [
+    {
+        "id": str(i),
+        "headline": f"Python Developer {i}",
+        "employer": {"name": "Stand-in AB"},
+        "workplace_address": {"city": "Stockholm"},
+        "description": {"text": "FastAPI, SQLite, asyncio. " * 20},
+        "publication_date": "2026-01-01T00:00:00",
+    }
+    for i in range(20)
+]}).encode()
+
+REMOTEOK_PAYLOAD = json.dumps([{"legal": "metadata"}] + [
+    {"id": i, "position": f"Backend Engineer {i}", "company": "Remote Inc", "description": "Python " * 50}
+    for i in range(20)
+]).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = AF_PAYLOAD if self.path.startswith("/search") else REMOTEOK_PAYLOAD
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+async def _measure(call, n: int, cold: bool) -> list[float]:
+    from mcp_server.tools.http_client import aclose_clients
+
+    samples = []
+    for _ in range(n):
+        if cold:
+            await aclose_clients()
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+    await aclose_clients()
+    return samples
+
+
+async def run(n: int):
+    from mcp_server.tools.job_boards import search_arbetsformedlingen, search_remoteok
+
+    calls = {
+        "arbetsformedlingen": lambda: search_arbetsformedlingen("python", limit=20),
+        "remoteok": lambda: search_remoteok("python", limit=20),
+    }
+    print(f"{'source':<20}{'mode':<7}{'p50 ms':>9}{'p99 ms':>9}{'mean ms':>9}")
+    for name, call in calls.items():
+        await call()  # warm imports and the server thread
+        for mode in ("cold", "warm"):
+            samples = await _measure(call, n, cold=mode == "cold")
+            print(f"{name:<20}{mode:<7}{_percentile(samples, 50):>9.2f}"
+                  f"{_percentile(samples, 99):>9.2f}{statistics.mean(samples):>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="server-side latency per request")
+    args = parser.parse_args()
+
+    StandInHandler.delay = args.delay_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    # Must be set before the integrations are imported
+    os.environ["AF_BASE_URL"] = base
+    os.environ["REMOTEOK_BASE_URL"] = base
+
+    try:
+        asyncio.run(run(args.requests))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Compare LLM calls made directly against calls through the LLM gateway.
+
+A fake model with limited capacity stands in for the API. It rejects a
+call as overloaded while more than ``--capacity`` calls are in flight.
+``--calls`` concurrent calls are fired at it directly, with no cap and no
+retries (the old per-node ``ChatAnthropic`` behaviour), then through
+``LLMGateway``. Also times building a chat client per call versus reusing
+one, which is what every node invocation used to pay before sending
+anything.
+
+    python scripts/bench_llm_gateway.py --calls 40 --capacity 8 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.messages import HumanMessage
+
+from agents.llm import FakeChatModel, LLMGateway, LLMOverloadedError
+
+
+class LimitedCapacityModel(FakeChatModel):
+    capacity: int = 8
+    in_flight: int = 0
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        self.in_flight += 1
+        try:
+            if self.in_flight > self.capacity:
+                await asyncio.sleep(0.01)
+                raise LLMOverloadedError("overloaded")
+            return await super()._agenerate(messages, stop, run_manager, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+async def _fire(invoke, calls: int) -> dict:
+    latencies, failures = [], 0
+
+    async def one(i: int):
+        nonlocal failures
+        start = time.perf_counter()
+        try:
+            await invoke([HumanMessage(content=f"Write a cover letter for job {i}")])
+        except LLMOverloadedError:
+            failures += 1
+            return
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one(i) for i in range(calls)])
+    return {
+        "wall": time.perf_counter() - start,
+        "ok": len(latencies),
+        "failed": failures,
+        "p50": statistics.median(latencies) if latencies else 0.0,
+        "max": max(latencies, default=0.0),
+    }
+
+
+def _client_build_ms(repeat: int = 20) -> float | None:
+    try:
+        from langchain_anthropic import ChatAnthropic
+    except ImportError:
+        return None
+    start = time.perf_counter()
+    for _ in range(repeat):
+        # The SDK client behind a chat model is built on first access
+        _ = ChatAnthropic(model="claude-sonnet-4-20250514", max_tokens=2000, api_key="bench")._async_client
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def run(args):
+    direct_model = LimitedCapacityModel(latency=args.latency, capacity=args.capacity)
+    direct = await _fire(direct_model.ainvoke, args.calls)
+
+    gateway_model = LimitedCapacityModel(latency=args.latency, capacity=args.capacity)
+    gateway = LLMGateway(model=gateway_model, concurrency=args.capacity, limits={})
+    gated = await _fire(lambda messages: gateway.ainvoke(messages, "tailor"), args.calls)
+    retries = gateway.stats()["actions"]["tailor"]["retries"]
+
+    print(f"{args.calls} concurrent calls, model capacity {args.capacity}, {args.latency}s per call")
+    print(f"{'':<10}{'ok':>5}{'failed':>8}{'retries':>9}{'wall s':>9}{'p50 s':>8}{'max s':>8}")
+    for label, r, n in (("direct", direct, 0), ("gateway", gated, retries)):
+        print(f"{label:<10}{r['ok']:>5}{r['failed']:>8}{n:>9}{r['wall']:>9.2f}{r['p50']:>8.2f}{r['max']:>8.2f}")
+
+    build = _client_build_ms()
+    if build is not None:
+        print(f"\nbuilding a ChatAnthropic client: {build:.1f} ms per call before any request "
+              f"(plus a fresh connection pool); reused by the gateway")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=40)
+    parser.add_argument("--capacity", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.3)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark deep paging through job and application listings.
+
+Fills a temporary database, then times fetching page N of 50 rows with the
+keyset cursors used by ``get_jobs``/``get_applications`` against the
+LIMIT/OFFSET equivalent, for increasing N.
+
+    python scripts/bench_pagination.py --rows 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+PAGE = 50
+
+
+def populate(db, rows: int) -> str:
+    user = db.get_or_create_default_user()
+    rng = random.Random(1)
+
+    def stamp() -> str:
+        return f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00"
+
+    with db._conn() as conn:
+        jobs = [(str(uuid.uuid4()), "bench", str(i), "Engineer", "Acme", stamp()) for i in range(rows)]
+        conn.executemany("INSERT INTO jobs (id, source, source_id, title, company, created_at) VALUES (?, ?, ?, ?, ?, ?)", jobs)
+        conn.executemany(
+            "INSERT INTO applications (id, user_id, job_id, status, created_at, updated_at) VALUES (?, ?, ?, 'saved', ?, ?)",
+            [(str(uuid.uuid4()), user["id"], job[0], job[5], stamp()) for job in jobs],
+        )
+        conn.commit()
+    return user["id"]
+
+
+def _time(fn, repeat: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DB_FILE_PATH"] = os.path.join(tmp, "bench.db")
+        from mcp_server.tools import database as db
+
+        db.init_db_sync()
+        user_id = populate(db, args.rows)
+
+        # Cursors for the start of each measured page, collected by walking forward
+        depths = [p for p in (1, 10, 100, 1000, args.rows // PAGE) if p * PAGE <= args.rows]
+        cursors = {"jobs": {}, "applications": {}}
+        for name, fetch in (
+            ("jobs", lambda c: db.get_jobs(limit=PAGE, cursor=c)),
+            ("applications", lambda c: db.get_applications(user_id, limit=PAGE, cursor=c)),
+        ):
+            cursor = None
+            for page in range(1, max(depths) + 1):
+                if page in depths:
+                    cursors[name][page] = cursor
+                _, cursor = fetch(cursor)
+
+        offset_sql = {
+            "jobs": ("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ? OFFSET ?", ()),
+            "applications": (
+                ("SELECT a.*, j.title as job_title, j.company FROM applications a JOIN jobs j ON a.job_id = j.id "
+                 "WHERE a.user_id = ? ORDER BY a.updated_at DESC LIMIT ? OFFSET ?"),
+                (user_id,),
+            ),
+        }
+
+        print(f"{args.rows} rows, {PAGE} per page")
+        print(f"{'listing':<14}{'page':>7}{'keyset ms':>12}{'offset ms':>12}")
+        for name in ("jobs", "applications"):
+            for page in depths:
+                cursor = cursors[name][page]
+                if name == "jobs":
+                    keyset = _time(lambda cursor=cursor: db.get_jobs(limit=PAGE, cursor=cursor))
+                else:
+                    keyset = _time(lambda cursor=cursor: db.get_applications(user_id, limit=PAGE, cursor=cursor))
+                sql, params = offset_sql[name]
+                with db._conn() as conn:
+                    offset = _time(
+                        lambda conn=conn, sql=sql, params=params, page=page:
+                        conn.execute(sql, (*params, PAGE, (page - 1) * PAGE)).fetchall()
+                    )
+                print(f"{name:<14}{page:>7}{keyset:>12.2f}{offset:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
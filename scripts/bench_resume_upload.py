@@ -0,0 +1,155 @@
+"""Measure API latency while resumes are being uploaded and parsed.
+
+Starts the FastAPI app in-process on a temporary database, keeps several
+clients uploading a generated multi-page PDF, and meanwhile polls
+/api/health and /api/jobs. "Before" parses on the event loop thread (the
+old behaviour); "after" uses the process pool.
+
+    python scripts/bench_resume_upload.py --pages 30 --uploaders 3 --seconds 10
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+import uvicorn
+
+
+def make_pdf(pages: int) -> bytes:
+    """A minimal text-only PDF with ``pages`` pages of resume-like lines."""
+    lines = [f"Senior Python Developer {i} - built FastAPI services, SQLite, Kubernetes" for i in range(45)]
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for _ in range(pages):
+        text = "".join(f"({line}) Tj 0 -15 Td " for line in lines)
+        stream = f"BT /F1 10 Tf 40 780 Td {text}ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        " ".join(f"{k} 0 R" for k in kids).encode(), pages,
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))] if values else 0.0
+
+
+async def _load(base: str, pdf: bytes, uploaders: int, seconds: float) -> dict:
+    stop = time.perf_counter() + seconds
+    uploads: list[float] = []
+    probes: list[float] = []
+
+    async with httpx.AsyncClient(base_url=base, timeout=120) as client:
+        async def upload(n: int):
+            while time.perf_counter() < stop:
+                start = time.perf_counter()
+                resp = await client.post("/api/resumes/upload", files={"file": (f"cv-{n}.pdf", pdf, "application/pdf")})
+                resp.raise_for_status()
+                uploads.append(time.perf_counter() - start)
+
+        async def probe():
+            paths = ("/api/health", "/api/jobs?limit=5")
+            i = 0
+            while time.perf_counter() < stop:
+                start = time.perf_counter()
+                await client.get(paths[i % 2])
+                probes.append(time.perf_counter() - start)
+                i += 1
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(probe(), *[upload(n) for n in range(uploaders)])
+
+    return {
+        "uploads": len(uploads),
+        "upload_p50_ms": statistics.median(uploads) * 1000 if uploads else 0.0,
+        "probe_p50_ms": statistics.median(probes) * 1000 if probes else 0.0,
+        "probe_p99_ms": _percentile(probes, 0.99) * 1000,
+        "probe_max_ms": max(probes, default=0.0) * 1000,
+    }
+
+
+def run(label: str, inline: bool, pdf: bytes, args) -> dict:
+    from backend.main import app
+    from backend.routers import resumes
+    from mcp_server.tools import resume_parser
+
+    original = resumes.parse_resume_async
+    if inline:
+        async def parse_inline(file_path: str) -> dict:
+            return resume_parser.parse_resume(file_path)
+        resumes.parse_resume_async = parse_inline
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    try:
+        result = asyncio.run(_load(f"http://127.0.0.1:{port}", pdf, args.uploaders, args.seconds))
+    finally:
+        server.should_exit = True
+        thread.join()
+        resumes.parse_resume_async = original
+
+    print(f"\n{label}")
+    print(f"  uploads completed      {result['uploads']:>8}")
+    print(f"  upload p50             {result['upload_p50_ms']:>8.0f} ms")
+    print(f"  other requests p50     {result['probe_p50_ms']:>8.1f} ms")
+    print(f"  other requests p99     {result['probe_p99_ms']:>8.1f} ms")
+    print(f"  other requests max     {result['probe_max_ms']:>8.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=30)
+    parser.add_argument("--uploaders", type=int, default=3)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DB_FILE_PATH"] = os.path.join(tmp, "bench.db")
+        os.environ["INGEST_SCHEDULER_ENABLED"] = "false"
+        os.chdir(tmp)  # uploads land in ./data/uploads
+        pdf = make_pdf(args.pages)
+        print(f"{args.pages}-page PDF, {len(pdf) / 1024:.0f} KiB, {args.uploaders} concurrent uploaders")
+        run("before (parse on the event loop)", True, pdf, args)
+        run("after (process pool)", False, pdf, args)
+
+
+if __name__ == "__main__":
+    main()
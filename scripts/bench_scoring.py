@@ -0,0 +1,60 @@
+"""Exercise the batched scoring engine against a fake chat model.
+
+The fake model (``agents.llm.FakeChatModel``) sleeps for a configurable
+latency, scores every job id it finds in the prompt, and fails a
+configurable share of calls, so batch concurrency, merge-by-id and the
+LLM gateway's retries can be checked offline.
+
+    python scripts/bench_scoring.py --jobs 60 --latency 0.5 --failure-rate 0.2
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.llm import FakeChatModel, LLMGateway
+from agents.scoring import score_jobs
+
+
+async def run(args):
+    random.seed(args.seed)
+    jobs = [{"id": f"job-{i}", "title": f"Engineer {i}", "company": "Fake AB", "description": "Python"} for i in range(args.jobs)]
+
+    for concurrency in (1, args.concurrency):
+        model = FakeChatModel(latency=args.latency, failure_rate=args.failure_rate)
+        # The gateway caps batches in flight and retries overloads, as in the agents
+        gateway = LLMGateway(model=model, limits={"scoring": concurrency}, max_retries=args.retries)
+        start = time.perf_counter()
+        result = await score_jobs(
+            gateway.client("scoring"), "Python developer", jobs,
+            batch_size=args.batch_size,
+        )
+        elapsed = time.perf_counter() - start
+        stats = result["stats"]
+        calls = gateway.stats()["actions"]["scoring"]
+        print(f"concurrency={concurrency:<3} scored {len(result['matches'])}/{len(jobs)} jobs "
+              f"in {elapsed:.2f}s — {model.calls} calls, {stats['batches']} batches, "
+              f"{calls['retries']} retries, {stats['failed_batches']} failed, "
+              f"p50 {calls['p50_ms']:.0f} ms, {calls['input_tokens']}/{calls['output_tokens']} tokens in/out")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=60)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--failure-rate", type=float, default=0.2)
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
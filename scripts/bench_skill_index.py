@@ -0,0 +1,85 @@
+"""Benchmark skill-overlap filtering over a large stored corpus.
+
+Writes synthetic jobs and their skills straight into a temporary database
+(bypassing ingest, which is not what is measured here), then times the
+one-off index load and ``find_jobs_by_skills`` queries for resume-sized
+skill sets.
+
+    python scripts/bench_skill_index.py --jobs 100000 --queries 200
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def populate(db, jobs: int, rng: random.Random) -> list[str]:
+    skills = list(db.load_dictionary()["skills"])
+    # Zipf-ish popularity: a few skills appear in most ads, most are rare
+    weights = [1 / (rank + 1) for rank in range(len(skills))]
+    rng.shuffle(skills)
+    now = db._now()
+    with db._conn() as conn:
+        for start in range(0, jobs, 10000):
+            rows, pairs = [], []
+            for _ in range(min(10000, jobs - start)):
+                job_id = str(uuid.uuid4())
+                rows.append((job_id, "bench", job_id, "Engineer", "Acme", now))
+                for skill in set(rng.choices(skills, weights, k=rng.randint(3, 15))):
+                    pairs.append((job_id, skill))
+            conn.executemany(
+                "INSERT INTO jobs (id, source, source_id, title, company, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany("INSERT INTO job_skills (job_id, skill_id) VALUES (?, ?)", pairs)
+        db._bump_index_version(conn, "job_skills")
+        conn.commit()
+    return skills
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DB_FILE_PATH"] = os.path.join(tmp, "bench.db")
+        from mcp_server.tools import database as db
+        from mcp_server.tools.skill_index import find_jobs_by_skills, skill_index
+        db.init_db_sync()
+
+        rng = random.Random(7)
+        start = time.perf_counter()
+        skills = populate(db, args.jobs, rng)
+        print(f"{args.jobs} jobs written in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        skill_index.refresh()
+        print(f"index load: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        timings = []
+        hits = 0
+        for _ in range(args.queries):
+            query = rng.sample(skills, rng.randint(8, 25))
+            start = time.perf_counter()
+            hits += len(find_jobs_by_skills(query, limit=args.limit))
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(f"find_jobs_by_skills over {args.jobs} jobs ({args.queries} queries, "
+              f"{hits / args.queries:.0f} results avg):")
+        print(f"  p50 {statistics.median(timings) * 1000:.2f} ms   "
+              f"p95 {timings[int(len(timings) * 0.95)] * 1000:.2f} ms   max {timings[-1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
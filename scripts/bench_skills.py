@@ -0,0 +1,78 @@
+"""Benchmark skill extraction throughput on large job descriptions.
+
+Compares the Aho-Corasick matcher against the obvious alternative, one
+word-bounded regex search per dictionary alias, on synthetic descriptions
+of increasing size.
+
+    python scripts/bench_skills.py --sizes 2000 20000 200000 --repeat 20
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mcp_server.tools.skills import _matcher, extract_skills, load_dictionary
+
+FILLER = ["we", "are", "looking", "for", "an", "experienced", "engineer", "to", "join", "our", "team", "and",
+          "build", "products", "that", "customers", "love", "you", "will", "work", "closely", "with",
+          "design", "and", "product", "on"]
+
+
+def make_description(chars: int, rng: random.Random) -> str:
+    aliases = [alias for skill in load_dictionary()["skills"].values() for alias in skill["aliases"]]
+    words = []
+    size = 0
+    while size < chars:
+        word = rng.choice(aliases) if rng.random() < 0.08 else rng.choice(FILLER)
+        words.append(word.title() if rng.random() < 0.1 else word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def regex_extract(patterns: list[tuple[re.Pattern, str]], text: str) -> list[str]:
+    text = text.lower()
+    return list(dict.fromkeys(skill for pattern, skill in patterns if pattern.search(text)))
+
+
+def _time(fn, text: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000, 200000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    dictionary = load_dictionary()["skills"]
+    start = time.perf_counter()
+    _matcher()
+    build_ms = (time.perf_counter() - start) * 1000
+    patterns = [
+        (re.compile(rf"(?<![\w+#]){re.escape(alias)}(?![\w+#])"), sid)
+        for sid, skill in dictionary.items() for alias in skill["aliases"]
+    ]
+    print(f"{len(dictionary)} skills, {len(patterns)} aliases, automaton built in {build_ms:.1f} ms")
+
+    rng = random.Random(42)
+    print(f"\n{'chars':>10} {'skills':>7} {'aho-corasick':>14} {'MB/s':>7} {'per-alias regex':>16} {'MB/s':>7}")
+    for size in args.sizes:
+        text = make_description(size, rng)
+        found = extract_skills(text)
+        ac = _time(extract_skills, text, args.repeat)
+        rx = _time(lambda t: regex_extract(patterns, t), text, args.repeat)
+        mb = len(text.encode()) / 1e6
+        print(f"{len(text):>10} {len(found):>7} {ac * 1000:>11.2f} ms {mb / ac:>7.1f} "
+              f"{rx * 1000:>13.2f} ms {mb / rx:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Load-test the API with concurrent clients hitting database-backed routes.
+
+Serves the FastAPI app from a child process on a temporary database filled
+with synthetic jobs, while a thread in that process keeps ingesting new
+postings the way the saved-search scheduler does. ``--clients`` concurrent
+clients then hit a mix of list, full-text search, skill-match and
+application routes (including writes) for ``--seconds``. "Before" runs the
+database helpers inline on the event loop (the old behaviour); "after" uses
+the async data-access layer.
+
+    python scripts/load_test_api.py --jobs 20000 --clients 32 --seconds 10
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+import uvicorn
+
+TITLES = ["Python Developer", "Backend Engineer", "Data Scientist", "DevOps Engineer",
+          "Frontend Developer", "ML Engineer", "Site Reliability Engineer"]
+SKILLS = ["Python", "FastAPI", "Django", "React", "TypeScript", "Kubernetes", "Docker", "AWS", "PostgreSQL",
+          "Kafka", "Spark", "Terraform", "Rust", "Go", "Java", "Kotlin", "GraphQL", "Redis", "Elasticsearch",
+          "PyTorch", "pandas", "Snowflake"]
+FILLER = ["we", "are", "looking", "for", "an", "experienced", "engineer", "to", "join", "our", "team", "and",
+          "build", "products", "that", "customers", "love", "you", "will", "work", "closely", "with",
+          "design", "and", "product"]
+
+ROUTES = [
+    "/api/jobs?limit=50",
+    "/api/jobs?q=python%20kubernetes&limit=20",
+    "/api/jobs?q=senior%20engineer&limit=20",
+    "/api/jobs/by-skills?skills=python,django,postgresql,aws&limit=20",
+    "/api/applications",
+    "/api/resumes/primary",
+]
+
+
+def make_jobs(count: int, rng: random.Random) -> list[dict]:
+    jobs = []
+    for _ in range(count):
+        words = rng.choices(FILLER, k=120) + rng.sample(SKILLS, 6)
+        rng.shuffle(words)
+        jobs.append({
+            "source": "bench", "source_id": uuid.uuid4().hex, "title": rng.choice(TITLES),
+            "company": f"Company {rng.randrange(800)}", "location": "Stockholm", "description": " ".join(words),
+        })
+    return jobs
+
+
+def populate(jobs: int) -> None:
+    from mcp_server.tools import database as db
+
+    db.init_db_sync()
+    rng = random.Random(3)
+    for start in range(0, jobs, 1000):
+        db.save_jobs_bulk(make_jobs(min(1000, jobs - start), rng))
+
+
+def _ingest_forever(batch: int) -> None:
+    from mcp_server.tools import database as db
+
+    rng = random.Random()
+    while True:
+        db.save_jobs_bulk(make_jobs(batch, rng))
+        time.sleep(0.2)
+
+
+def _serve(port: int, inline: bool, ingest_batch: int) -> None:
+    from backend.main import app
+    from backend.routers import jobs
+    from mcp_server.tools import async_database
+
+    if inline:
+        async def run_inline(fn, *a, **kw):
+            return fn(*a, **kw)
+        async_database.run = jobs.run = run_inline
+    if ingest_batch:
+        threading.Thread(target=_ingest_forever, args=(ingest_batch,), daemon=True).start()
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))] if values else 0.0
+
+
+async def _load(base: str, clients: int, seconds: float) -> dict:
+    latencies: list[float] = []
+    probes: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=clients + 1)
+
+    async with httpx.AsyncClient(base_url=base, timeout=60, limits=limits) as client:
+        job_ids = [job["id"] for job in (await client.get("/api/jobs?limit=200")).json()["jobs"]]
+        stop = time.perf_counter() + seconds
+
+        async def worker(n: int):
+            nonlocal errors
+            i = n
+            while time.perf_counter() < stop:
+                start = time.perf_counter()
+                if i % (len(ROUTES) + 1) == len(ROUTES):
+                    resp = await client.post("/api/applications", json={"job_id": random.choice(job_ids)})
+                else:
+                    resp = await client.get(ROUTES[i % (len(ROUTES) + 1)])
+                latencies.append(time.perf_counter() - start)
+                errors += resp.status_code >= 400
+                i += 1
+
+        async def probe():
+            # A route that never touches the database: shows event loop stalls
+            while time.perf_counter() < stop:
+                start = time.perf_counter()
+                await client.get("/api/health")
+                probes.append(time.perf_counter() - start)
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(probe(), *[worker(n) for n in range(clients)])
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / seconds,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "probe_p50_ms": statistics.median(probes) * 1000 if probes else 0.0,
+        "probe_p99_ms": _percentile(probes, 0.99) * 1000,
+    }
+
+
+def _wait_for(base: str) -> None:
+    while True:
+        try:
+            httpx.get(f"{base}/api/health").raise_for_status()
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+
+
+def run(label: str, inline: bool, args) -> dict:
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    server = multiprocessing.get_context("spawn").Process(target=_serve, args=(port, inline, args.ingest_batch))
+    server.start()
+    try:
+        _wait_for(base)
+        result = asyncio.run(_load(base, args.clients, args.seconds))
+    finally:
+        server.terminate()
+        server.join()
+
+    print(f"\n{label}")
+    print(f"  requests               {result['requests']:>8} ({result['errors']} errors)")
+    print(f"  throughput             {result['rps']:>8.0f} req/s")
+    print(f"  latency p50 / p99      {result['p50_ms']:>8.1f} / {result['p99_ms']:.1f} ms")
+    print(f"  /api/health p50 / p99  {result['probe_p50_ms']:>8.1f} / {result['probe_p99_ms']:.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--ingest-batch", type=int, default=500,
+                        help="jobs per background ingest batch; 0 for a read-mostly run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DB_FILE_PATH"] = os.path.join(tmp, "bench.db")
+        os.environ["INGEST_SCHEDULER_ENABLED"] = "false"
+        os.chdir(tmp)
+        start = time.perf_counter()
+        populate(args.jobs)
+        print(f"{args.jobs} jobs loaded in {time.perf_counter() - start:.1f}s, {args.clients} concurrent clients, "
+              f"background ingest of {args.ingest_batch} jobs per batch")
+        run("before (database calls on the event loop)", True, args)
+        run("after (async data-access layer)", False, args)
+
+
+if __name__ == "__main__":
+    main()
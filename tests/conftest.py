@@ -0,0 +1,13 @@
+import pytest
+
+from mcp_server.tools import database
+
+
+@pytest.fixture
+def db(tmp_path):
+    """The database helpers, pointed at a fresh migrated database."""
+    database.close_pool()
+    database._pool = database.ConnectionPool(str(tmp_path / "test.db"))
+    database.init_db_sync()
+    yield database
+    database.close_pool()
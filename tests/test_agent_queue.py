@@ -0,0 +1,84 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from backend.agent_queue import AgentRunQueue
+
+
+@pytest.mark.asyncio
+async def test_action_limit_holds_with_concurrent_workers(db, monkeypatch):
+    running = {"now": 0, "peak": 0}
+
+    async def run_workflow(action, params):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.05)
+        running["now"] -= 1
+        return {"action": action}
+
+    monkeypatch.setattr("agents.orchestrator.run_workflow", run_workflow)
+    queue = AgentRunQueue(workers=4, limits={"search_jobs": 2})
+    runs = [await queue.submit("search_jobs", {"n": i}) for i in range(8)]
+
+    await queue.start()
+    try:
+        for _ in range(200):
+            if all(db.get_agent_run(run["id"])["status"] == "completed" for run in runs):
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        await queue.stop()
+
+    assert all(db.get_agent_run(run["id"])["status"] == "completed" for run in runs)
+    assert running["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_worker_survives_a_failed_result_write(db, monkeypatch):
+    async def run_workflow(action, params):
+        return {"n": params["n"]}
+
+    failures = []
+
+    async def finish_agent_run(run_id, **kwargs):
+        if not failures:
+            failures.append(run_id)
+            raise sqlite3.OperationalError("database is locked")
+        db.finish_agent_run(run_id, **kwargs)
+
+    monkeypatch.setattr("agents.orchestrator.run_workflow", run_workflow)
+    monkeypatch.setattr("backend.agent_queue.finish_agent_run", finish_agent_run)
+    queue = AgentRunQueue(workers=1, limits={})
+    await queue.start()
+    try:
+        first = await queue.submit("search_jobs", {"n": 1})
+        second = await queue.submit("search_jobs", {"n": 2})
+        for _ in range(200):
+            if db.get_agent_run(second["id"])["status"] == "completed":
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        await queue.stop()
+
+    assert failures == [first["id"]]
+    assert db.get_agent_run(second["id"])["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_shutdown_requeues_without_spending_an_attempt(db, monkeypatch):
+    started = asyncio.Event()
+
+    async def run_workflow(action, params):
+        started.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr("agents.orchestrator.run_workflow", run_workflow)
+    queue = AgentRunQueue(workers=1, limits={})
+    run = await queue.submit("search_jobs", {})
+    await queue.start()
+    await asyncio.wait_for(started.wait(), timeout=5)
+    await queue.stop()
+
+    run = db.get_agent_run(run["id"])
+    assert (run["status"], run["attempts"]) == ("queued", 0)
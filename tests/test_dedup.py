@@ -0,0 +1,90 @@
+import random
+
+import numpy as np
+
+from mcp_server.tools import dedup
+
+WORDS = ["python", "django", "postgres", "kubernetes", "team", "product", "customers", "remote", "office",
+         "build", "ship", "scale", "data", "pipelines", "cloud", "aws", "senior", "engineer", "backend",
+         "frontend", "react", "design", "review", "mentor"]
+
+
+def _description(rng: random.Random, words: int = 80) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b)
+
+
+def test_signature_estimates_jaccard():
+    rng = random.Random(5)
+    errors = []
+    for _ in range(200):
+        base = {"title": "Backend Engineer", "company": "Acme", "description": _description(rng)}
+        # Rewrite a random share of the description's words
+        words = base["description"].split()
+        share = rng.random()
+        edited = [rng.choice(WORDS) if rng.random() < share else w for w in words]
+        other = {**base, "description": " ".join(edited)}
+
+        true = _jaccard(dedup.shingles(base), dedup.shingles(other))
+        estimate = dedup.similarity(dedup.signature(base), dedup.signature(other))
+        errors.append(abs(estimate - true))
+
+    assert np.mean(errors) < 0.05
+    assert max(errors) < 0.2
+
+
+def test_signature_is_deterministic():
+    job = {"title": "Data Engineer", "company": "Acme AB", "description": "Spark and Airflow"}
+    assert dedup.to_blob(dedup.signature(job)) == dedup.to_blob(dedup.signature(dict(job)))
+
+
+def test_same_role_ignores_word_order_and_seniority_words():
+    assert dedup.same_role("Senior Python Developer", "Python Developer (Senior)")
+    assert dedup.same_role("Backend Engineer", "Senior Backend Engineer")
+    assert not dedup.same_role("Backend Engineer", "Product Designer")
+
+
+def _job(source: str, source_id: str, title: str, description: str) -> dict:
+    return {"source": source, "source_id": source_id, "title": title, "company": "Acme AB",
+            "location": "Stockholm", "description": description}
+
+
+def test_cross_posted_job_links_to_canonical(db):
+    description = "Acme builds payment infrastructure. " + _description(random.Random(1))
+    first, second = db.save_jobs_bulk([
+        _job("remoteok", "1", "Senior Backend Engineer", description),
+        _job("adzuna", "a1", "Backend Engineer (Senior)", description[:300]),
+    ])
+    assert second["canonical_id"] == first["id"]
+
+
+def test_same_company_different_role_is_not_a_duplicate(db):
+    # Shared company boilerplate dominates both descriptions
+    boilerplate = "About Acme: " + _description(random.Random(3), words=70) + " "
+    backend, designer = db.save_jobs_bulk([
+        _job("remoteok", "1", "Backend Engineer", boilerplate + "You will write Go services."),
+        _job("remoteok", "2", "Product Designer", boilerplate + "You will own our design system."),
+    ])
+    assert dedup.similarity(
+        dedup.signature(backend), dedup.signature(designer)
+    ) >= dedup.DEDUP_THRESHOLD
+    assert designer["canonical_id"] == designer["id"]
+
+
+def test_outdated_signatures_are_rebuilt(db):
+    description = _description(random.Random(2))
+    first, second = db.save_jobs_bulk([
+        _job("remoteok", "1", "Data Engineer", description),
+        _job("adzuna", "a1", "Data Engineer", description),
+    ])
+    with db._conn() as conn:
+        conn.execute("UPDATE jobs SET canonical_id = NULL")
+        conn.execute("DELETE FROM job_signatures")
+        conn.execute("UPDATE derived_versions SET version = '1' WHERE name = 'job_signatures'")
+        conn.commit()
+
+    db.init_db_sync()
+    assert [job["canonical_id"] for job in db.get_jobs_by_ids([first["id"], second["id"]])] == [first["id"]] * 2
@@ -0,0 +1,49 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from backend.routers import jobs
+from mcp_server.tools import database
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(jobs.router)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_cursor_with_ranked_search_is_rejected(client, db):
+    db.save_jobs_bulk([
+        {"source": "remoteok", "source_id": str(i), "title": f"Python Developer {i}", "company": "Acme"}
+        for i in range(3)
+    ])
+    first = (await client.get("/api/jobs", params={"limit": 2})).json()
+
+    response = await client.get("/api/jobs", params={"q": "python", "cursor": first["next_cursor"]})
+
+    assert response.status_code == 400
+    assert (await client.get("/api/jobs", params={"q": "python"})).json()["count"] == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, 501])
+async def test_skill_search_limit_is_bounded(client, limit):
+    response = await client.get("/api/jobs/by-skills", params={"skills": "python", "limit": limit})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", [
+    "not base64 json",
+    database.encode_cursor("2026-10-01"),
+    database.encode_cursor({"a": 1}, [2]),
+    database.encode_cursor(1, None),
+])
+async def test_malformed_cursor_is_a_400(client, cursor):
+    response = await client.get("/api/jobs", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
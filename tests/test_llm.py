@@ -0,0 +1,24 @@
+import json
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from agents.llm import FakeChatModel, LLMOverloadedError
+
+
+def test_fake_model_answers_sync_calls():
+    model = FakeChatModel(latency=0)
+    prompt = [HumanMessage(content="[j1] Python Developer\n[j2] Go Developer")]
+
+    response = model.invoke(prompt)
+
+    assert [m["job_id"] for m in json.loads(response.content)["matches"]] == ["j2", "j1"]
+    assert response.usage_metadata["output_tokens"] > 0
+    assert model.calls == 1
+
+
+def test_fake_model_sync_failures():
+    model = FakeChatModel(latency=0, failure_rate=1)
+
+    with pytest.raises(LLMOverloadedError):
+        model.invoke([HumanMessage(content="Write a cover letter")])
@@ -0,0 +1,181 @@
+"""Fail when a query in mcp_server/tools/database.py scans a whole table.
+
+Every public helper in ``database`` is called against a migrated, seeded
+database with SQLite tracing on, and every statement they ran is checked
+with EXPLAIN QUERY PLAN. A full table scan fails the test unless it is on
+ALLOWED_SCANS. A public helper that ``exercise()`` never calls fails it
+too, so new helpers get their queries checked.
+"""
+
+import inspect
+import re
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from mcp_server.tools import database
+
+# (table, statement regex, why a full scan is fine there)
+ALLOWED_SCANS = [
+    ("users", r"FROM users LIMIT 1$", "the single default user; LIMIT 1 stops at the first row"),
+    ("skills", r"FROM skills", "the skill dictionary, a few hundred rows"),
+    ("job_skills", r"group_concat\(skill_id\)", "loading the whole skill index is the point"),
+    ("resumes", r"SELECT id, raw_text FROM resumes$", "reindex_skills re-tags every resume"),
+    ("jobs_fts", r"jobs_fts", "FTS5 virtual table; MATCH uses its own index"),
+]
+
+# Helpers with no queries of their own, or not worth a query to check
+NOT_QUERIES = {"get_pool", "close_pool", "content_hash", "encode_cursor", "decode_cursor", "migrate", "init_db_sync"}
+
+_SCAN = re.compile(r"^SCAN (\w+)$")
+_AUTOMATIC = re.compile(r"^SEARCH (\w+) USING AUTOMATIC")
+
+
+def _scanned_table(step: str, sql: str, tables: set[str]) -> str | None:
+    """The table a plan step reads in full (or indexes on the fly), else None.
+
+    Plans name tables by their alias and subqueries by theirs; subquery scans
+    are covered by the plans of their own inner statements.
+    """
+    match = _SCAN.match(step) or _AUTOMATIC.match(step)
+    if not match:
+        return None
+    name = match.group(1)
+    if name in tables:
+        return name
+    for table in tables:
+        if re.search(rf"\b{table}\s+(?:AS\s+)?{name}\b", sql, re.IGNORECASE):
+            return table
+    return None
+
+
+def exercise(db) -> None:
+    """Call every public query helper at least once, with realistic data."""
+    now = datetime.now(UTC)
+    user = db.get_or_create_default_user()
+    jobs = db.save_jobs_bulk([
+        {"source": "remoteok", "source_id": str(i), "title": f"Python Developer {i}", "company": "Acme",
+         "description": "Django, PostgreSQL and Kubernetes on AWS.", "tags": ["python"]}
+        for i in range(30)
+    ])
+    db.save_job({"source": "adzuna", "source_id": "x", "title": "Python Developer 1", "company": "Acme",
+                 "description": "Django, PostgreSQL and Kubernetes on AWS."})
+    db.find_jobs([{"source": "remoteok", "source_id": "1"}])
+    _, cursor = db.get_jobs(limit=10)
+    db.get_jobs(limit=10, cursor=cursor)
+    db.get_job(jobs[0]["id"])
+    db.get_jobs_by_ids([j["id"] for j in jobs[:5]])
+    db.search_saved_jobs("python django")
+    db.get_index_version("job_skills")
+    db.get_job_skill_sets()
+    db.rebuild_job_index()
+    db.schema_version()
+
+    resume = db.save_resume(user["id"], "cv.pdf", {"skills": []}, "Python and Django", file_hash="h1",
+                            skills=["python", "django"])
+    db.set_primary_resume(user["id"], resume["id"])
+    db.find_resume_by_hash("h1", user_id=user["id"])
+    db.find_resume_by_hash("h1")
+    db.get_primary_resume(user["id"])
+    db.get_resumes(user["id"])
+    db.get_resume_skills(resume["id"])
+    db.reindex_skills()
+
+    search = db.create_saved_search(user["id"], "python", location="Stockholm")
+    db.get_saved_searches(user["id"])
+    db.get_saved_search(search["id"])
+    db.get_due_saved_searches(now.isoformat())
+    db.get_search_watermarks(search["id"])
+    db.record_saved_search_run(search["id"], {"remoteok": {"count": 1, "watermark": now.isoformat(), "error": None}},
+                               (now + timedelta(hours=1)).isoformat())
+    db.delete_saved_search(search["id"])
+
+    app = db.create_application(user["id"], jobs[0]["id"], resume_id=resume["id"])
+    other = db.create_application(user["id"], jobs[1]["id"])
+    db.update_application_status(app["id"], "applied", "sent")
+    _, cursor = db.get_applications(user["id"], limit=1)
+    db.get_applications(user["id"], limit=1, cursor=cursor)
+    db.get_applications(user["id"], status="applied")
+    db.get_application_status_counts(user["id"])
+    db.get_application(app["id"])
+    db.get_application_events(app["id"])
+    db.save_document(app["id"], "cover_letter", "Dear Acme")
+    db.find_position_document(other["id"], "cover_letter", since=(now - timedelta(days=1)).isoformat())
+
+    run = db.enqueue_agent_run("search_jobs", {"keywords": "python"})
+    db.get_agent_run(run["id"])
+    claimed = db.claim_agent_run("w1", exclude_actions=["tailor_application"])
+    db.heartbeat_agent_run(claimed["id"])
+    db.requeue_agent_run(claimed["id"])
+    claimed = db.claim_agent_run("w1")
+    db.finish_agent_run(claimed["id"], result={"ok": True})
+    db.recover_stale_agent_runs(now.isoformat(), max_attempts=3)
+
+    db.save_match(user["id"], jobs[0]["id"], 0.8, ["fit"], ["Python"], ["Go"], lexical_score=0.5)
+    db.put_cached_matches(user["id"], "r1", "v1", {"j1": {"score": 0.8}})
+    db.get_cached_matches("r1", ["j1", "j2"], "v1")
+    db.put_cached_search("k1", "remoteok", [{"title": "x"}], now.timestamp())
+    db.get_cached_search("k1")
+    db.prune_cached_searches(now.timestamp() - 3600)
+    db.increment_quota_usage("adzuna", "2026-10")
+    db.get_quota_usage("adzuna", "2026-10")
+
+
+@pytest.fixture
+def exercised(db, monkeypatch):
+    """Run ``exercise`` with tracing on; returns (statements run, helpers called)."""
+    statements: list[str] = []
+    connect = database.ConnectionPool._connect
+
+    def traced_connect(pool):
+        conn = connect(pool)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(database.ConnectionPool, "_connect", traced_connect)
+    path = database.get_pool().path
+    database.close_pool()
+    database._pool = database.ConnectionPool(path)
+
+    # Record which helpers were called, however they were reached
+    called: set[str] = set()
+    for name, fn in inspect.getmembers(database, inspect.isfunction):
+        if fn.__module__ != database.__name__ or name.startswith("_") or name in NOT_QUERIES:
+            continue
+
+        def wrapper(*args, __name=name, __fn=fn, **kwargs):
+            called.add(__name)
+            return __fn(*args, **kwargs)
+
+        monkeypatch.setattr(database, name, wrapper)
+    exercise(database)
+    monkeypatch.undo()
+    return statements, called
+
+
+def test_every_query_helper_is_exercised(exercised):
+    public = {
+        name for name, fn in inspect.getmembers(database, inspect.isfunction)
+        if fn.__module__ == database.__name__ and not name.startswith("_") and name not in NOT_QUERIES
+    }
+    _, called = exercised
+
+    assert sorted(public - called) == [], "add these helpers to exercise()"
+
+
+def test_no_query_scans_a_whole_table(exercised):
+    statements, _ = exercised
+    failures = []
+    with database._conn() as conn:
+        conn.set_trace_callback(None)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        for sql in dict.fromkeys(s.strip() for s in statements):
+            if not re.match(r"(SELECT|WITH|UPDATE|DELETE|INSERT|REPLACE)\b", sql, re.IGNORECASE):
+                continue
+            for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"):
+                table = _scanned_table(row[3], sql, tables)
+                if table is None or any(table == t and re.search(p, sql) for t, p, _ in ALLOWED_SCANS):
+                    continue
+                failures.append(f"{row[3]}\n    in: {sql[:300]}")
+
+    assert not failures, "\n".join(failures)
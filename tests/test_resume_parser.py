@@ -0,0 +1,36 @@
+import signal
+import time
+
+import pytest
+
+from mcp_server.tools import resume_parser
+
+
+def _ignore_alarm_and_hang(file_path, max_pages, timeout):
+    # A parse stuck where the in-worker alarm never interrupts it
+    signal.signal(signal.SIGALRM, signal.SIG_IGN)
+    time.sleep(60)
+
+
+@pytest.fixture
+def parse_pool():
+    resume_parser.shutdown_parse_pool()
+    yield
+    resume_parser.shutdown_parse_pool()
+
+
+@pytest.mark.asyncio
+async def test_stuck_worker_is_replaced(parse_pool, tmp_path, monkeypatch):
+    resume = tmp_path / "cv.txt"
+    resume.write_text("Experience\nPython developer")
+    monkeypatch.setattr(resume_parser, "_GRACE_S", 0.5)
+    monkeypatch.setattr(resume_parser, "_parse_in_worker", _ignore_alarm_and_hang)
+    pool = resume_parser._get_pool()
+
+    with pytest.raises(resume_parser.ResumeParseError, match="longer than"):
+        await resume_parser.parse_resume_async(str(resume), timeout=0.2)
+
+    assert resume_parser._pool is not pool
+    monkeypatch.undo()
+    parsed = await resume_parser.parse_resume_async(str(resume))
+    assert parsed["sections"]["experience"] == ["Python developer"]
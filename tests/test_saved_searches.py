@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from backend.routers import saved_searches
+from backend.scheduler import ingest_scheduler
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(saved_searches.router)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_missing_search_is_404(client):
+    assert (await client.post("/api/saved-searches/nope/refresh")).status_code == 404
+    assert (await client.delete("/api/saved-searches/nope")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_a_search_already_running(client, db, monkeypatch):
+    user = db.get_or_create_default_user()
+    search = db.create_saved_search(user["id"], "python")
+    release = asyncio.Event()
+    ingests = 0
+
+    async def ingest_new_jobs(**kwargs):
+        nonlocal ingests
+        ingests += 1
+        await release.wait()
+        return {"jobs": [], "sources": {}}
+
+    monkeypatch.setattr("backend.scheduler.ingest_new_jobs", ingest_new_jobs)
+    first = asyncio.create_task(client.post(f"/api/saved-searches/{search['id']}/refresh"))
+    while not ingest_scheduler.is_running(search["id"]):
+        await asyncio.sleep(0.01)
+
+    second = await client.post(f"/api/saved-searches/{search['id']}/refresh")
+    release.set()
+
+    assert second.status_code == 409
+    assert (await first).status_code == 200
+    assert ingests == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body", [
+    {"keywords": "python", "source": "linkedin"},
+    {"keywords": "python", "interval_s": 0},
+    {"keywords": "python", "interval_s": -3600},
+])
+async def test_invalid_saved_search_is_a_422(client, db, body):
+    assert (await client.post("/api/saved-searches", json=body)).status_code == 422
+    assert db.get_saved_searches(db.get_or_create_default_user()["id"]) == []
+
+
+@pytest.mark.asyncio
+async def test_saved_search_defaults_to_all_sources(client):
+    response = await client.post("/api/saved-searches", json={"keywords": "python"})
+
+    assert response.status_code == 200
+    assert response.json()["source"] == "all"
@@ -0,0 +1,136 @@
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import Field
+
+from agents import llm
+from agents.llm import FakeChatModel, LLMGateway
+from agents.scoring import score_jobs
+
+JOBS = [{"id": f"job-{i}", "title": "Engineer", "company": "Acme", "description": "Python"} for i in range(3)]
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(llm, "LLM_RETRY_BACKOFF", 0.0)
+
+
+class ProseModel(FakeChatModel):
+    """Answers without the JSON the scorer needs."""
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="Looks like a good fit!"))])
+
+
+@pytest.mark.asyncio
+async def test_overloads_are_retried_by_the_gateway_only():
+    model = FakeChatModel(latency=0, failure_rate=1)
+    gateway = LLMGateway(model=model, max_retries=3)
+
+    result = await score_jobs(gateway.client("scoring"), "Python", JOBS, batch_size=3, max_retries=2)
+
+    assert model.calls == 4
+    assert result["stats"]["failed_batches"] == 1
+    assert result["stats"]["retries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unusable_output_is_asked_again():
+    model = ProseModel(latency=0)
+    gateway = LLMGateway(model=model, max_retries=3)
+
+    result = await score_jobs(gateway.client("scoring"), "Python", JOBS, batch_size=3, max_retries=2)
+
+    assert model.calls == 3
+    assert result["stats"]["retries"] == 2
+    assert result["stats"]["errors"][0].startswith("ScoringError")
+
+
+class CountingModel(FakeChatModel):
+    in_flight: int = 0
+    peak: int = 0
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            return await super()._agenerate(messages, stop, run_manager, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_gateway_limit_bounds_batches_in_flight():
+    model = CountingModel(latency=0.02)
+    gateway = LLMGateway(model=model, limits={"scoring": 2})
+    jobs = [{**JOBS[0], "id": f"job-{i}"} for i in range(12)]
+
+    result = await score_jobs(gateway.client("scoring"), "Python", jobs, batch_size=2)
+
+    assert len(result["matches"]) == 12
+    assert model.calls == 6
+    assert model.peak == 2
+
+
+def _jobs(n: int) -> list[dict]:
+    return [{**JOBS[0], "id": f"job-{i}", "title": f"Engineer {i}"} for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_all_jobs_are_scored_and_merged_by_id():
+    # The fake model answers each batch in reverse order
+    model = FakeChatModel(latency=0)
+    jobs = _jobs(20)
+    seen = []
+
+    async def on_match(job, match):
+        seen.append((job["id"], match["job_id"]))
+
+    result = await score_jobs(LLMGateway(model=model).client("scoring"), "Python", jobs, batch_size=8,
+                              on_match=on_match)
+
+    assert result["stats"]["batches"] == model.calls == 3
+    assert sorted(result["matches"]) == sorted(job["id"] for job in jobs)
+    assert all(job_id == match["job_id"] for job_id, match in result["matches"].items())
+    assert sorted(seen) == sorted((job["id"], job["id"]) for job in jobs)
+
+
+@pytest.mark.asyncio
+async def test_batches_are_scored_concurrently():
+    model = FakeChatModel(latency=0.2)
+    gateway = LLMGateway(model=model, limits={"scoring": 4})
+
+    start = time.perf_counter()
+    result = await score_jobs(gateway.client("scoring"), "Python", _jobs(16), batch_size=4)
+
+    assert len(result["matches"]) == 16
+    # Four batches one after another would take 0.8s
+    assert time.perf_counter() - start < 0.5
+
+
+class FlakyBatchModel(FakeChatModel):
+    """Answers the batch holding job-0 in prose the first time it is asked."""
+
+    prompts: list[str] = Field(default_factory=list)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.prompts.append(messages[-1].content)
+        if "[job-0]" in messages[-1].content and sum("[job-0]" in p for p in self.prompts) == 1:
+            self.calls += 1
+            return ChatResult(generations=[ChatGeneration(message=AIMessage(content="Let me think..."))])
+        return await super()._agenerate(messages, stop, run_manager, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_only_the_failed_batch_is_retried():
+    model = FlakyBatchModel(latency=0)
+
+    result = await score_jobs(LLMGateway(model=model).client("scoring"), "Python", _jobs(12), batch_size=4)
+
+    assert len(result["matches"]) == 12
+    assert result["stats"]["retries"] == 1
+    assert model.calls == 4
+    assert sum("[job-4]" in p for p in model.prompts) == 1
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+import pytest
+
+from mcp_server.tools import database, search
+from mcp_server.tools.quota import QuotaExhausted, RequestScheduler, SourceLimits
+from mcp_server.tools.search_cache import SearchCache
+
+
+@pytest.fixture
+def query_threads(db, monkeypatch):
+    """Names of the threads each new pooled connection runs its queries on."""
+    threads = []
+    connect = database.ConnectionPool._connect
+
+    def traced_connect(pool):
+        conn = connect(pool)
+        conn.set_trace_callback(lambda sql: threads.append(threading.current_thread().name))
+        return conn
+
+    monkeypatch.setattr(database.ConnectionPool, "_connect", traced_connect)
+    path = database.get_pool().path
+    database.close_pool()
+    database._pool = database.ConnectionPool(path)
+    return threads
+
+
+@pytest.mark.asyncio
+async def test_persisted_entries_load_off_the_event_loop(query_threads):
+    async def loader():
+        return [{"title": "Python Developer"}]
+
+    assert (await SearchCache().fetch("remoteok", {"tags": "python"}, loader))[1] == "miss"
+    # A new cache has nothing in memory, so the hit comes from SQLite
+    jobs, status = await SearchCache().fetch("remoteok", {"tags": "python"}, loader)
+
+    assert (jobs, status) == ([{"title": "Python Developer"}], "hit")
+    assert query_threads and threading.main_thread().name not in query_threads
+
+
+@pytest.mark.asyncio
+async def test_quota_is_counted_off_the_event_loop(query_threads):
+    scheduler = RequestScheduler({"adzuna": SourceLimits(rate=1000, burst=10, monthly_budget=2)})
+
+    await scheduler.acquire("adzuna")
+    await scheduler.acquire("adzuna")
+    with pytest.raises(QuotaExhausted):
+        await scheduler.acquire("adzuna")
+
+    assert await scheduler.remaining("adzuna") == 0
+    assert query_threads and threading.main_thread().name not in query_threads
+
+
+@pytest.mark.asyncio
+async def test_budget_spent_while_waiting_keeps_the_token(db, monkeypatch):
+    scheduler = RequestScheduler({"adzuna": SourceLimits(rate=0.001, burst=1, monthly_budget=10)})
+    checks = 0
+
+    async def check_budget(source, priority):
+        # Passes on entry, fails on the re-check after the token is taken
+        nonlocal checks
+        checks += 1
+        if checks == 2:
+            raise QuotaExhausted("adzuna monthly budget exhausted")
+
+    monkeypatch.setattr(scheduler, "_check_budget", check_budget)
+    with pytest.raises(QuotaExhausted):
+        await scheduler.acquire("adzuna")
+
+    # With the token back the next call is admitted at once, not in 1000s
+    await asyncio.wait_for(scheduler.acquire("adzuna"), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_streamed_search_falls_back_to_cache_when_out_of_budget(db, monkeypatch):
+    cache = SearchCache(persist=False)
+    monkeypatch.setattr(search, "search_cache", cache)
+    query = search._query("remoteok", "python", "", 100)
+    await cache.store("remoteok", query, [{"source_id": "1"}, {"source_id": "2"}])
+
+    async def pages():
+        yield [{"source_id": "1"}]
+        raise QuotaExhausted("remoteok monthly budget exhausted")
+
+    monkeypatch.setattr(search, "_pages", lambda *args: pages())
+    events = [e async for e in search.stream_all_sources("python", source="remoteok", max_results=100)]
+
+    assert [e["jobs"] for e in events if e["type"] == "page"] == [[{"source_id": "1"}], [{"source_id": "2"}]]
+    done = events[-1]
+    assert (done["cache"], done["count"]) == ("fallback", 2)
+    assert "budget exhausted" in done["error"]
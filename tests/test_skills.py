@@ -0,0 +1,52 @@
+import copy
+
+import pytest
+
+from mcp_server.tools import database, skills
+
+
+@pytest.fixture
+def dictionary(monkeypatch):
+    """A copy of the skill dictionary that the extractors and init_db_sync read."""
+    edited = copy.deepcopy(skills.load_dictionary())
+    monkeypatch.setattr(skills, "load_dictionary", lambda: edited)
+    monkeypatch.setattr(database, "load_dictionary", lambda: edited)
+    skills._matcher.cache_clear()
+    yield edited
+    skills._matcher.cache_clear()
+
+
+def _job_skills(db, job_id):
+    return next(ids.split(",") for jid, ids in db.get_job_skill_sets()[2] if jid == job_id)
+
+
+def test_dictionary_version_change_retags_stored_data(db, dictionary):
+    job = db.save_job({"source": "remoteok", "source_id": "1", "title": "Python Developer", "company": "Acme",
+                       "description": "Python and Frobnicate on AWS."})
+    assert "frobnicate" not in _job_skills(db, job["id"])
+    index_version = db.get_index_version("job_skills")
+
+    dictionary["skills"]["frobnicate"] = {"name": "Frobnicate", "aliases": ["frobnicate"]}
+    skills._matcher.cache_clear()
+    db.init_db_sync()
+    assert "frobnicate" not in _job_skills(db, job["id"])  # same version: nothing to do
+
+    dictionary["version"] += "-next"
+    db.init_db_sync()
+    assert "frobnicate" in _job_skills(db, job["id"])
+    assert db.get_index_version("job_skills") > index_version
+
+
+def test_index_version_only_moves_when_job_skills_change(db):
+    job = {"source": "remoteok", "source_id": "1", "title": "Python Developer", "company": "Acme",
+           "description": "Python and Django on AWS."}
+    db.save_jobs_bulk([job])
+    index_version = db.get_index_version("job_skills")
+
+    db.save_jobs_bulk([job])
+    assert db.get_index_version("job_skills") == index_version
+
+    saved = db.save_jobs_bulk([{**job, "description": "Python and Kubernetes on AWS."}])
+    assert db.get_index_version("job_skills") > index_version
+    assert "django" not in _job_skills(db, saved[0]["id"])
+    assert "kubernetes" in _job_skills(db, saved[0]["id"])